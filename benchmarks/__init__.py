@@ -0,0 +1,2 @@
+# benchmarks/__init__.py
+"""로컬 목(mock) 서버 기반 성능 측정 스크립트 모음"""
@@ -0,0 +1,62 @@
+# bench_bulk_formats.py - /trade-data 응답 형식별 직렬화 시간·크기 벤치마크
+# 합성 10k / 100k / 500k 행 거래 데이터를 대상으로
+#   ① JSON (json_response.frame_to_json, 파생 문자열 필드 포함 — 기본 응답)
+#   ② Arrow IPC 스트림, ③ Parquet(PARQUET_COMPRESSION), ④ CSV (bulk_response)
+# 의 직렬화 시간과 응답 크기를 비교합니다. Arrow/Parquet은 pyarrow가 설치된 경우에만 측정합니다.
+#
+# 실행: python -m benchmarks.bench_bulk_formats --sizes 10000 100000 500000
+from __future__ import annotations
+
+import argparse
+import time
+from typing import Callable, Dict
+
+import pandas as pd
+
+from src.bulk_response import HAVE_PYARROW, frame_to_arrow, frame_to_parquet, iter_csv
+from src.json_response import frame_to_json
+from src.rtms_parser import columns_to_frame, parse_page
+from src.trade_schema import add_derived_columns
+
+from .mock_rtms_server import build_items, render_page
+
+
+def bench(fn: Callable[[pd.DataFrame], object], df: pd.DataFrame, repeat: int):
+    best, size = float("inf"), 0
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        body = fn(df)
+        best = min(best, time.perf_counter() - t0)
+        size = len(body)
+    return best, size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="/trade-data 응답 형식별 직렬화 벤치마크")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000, 500000], help="응답 행 수")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    encoders: Dict[str, Callable[[pd.DataFrame], object]] = {
+        "json": lambda df: frame_to_json(add_derived_columns(df)),
+        "csv": lambda df: b"".join(iter_csv(df)),
+    }
+    if HAVE_PYARROW:
+        encoders["arrow"] = frame_to_arrow
+        encoders["parquet"] = frame_to_parquet
+    else:
+        print("pyarrow 없음: arrow/parquet 측정 생략")
+
+    print(f"{'rows':>7}{'format':>9}{'ms':>9}{'MiB':>8}{'time vs json':>14}{'size vs json':>14}")
+    for n in args.sizes:
+        content = render_page(build_items("11680", "202403", n), 1, n, n)
+        df = columns_to_frame(parse_page(content).columns)
+        json_time, json_size = bench(encoders["json"], df, args.repeat)
+        for name, fn in encoders.items():
+            elapsed, size = (json_time, json_size) if name == "json" else bench(fn, df, args.repeat)
+            print(f"{n:>7}{name:>9}{elapsed * 1000:>9.1f}{size / 1024 / 1024:>8.2f}"
+                  f"{json_time / elapsed:>13.1f}x{json_size / size:>13.1f}x")
+
+
+if __name__ == "__main__":
+    main()
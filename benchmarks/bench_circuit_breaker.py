@@ -0,0 +1,117 @@
+# bench_circuit_breaker.py - 서킷 브레이커 / degraded mode 장애 시나리오
+# 목 서버로 업스트림 장애를 재현하여 다음 단계를 차례로 확인합니다.
+#   ① 정상: 최근 달 파티션을 캐시에 저장
+#   ② 장애(모든 요청 503): 첫 조회에서 실패율이 임계치를 넘어 회로가 열리고,
+#      이후 조회는 업스트림 요청 없이 즉시 실패하며 만료된 캐시로 응답(degraded)
+#   ③ 회복: 대기 시간이 지나면 반개방 상태의 시험 요청이 성공하여 회로가 닫힘
+# 각 단계의 소요 시간, 업스트림 요청 수, 회로 상태, 대체/실패한 달을 출력하고 기대와 다르면 실패로 종료합니다.
+#
+# 실행: python -m benchmarks.bench_circuit_breaker --latency 0.2 --open-seconds 2
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+from dateutil.relativedelta import relativedelta
+
+from .mock_rtms_server import start_mock_server
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="서킷 브레이커 장애 시나리오")
+    parser.add_argument("--total-count", type=int, default=300, help="한 달의 거래 건수")
+    parser.add_argument("--latency", type=float, default=0.2, help="목 서버 요청당 지연(초)")
+    parser.add_argument("--open-seconds", type=float, default=2.0, help="회로 개방 유지 시간(초)")
+    parser.add_argument("--outage-calls", type=int, default=3, help="장애 중 반복 조회 횟수")
+    args = parser.parse_args()
+
+    server = start_mock_server(total_count=args.total_count, latency=args.latency)
+    tmp = tempfile.mkdtemp(prefix="rtms-cb-")
+    # config 모듈이 로드되기 전에 엔드포인트, (더미) API 키, 시나리오용 설정을 지정해야 합니다.
+    os.environ.update({
+        "RTMS_ENDPOINT": server.url,
+        "TRADE_CACHE_PATH": os.path.join(tmp, "trade_cache.sqlite3"),
+        "RTMS_QUOTA_STATE_PATH": os.path.join(tmp, "rtms_quota.json"),
+        "TRADE_CACHE_RECENT_TTL": "0",  # 최근 달은 저장 즉시 만료 → 매번 업스트림 조회 시도
+        "RTMS_HEDGE_ENABLED": "0",
+        "RTMS_RETRY_BASE_DELAY": "0.05",
+        "RTMS_CB_MIN_CALLS": "5",
+        "RTMS_CB_OPEN_SECONDS": str(args.open_seconds),
+    })
+    for key in ("RTMS_KEY", "OPENAI_API_KEY", "VWORLD_API_KEY"):
+        os.environ.setdefault(key, "benchmark-dummy")
+
+    from src.rtms_client import (  # noqa: E402 (환경 변수 설정 이후 임포트)
+        FAILED_MONTHS_ATTR,
+        STALE_MONTHS_ATTR,
+        fetch_rtms_range,
+        get_circuit_breaker,
+    )
+
+    # 이번 달과 지난 달(항상 만료 대상) + 마감된 달 하나. 캐시에 없는 지역 하나를 함께 조회합니다.
+    now = datetime.now()
+    start_ym = (now - relativedelta(months=2)).strftime("%Y%m")
+    end_ym = now.strftime("%Y%m")
+    cached_lawds = ["11110", "11140", "11170", "11200"]
+    cold_lawd = "11680"
+    breaker = get_circuit_breaker()
+    failures = []
+
+    def run(phase: str, lawds: list[str]) -> dict:
+        before = server.request_count
+        t0 = time.perf_counter()
+        stale, failed, rows = [], [], 0
+        for lawd in lawds:
+            df = fetch_rtms_range(lawd, start_ym, end_ym)
+            rows += len(df)
+            stale += [f"{lawd}:{ym}" for ym in df.attrs.get(STALE_MONTHS_ATTR, [])]
+            failed += [f"{lawd}:{ym}" for ym in df.attrs.get(FAILED_MONTHS_ATTR, [])]
+        result = {
+            "phase": phase, "ms": (time.perf_counter() - t0) * 1000, "upstream": server.request_count - before,
+            "rows": rows, "state": breaker.state.value, "stale": len(stale), "failed": len(failed),
+        }
+        print(f"{phase:<22}{result['ms']:>10.0f}{result['upstream']:>10}{rows:>8}"
+              f"{result['state']:>11}{result['stale']:>7}{result['failed']:>8}")
+        return result
+
+    def expect(condition: bool, message: str) -> None:
+        if not condition:
+            failures.append(message)
+
+    print(f"range={start_ym}~{end_ym}, lawd={len(cached_lawds)}+1(cold), latency={args.latency}s, "
+          f"open_seconds={args.open_seconds}s")
+    print(f"{'phase':<22}{'ms':>10}{'upstream':>10}{'rows':>8}{'circuit':>11}{'stale':>7}{'failed':>8}")
+
+    healthy = run("① healthy (warm)", cached_lawds)
+    expect(healthy["state"] == "closed" and healthy["stale"] == 0, "정상 단계에서 회로가 닫혀 있어야 합니다.")
+
+    server.error_rate = 1.0
+    tripping = run("② outage: trip", cached_lawds + [cold_lawd])
+    expect(tripping["state"] == "open", "장애 단계에서 회로가 열려야 합니다.")
+    expect(tripping["rows"] == healthy["rows"], "만료된 캐시로 정상 단계와 같은 행 수를 응답해야 합니다.")
+    expect(tripping["failed"] > 0, "캐시에 없는 지역의 달은 실패로 보고되어야 합니다.")
+    for i in range(args.outage_calls):
+        fast = run(f"② outage: open #{i + 1}", cached_lawds + [cold_lawd])
+        expect(fast["upstream"] == 0, "회로가 열린 동안에는 업스트림 요청이 없어야 합니다.")
+        expect(fast["ms"] < tripping["ms"], "회로가 열린 동안의 조회는 즉시 실패해야 합니다.")
+        expect(fast["rows"] == healthy["rows"], "회로가 열린 동안에도 만료된 캐시로 응답해야 합니다.")
+
+    server.error_rate = 0.0
+    time.sleep(args.open_seconds)
+    recovered = run("③ recovery", cached_lawds + [cold_lawd])
+    expect(recovered["state"] == "closed", "시험 요청 성공 후 회로가 닫혀야 합니다.")
+    expect(recovered["failed"] == 0, "회복 후에는 실패한 달이 없어야 합니다.")
+
+    server.shutdown()
+    if failures:
+        print("\nFAILED:\n  " + "\n  ".join(failures))
+        sys.exit(1)
+    print("\nOK")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+# bench_fetch_range.py - 기간 조회(fetch_rtms_range) 종합 벤치마크
+# 목 서버(합성 데이터 또는 녹화된 응답)를 상대로 실제 클라이언트 경로 전체를 실행하여
+#   ① cold: 캐시 없이 전 기간 업스트림 조회 (동기 / 비동기)
+#   ② warm: 모든 달이 캐시에 있는 상태의 조회
+#   ③ widen: 조회 기간을 한 달 넓혔을 때의 추가 조회
+#   ④ multi: 여러 지역 × 기간 조회
+#   ⑤ first month: 점진적 조회(iter_rtms_range)에서 첫 달을 받기까지의 시간 (cold)
+# 의 소요 시간, 결과 행 수, 업스트림 요청 수, 전송 바이트를 표로 출력합니다.
+# 동시성·연결 풀·파서 변경 전후를 같은 조건에서 비교하기 위한 도구입니다.
+#
+# 실행: python -m benchmarks.bench_fetch_range --months 24 --latency 0.05 --count-spread 0.5
+#       python -m benchmarks.bench_fetch_range --fixtures benchmarks/fixtures --lawd 11680 --start 202401 --end 202406
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import tempfile
+import time
+from datetime import datetime
+from typing import Callable, Dict, List
+
+from dateutil.relativedelta import relativedelta
+
+from .mock_rtms_server import start_mock_server
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="fetch_rtms_range 종합 벤치마크")
+    parser.add_argument("--lawd", nargs="+", default=["11680"], help="조회할 법정동 코드 (첫 번째가 단일 지역 조회 대상)")
+    parser.add_argument("--months", type=int, default=24, help="조회 개월 수 (--start/--end가 없을 때)")
+    parser.add_argument("--start", default=None, help="조회 시작년월 (YYYYMM)")
+    parser.add_argument("--end", default=None, help="조회 종료년월 (YYYYMM)")
+    parser.add_argument("--total-count", type=int, default=1500, help="월별 거래 건수(합성 데이터)")
+    parser.add_argument("--count-spread", type=float, default=0.0, help="월별 거래 건수 편차 비율(0~1)")
+    parser.add_argument("--pad-bytes", type=int, default=0, help="item마다 덧붙일 바이트 수")
+    parser.add_argument("--latency", type=float, default=0.05, help="목 서버 요청당 지연(초)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="503 오류 응답 비율(0~1)")
+    parser.add_argument("--fixtures", default=None, help="녹화된 응답 디렉토리")
+    parser.add_argument("--repeat", type=int, default=3, help="시나리오별 반복 횟수")
+    parser.add_argument("--json", dest="json_out", default=None, help="결과를 JSON 파일로 저장")
+    args = parser.parse_args()
+
+    server = start_mock_server(total_count=args.total_count, latency=args.latency, error_rate=args.error_rate,
+                               count_spread=args.count_spread, pad_bytes=args.pad_bytes, fixture_dir=args.fixtures)
+    tmp = tempfile.mkdtemp(prefix="rtms-bench-")
+    # config 모듈이 로드되기 전에 엔드포인트, (더미) API 키, 임시 캐시/쿼터 파일을 지정해야 합니다.
+    os.environ.update({
+        "RTMS_ENDPOINT": server.url,
+        "TRADE_CACHE_PATH": os.path.join(tmp, "trade_cache.sqlite3"),
+        "RTMS_QUOTA_STATE_PATH": os.path.join(tmp, "rtms_quota.json"),
+    })
+    os.environ.setdefault("RTMS_RATE_PER_SEC", "1000")  # 벤치마크가 속도 제한에 묶이지 않도록
+    os.environ.setdefault("RTMS_BURST", "1000")
+    os.environ.setdefault("RTMS_DAILY_QUOTA", "1000000")
+    for key in ("RTMS_KEY", "OPENAI_API_KEY", "VWORLD_API_KEY"):
+        os.environ.setdefault(key, "benchmark-dummy")
+
+    from src import rtms_client  # noqa: E402 (환경 변수 설정 이후 임포트)
+    from src.trade_cache import get_trade_cache
+
+    end = args.end or (datetime.now() - relativedelta(months=2)).strftime("%Y%m")  # 마감된 달만 사용(캐시 만료 없음)
+    start = args.start or (datetime.strptime(end, "%Y%m") - relativedelta(months=args.months - 1)).strftime("%Y%m")
+    widened = (datetime.strptime(start, "%Y%m") - relativedelta(months=1)).strftime("%Y%m")
+    lawd_cd = args.lawd[0]
+
+    def clear_cache() -> None:
+        conn = get_trade_cache()._conn()
+        with conn:
+            conn.execute("DELETE FROM trades")
+            conn.execute("DELETE FROM partitions")
+
+    def cold_sync() -> int:
+        return len(rtms_client.fetch_rtms_range(lawd_cd, start, end, use_cache=False))
+
+    def cold_async() -> int:
+        return len(asyncio.run(rtms_client.fetch_rtms_range_async(lawd_cd, start, end, use_cache=False)))
+
+    def warm() -> int:
+        return len(rtms_client.fetch_rtms_range(lawd_cd, start, end))
+
+    def widen() -> int:
+        return len(rtms_client.fetch_rtms_range(lawd_cd, widened, end))
+
+    pending = []  # 첫 달만 받은 점진적 조회. 정리(close)는 측정 구간 밖에서 합니다.
+
+    def first_month() -> int:
+        months = rtms_client.iter_rtms_range(lawd_cd, start, end, use_cache=False)
+        pending.append(months)
+        _, df, _ = next(months)
+        return len(df) if df is not None else 0
+
+    def close_pending() -> None:
+        while pending:
+            pending.pop().close()  # 남은 달의 조회는 취소
+
+    def multi() -> int:
+        return len(rtms_client.fetch_rtms_multi(args.lawd, start, end, use_cache=False))
+
+    # (이름, 함수, 매 반복 전 준비 작업)
+    scenarios: List[tuple[str, Callable[[], int], Callable[[], None]]] = [
+        ("cold (sync)", cold_sync, lambda: None),
+        ("cold (async)", cold_async, lambda: None),
+        ("warm cache", warm, lambda: (clear_cache(), warm())),
+        ("widen by 1 month", widen, lambda: (clear_cache(), warm())),
+        (f"multi x{len(args.lawd)}", multi, lambda: None),
+        ("first month (iter)", first_month, lambda: None),
+    ]
+
+    print(f"lawd={','.join(args.lawd)}, range={start}~{end}, latency={args.latency}s, "
+          f"error_rate={args.error_rate}, source={'fixtures' if args.fixtures else 'synthetic'}")
+    print(f"{'scenario':<20}{'rows':>9}{'median ms':>11}{'best ms':>10}{'upstream':>10}{'KB/call':>9}")
+    results: Dict[str, Dict[str, float]] = {}
+    for name, fn, prepare in scenarios:
+        times, n_rows, requests, sent = [], 0, 0, 0
+        for _ in range(args.repeat):
+            prepare()
+            before_req, before_bytes = server.request_count, server.bytes_sent
+            t0 = time.perf_counter()
+            n_rows = fn()
+            times.append(time.perf_counter() - t0)
+            close_pending()
+            requests, sent = server.request_count - before_req, server.bytes_sent - before_bytes
+        kb_per_call = sent / requests / 1024 if requests else 0.0
+        results[name] = {"rows": n_rows, "median_ms": statistics.median(times) * 1000,
+                         "best_ms": min(times) * 1000, "upstream": requests, "kb_per_call": kb_per_call}
+        print(f"{name:<20}{n_rows:>9}{results[name]['median_ms']:>11.1f}{results[name]['best_ms']:>10.1f}"
+              f"{requests:>10}{kb_per_call:>9.1f}")
+
+    if args.json_out:
+        with open(args.json_out, "w", encoding="utf-8") as f:
+            json.dump({"args": vars(args), "range": [start, end], "results": results}, f, ensure_ascii=False, indent=2)
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
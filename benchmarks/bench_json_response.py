@@ -0,0 +1,73 @@
+# bench_json_response.py - 데이터프레임 JSON 응답 직렬화 벤치마크
+# 합성 1k / 10k / 50k 행 거래 데이터(/trade-data 응답과 같은 파생 컬럼 포함)를 대상으로
+#   ① 기존 방식(to_records → jsonable_encoder → json.dumps, FastAPI 기본 JSONResponse와 같은 경로)
+#   ② json_response.frame_to_json(DataFrame.to_json, 컬럼 단위 C 구현)
+# 의 직렬화 시간과 응답 크기를 비교하고, 두 방식의 JSON이 같은 값인지 확인합니다.
+#
+# 실행: python -m benchmarks.bench_json_response --sizes 1000 10000 50000
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from typing import Callable, List
+
+import numpy as np
+import pandas as pd
+from fastapi.encoders import jsonable_encoder
+
+from src.json_response import frame_to_json
+from src.rtms_parser import columns_to_frame, parse_page
+from src.trade_schema import add_derived_columns
+
+from .mock_rtms_server import build_items, render_page
+
+
+def to_records(df: pd.DataFrame) -> List[dict]:
+    """
+    변경 전 응답의 레코드 리스트 변환입니다.
+    pd.NA/NaN은 None으로, float32 면적은 원래 자릿수(소수 4자리)로 되돌립니다.
+    """
+    out = df.copy()
+    for col in out.columns:
+        if out[col].dtype == np.float32:
+            out[col] = out[col].astype(np.float64).round(4)
+    out = out.astype(object).where(out.notna(), None)
+    return out.to_dict(orient="records")
+
+
+def legacy_json(df: pd.DataFrame) -> bytes:
+    """변경 전 /trade-data 응답의 직렬화 경로를 그대로 재현합니다."""
+    content = jsonable_encoder(to_records(df))
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode("utf-8")
+
+
+def bench(fn: Callable[[pd.DataFrame], bytes], df: pd.DataFrame, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn(df)
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="데이터프레임 JSON 응답 직렬화 벤치마크")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 50000], help="응답 행 수")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'rows':>7}{'MiB':>7}{'legacy (ms)':>13}{'to_json (ms)':>14}{'speedup':>9}")
+    for n in args.sizes:
+        content = render_page(build_items("11680", "202403", n), 1, n, n)
+        df = add_derived_columns(columns_to_frame(parse_page(content).columns))
+        body = frame_to_json(df)
+        # 두 방식이 같은 JSON 값을 내는지 확인
+        assert json.loads(legacy_json(df)) == json.loads(body), "JSON mismatch"
+        legacy = bench(legacy_json, df, args.repeat)
+        fast = bench(frame_to_json, df, args.repeat)
+        print(f"{n:>7}{len(body) / 1024 / 1024:>7.1f}{legacy * 1000:>13.1f}{fast * 1000:>14.1f}{legacy / fast:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+# bench_pagination.py - fetch_rtms 페이지 병렬 조회 벤치마크
+# 여러 페이지로 나뉘는 달을 목 서버로 재현하여,
+#   ① 기존 방식(1페이지만 조회 → 데이터 누락)
+#   ② 모든 페이지를 순차 조회
+#   ③ totalCount 기반 병렬 조회(fetch_rtms)
+# 의 결과 행 수와 소요 시간을 비교합니다.
+#
+# 실행: python -m benchmarks.bench_pagination --total-count 5500 --latency 0.15
+from __future__ import annotations
+
+import argparse
+import math
+import os
+import time
+
+from .mock_rtms_server import start_mock_server
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="fetch_rtms 페이지네이션 벤치마크")
+    parser.add_argument("--total-count", type=int, default=5500, help="한 달의 거래 건수")
+    parser.add_argument("--rows", type=int, default=1000, help="페이지당 행 수(numOfRows)")
+    parser.add_argument("--latency", type=float, default=0.15, help="목 서버 요청당 지연(초)")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    server = start_mock_server(total_count=args.total_count, latency=args.latency)
+    # config 모듈이 로드되기 전에 엔드포인트와 (더미) API 키를 지정해야 합니다.
+    os.environ["RTMS_ENDPOINT"] = server.url
+    for key in ("RTMS_KEY", "OPENAI_API_KEY", "VWORLD_API_KEY"):
+        os.environ.setdefault(key, "benchmark-dummy")
+
+    from src import rtms_client  # noqa: E402 (환경 변수 설정 이후 임포트)
+    from src.rtms_parser import merge_columns
+
+    lawd_cd, deal_ymd = "11680", "202403"
+    pages = math.ceil(args.total_count / args.rows)
+
+    def single_page() -> int:
+        columns = rtms_client._request_page(lawd_cd, deal_ymd, args.rows, 1).columns
+        return len(columns["aptNm"])
+
+    def sequential() -> int:
+        columns, total, _ = rtms_client._request_page(lawd_cd, deal_ymd, args.rows, 1)
+        for p in range(2, math.ceil(total / args.rows) + 1):
+            merge_columns(columns, rtms_client._request_page(lawd_cd, deal_ymd, args.rows, p).columns)
+        return len(columns["aptNm"])
+
+    def parallel() -> int:
+        return len(rtms_client.fetch_rtms(lawd_cd, deal_ymd, rows=args.rows))
+
+    print(f"totalCount={args.total_count}, numOfRows={args.rows}, pages={pages}, latency={args.latency}s")
+    print(f"{'mode':<22}{'rows':>8}{'best (ms)':>12}")
+    for name, fn in [("single page (기존)", single_page),
+                     ("sequential pages", sequential),
+                     ("parallel (fetch_rtms)", parallel)]:
+        best, n_rows = float("inf"), 0
+        for _ in range(args.repeat):
+            t0 = time.perf_counter()
+            n_rows = fn()
+            best = min(best, time.perf_counter() - t0)
+        print(f"{name:<22}{n_rows:>8}{best * 1000:>12.1f}")
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+# bench_request_body.py - POST 요청 본문 → 데이터프레임 변환 벤치마크
+# 합성 10k / 50k 행 거래 데이터를 /forecast 요청 본문으로 만들어
+#   ① 기존 방식(json.loads → pydantic List[Dict] 행별 검증 → pd.DataFrame(list[dict]))
+#   ② request_body.parse_trade_body: 행 배열 JSON / 컬럼 배열 JSON / Arrow IPC 본문
+# 의 변환 시간과 본문 크기를 비교하고, 결과 데이터프레임이 같은지 확인합니다.
+#
+# 실행: python -m benchmarks.bench_request_body --sizes 10000 50000
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from typing import Callable, Dict, List, Optional
+
+import pandas as pd
+from pydantic import BaseModel
+
+from src.bulk_response import HAVE_PYARROW, frame_to_arrow
+from src.json_response import frame_to_json
+from src.request_body import ARROW_MEDIA_TYPE, parse_trade_body
+from src.rtms_parser import columns_to_frame, parse_page
+from src.trade_schema import add_derived_columns
+
+from .mock_rtms_server import build_items, render_page
+
+
+class LegacyForecastRequest(BaseModel):
+    """변경 전 ForecastRequest (trade_data를 행마다 검증)"""
+    trade_data: Optional[List[Dict]] = None
+    result_id: Optional[str] = None
+    periods: Optional[int] = 12
+
+
+class ForecastParams(BaseModel):
+    result_id: Optional[str] = None
+    periods: Optional[int] = 12
+
+
+def legacy_parse(body: bytes) -> pd.DataFrame:
+    request = LegacyForecastRequest.model_validate(json.loads(body))
+    return pd.DataFrame(request.trade_data)
+
+
+def bench(fn: Callable[[], pd.DataFrame], repeat: int):
+    best, out = float("inf"), None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        out = fn()
+        best = min(best, time.perf_counter() - t0)
+    return best, out
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="POST 요청 본문 변환 벤치마크")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 50000], help="요청 행 수")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'rows':>7}{'body':>10}{'MiB':>7}{'ms':>9}{'speedup':>9}")
+    for n in args.sizes:
+        content = render_page(build_items("11680", "202403", n), 1, n, n)
+        df = columns_to_frame(parse_page(content).columns)
+        records = frame_to_json(add_derived_columns(df))
+        rows = json.loads(records)
+        columns = {c: [r[c] for r in rows] for c in rows[0]}
+        bodies = {
+            "records": (b'{"periods":12,"trade_data":' + records + b"}", "application/json"),
+            "columnar": (json.dumps({"periods": 12, "trade_data": columns}, ensure_ascii=False).encode("utf-8"),
+                         "application/json"),
+        }
+        if HAVE_PYARROW:
+            bodies["arrow"] = (bytes(frame_to_arrow(df)), ARROW_MEDIA_TYPE)
+
+        legacy, expected = bench(lambda: legacy_parse(bodies["records"][0]), args.repeat)
+        print(f"{n:>7}{'legacy':>10}{len(bodies['records'][0]) / 1024 / 1024:>7.1f}{legacy * 1000:>9.1f}{1:>8.1f}x")
+        for name, (body, content_type) in bodies.items():
+            query = {"periods": "12"} if content_type == ARROW_MEDIA_TYPE else {}
+            elapsed, (_, out) = bench(lambda: parse_trade_body(body, content_type, query, ForecastParams),
+                                      args.repeat)
+            # JSON 본문은 기존 방식과 같은 데이터프레임, Arrow 본문은 원래 표준 스키마 데이터프레임이어야 합니다.
+            if content_type == ARROW_MEDIA_TYPE:
+                pd.testing.assert_frame_equal(out, df)
+            else:
+                pd.testing.assert_frame_equal(out, expected)
+            print(f"{n:>7}{name:>10}{len(body) / 1024 / 1024:>7.1f}{elapsed * 1000:>9.1f}{legacy / elapsed:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+# bench_trade_stats.py - /trade-stats 집계 벤치마크
+# 합성 100만 행 거래 데이터(300개 단지, 5년)를 대상으로 group_by(month / apartment / area / floor)마다
+#   ① pandas groupby (mean / median / quantile을 지표별로 계산)
+#   ② trade_stats.trade_stats (그룹 번호·값 정렬 후 분위수 위치 보간)
+# 의 집계 시간을 비교하고, 두 결과가 같은지 확인합니다. 응답(JSON) 크기도 함께 출력합니다.
+#
+# 실행: python -m benchmarks.bench_trade_stats --rows 1000000
+from __future__ import annotations
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from src.json_response import frame_to_json
+from src.trade_schema import to_compact
+from src.trade_stats import (
+    AREA_EDGES,
+    AREA_LABELS,
+    DEFAULT_PERCENTILES,
+    FLOOR_EDGES,
+    FLOOR_LABELS,
+    GROUP_BY,
+    PYEONG_M2,
+    trade_stats,
+)
+
+
+def synthetic_trades(rows: int, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    area = rng.choice([39.6, 59.9, 84.9, 101.9, 114.8, 134.9, 164.3], rows) + rng.normal(0, 0.5, rows)
+    df = pd.DataFrame({
+        "아파트": rng.choice([f"합성아파트{i}" for i in range(300)], rows),
+        "거래금액(만원)": (area * rng.uniform(500, 3000, rows)).astype(np.int64),
+        "전용면적(m²)": area.round(2),
+        "층": rng.integers(-1, 45, rows),
+        "건축년도": rng.integers(1980, 2024, rows),
+        "거래일": pd.Timestamp("2020-01-01") + pd.to_timedelta(rng.integers(0, 5 * 365, rows), unit="D"),
+        "도로명": rng.choice([f"합성로{i}길" for i in range(100)], rows),
+    })
+    return to_compact(df)
+
+
+def pandas_stats(df: pd.DataFrame, group_by: str) -> pd.DataFrame:
+    """같은 표를 pandas groupby로 계산합니다. (비교 기준)"""
+    price = df["거래금액(만원)"].astype("float64")
+    area = df["전용면적(m²)"].astype("float64")
+    frame = pd.DataFrame({"price": price, "price_per_m2": price / area.where(area > 0)})
+    if group_by == "month":
+        key = df["거래일"].dt.strftime("%Y%m")
+    elif group_by == "apartment":
+        key = df["아파트"].astype(str)
+    elif group_by == "area":
+        key = pd.cut(area, [-np.inf, *AREA_EDGES, np.inf], labels=AREA_LABELS)
+    else:
+        key = pd.cut(df["층"].astype("float64"), [-np.inf, *FLOOR_EDGES, np.inf], labels=FLOOR_LABELS)
+    grouped = frame.groupby(key, observed=True)
+    out = {"count": grouped["price"].count()}
+    for name in ("price", "price_per_m2"):
+        out[f"{name}_mean"] = grouped[name].mean()
+        out[f"{name}_median"] = grouped[name].median()
+        for p in DEFAULT_PERCENTILES:
+            out[f"{name}_p{p:g}"] = grouped[name].quantile(p / 100)
+    result = pd.DataFrame(out)
+    for column in list(result.columns):
+        if column.startswith("price_per_m2_"):
+            result[column.replace("per_m2", "per_pyeong")] = result[column] * PYEONG_M2
+    return result.round(1)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="/trade-stats 집계 벤치마크")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    df = synthetic_trades(args.rows)
+    raw_mib = len(frame_to_json(df)) / 1024 / 1024
+    print(f"rows: {args.rows:,}  (원본 JSON {raw_mib:.0f} MiB)")
+    print(f"{'group_by':>10}{'groups':>8}{'pandas (ms)':>13}{'stats (ms)':>12}{'speedup':>9}{'JSON KiB':>10}")
+    for group_by in GROUP_BY:
+        timings = {}
+        for name, fn in (("pandas", pandas_stats), ("stats", trade_stats)):
+            best = float("inf")
+            for _ in range(args.repeat):
+                t0 = time.perf_counter()
+                out = fn(df, group_by)
+                best = min(best, time.perf_counter() - t0)
+            timings[name] = (best, out)
+        expected = timings["pandas"][1]
+        result = timings["stats"][1].set_index("group")
+        # 반올림 경계의 부동소수점 차이(0.1)만 허용합니다.
+        np.testing.assert_allclose(result.loc[expected.index.astype(str), expected.columns].to_numpy(np.float64),
+                                   expected.to_numpy(np.float64), atol=0.11)
+        print(f"{group_by:>10}{len(result):>8}{timings['pandas'][0] * 1000:>13.1f}{timings['stats'][0] * 1000:>12.1f}"
+              f"{timings['pandas'][0] / timings['stats'][0]:>8.1f}x{len(frame_to_json(timings['stats'][1])) / 1024:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
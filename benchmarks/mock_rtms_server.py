@@ -0,0 +1,259 @@
+# mock_rtms_server.py - RTMS API 로컬 목(mock) 서버
+# 실제 국토교통부 API와 동일한 XML 스키마로 합성 실거래 데이터를 응답합니다.
+# numOfRows / pageNo 파라미터에 맞춰 페이지를 나누어 주므로,
+# 여러 페이지로 나뉘는 달(month)의 조회 동작을 API 쿼터 소모 없이 재현할 수 있습니다.
+# 일정 비율의 503 오류나 느린 응답을 섞어 재시도/헤지 요청 동작도 확인할 수 있습니다.
+# 월별 건수 편차(--count-spread)와 item당 추가 바이트(--pad-bytes)로 페이지 수와 응답 크기를 조절하고,
+# record_fixtures.py로 녹화한 실제 응답(--fixtures)을 재생할 수도 있습니다.
+#
+# 단독 실행: python -m benchmarks.mock_rtms_server --port 8099 --total-count 2500
+from __future__ import annotations
+
+import argparse
+import random
+import threading
+import time
+import xml.etree.ElementTree as ET
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+from xml.sax.saxutils import escape
+
+# --- 1. 합성 데이터 생성 ---
+def build_items(lawd_cd: str, deal_ymd: str, count: int) -> List[Dict[str, str]]:
+    """
+    (법정동 코드, 년월)마다 항상 같은 결과가 나오도록 시드를 고정하여 합성 거래 item을 생성합니다.
+    """
+    rng = random.Random(f"{lawd_cd}-{deal_ymd}")
+    year, month = deal_ymd[:4], str(int(deal_ymd[4:]))
+    items = []
+    for i in range(count):
+        # 실제 응답의 item 필드 구성을 그대로 따릅니다. (파서 벤치마크가 실제와 같은 비용을 치르도록)
+        apt_no = rng.randint(1, 300)
+        road_no = rng.randint(1, 120)
+        items.append({
+            "aptDong": "",
+            "aptNm": f"목업아파트{apt_no}",
+            "aptSeq": f"{lawd_cd}-{apt_no}",
+            "bonbun": f"{rng.randint(1, 999):04d}",
+            "bubun": "0000",
+            "buildYear": str(rng.randint(1975, 2024)),
+            "buyerGbn": rng.choice(["개인", "법인"]),
+            "cdealDay": "",
+            "cdealType": "",
+            "dealAmount": f"{rng.randint(15000, 350000):,}",
+            "dealDay": str(rng.randint(1, 28)),
+            "dealMonth": month,
+            "dealYear": year,
+            "dealingGbn": rng.choice(["중개거래", "직거래"]),
+            "estateAgentSggNm": "서울 강남구",
+            "excluUseAr": f"{rng.uniform(20, 200):.2f}",
+            "floor": str(rng.randint(-1, 45)),
+            "jibun": str(rng.randint(1, 999)),
+            "landCd": "1",
+            "landLeaseholdGbn": "N",
+            "rgstDate": "",
+            "roadNm": f"목업로{road_no}길",
+            "roadNmBonbun": f"{road_no:05d}",
+            "roadNmBubun": "00000",
+            "roadNmCd": f"{4000000 + road_no}",
+            "roadNmSeq": "01",
+            "roadNmSggCd": lawd_cd,
+            "roadNmbCd": "0",
+            "sggCd": lawd_cd,
+            "slerGbn": rng.choice(["개인", "법인"]),
+            "umdCd": "10300",
+            "umdNm": "목업동",
+        })
+    return items
+
+
+def month_count(lawd_cd: str, deal_ymd: str, total_count: int, spread: float) -> int:
+    """
+    (법정동 코드, 년월)별 거래 건수. spread가 0보다 크면 total_count × (1 ± spread) 범위에서
+    키마다 고정된 값을 골라, 페이지 수가 달마다 다른 실제 분포를 흉내 냅니다.
+    """
+    if spread <= 0:
+        return total_count
+    rng = random.Random(f"count-{lawd_cd}-{deal_ymd}")
+    return max(0, round(total_count * rng.uniform(1 - spread, 1 + spread)))
+
+
+# --- 2. 녹화된 응답(fixture) ---
+def fixture_path(fixture_dir: str | Path, lawd_cd: str, deal_ymd: str) -> Path:
+    """녹화 파일 경로: {fixture_dir}/{법정동 코드}_{년월}.xml (한 달치 item 전체)"""
+    return Path(fixture_dir) / f"{lawd_cd}_{deal_ymd}.xml"
+
+
+def load_fixture(path: Path) -> List[Dict[str, str]]:
+    """녹화된 응답 XML에서 item 목록을 읽습니다. 재생 시 요청한 numOfRows에 맞게 다시 페이지를 나눕니다."""
+    root = ET.parse(path).getroot()
+    return [{child.tag: child.text or "" for child in item} for item in root.iter("item")]
+
+
+# --- 3. 응답 직렬화 ---
+def render_page(items: List[Dict[str, str]], page: int, rows: int, total_count: int, pad_bytes: int = 0) -> bytes:
+    """
+    item 리스트 중 요청한 페이지 구간만 실제 RTMS 응답 형식의 XML로 직렬화합니다.
+    pad_bytes가 0보다 크면 item마다 그 길이의 추가 필드를 붙여 응답 크기를 키웁니다.
+    """
+    chunk = items[(page - 1) * rows: page * rows]
+    padding = f"<padding>{'x' * pad_bytes}</padding>" if pad_bytes > 0 else ""
+    body = "".join(
+        "<item>" + "".join(f"<{k}>{escape(v)}</{k}>" for k, v in it.items()) + padding + "</item>"
+        for it in chunk
+    )
+    xml = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        "<response><header><resultCode>000</resultCode><resultMsg>OK</resultMsg></header>"
+        f"<body><items>{body}</items><numOfRows>{rows}</numOfRows>"
+        f"<pageNo>{page}</pageNo><totalCount>{total_count}</totalCount></body></response>"
+    )
+    return xml.encode("utf-8")
+
+
+# --- 4. HTTP 핸들러 ---
+class _RtmsHandler(BaseHTTPRequestHandler):
+    """RTMS 조회 파라미터(LAWD_CD, DEAL_YMD, numOfRows, pageNo)를 해석하여 XML을 응답합니다."""
+
+    protocol_version = "HTTP/1.1"  # keep-alive 지원
+
+    def do_GET(self) -> None:  # noqa: N802 (BaseHTTPRequestHandler 규약)
+        try:
+            self._serve()
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # 헤지 요청이 취소되는 등 클라이언트가 먼저 연결을 끊은 경우
+
+    def _serve(self) -> None:
+        server: MockRtmsServer = self.server  # type: ignore[assignment]
+        query = parse_qs(urlparse(self.path).query)
+        lawd_cd = query.get("LAWD_CD", ["11110"])[0]
+        deal_ymd = query.get("DEAL_YMD", ["202401"])[0]
+        rows = int(query.get("numOfRows", ["1000"])[0])
+        page = int(query.get("pageNo", ["1"])[0])
+
+        delay = server.latency
+        if server.slow_rate > 0 and server.rng.random() < server.slow_rate:
+            delay += server.slow_latency
+        if delay > 0:
+            time.sleep(delay)
+
+        if server.error_rate > 0 and server.rng.random() < server.error_rate:
+            server.count_request()
+            self.send_error(503, "Service Unavailable (injected)")
+            return
+
+        items = server.items_for(lawd_cd, deal_ymd)
+        payload = render_page(items, page, rows, len(items), server.pad_bytes)
+        server.count_request(len(payload))
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/xml; charset=utf-8")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format: str, *args) -> None:  # 요청마다 로그를 찍지 않음
+        pass
+
+
+class MockRtmsServer(ThreadingHTTPServer):
+    """
+    합성 RTMS 응답을 제공하는 스레드 기반 HTTP 서버.
+
+    Args:
+        address: (host, port) 튜플. port에 0을 주면 임의의 빈 포트를 사용합니다.
+        total_count (int): 한 달에 존재하는 거래 건수 (페이지 수 = total_count / numOfRows).
+        latency (float): 요청마다 추가할 응답 지연(초).
+        error_rate (float): HTTP 503으로 응답할 요청의 비율(0~1).
+        slow_rate (float): slow_latency만큼 추가로 지연시킬 요청의 비율(0~1).
+        slow_latency (float): 느린 요청에 추가할 지연(초).
+        count_spread (float): 월별 거래 건수 편차 비율(0~1). 0이면 모든 달이 total_count건.
+        pad_bytes (int): item마다 덧붙일 추가 바이트 수 (응답 크기 조절용).
+        fixture_dir (str | Path | None): 녹화된 응답 디렉토리. 녹화 파일이 있는 달은 그 내용을 재생합니다.
+        fixtures_only (bool): True이면 녹화 파일이 없는 달은 합성 데이터 대신 0건으로 응답합니다.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], total_count: int = 2500, latency: float = 0.0,
+                 error_rate: float = 0.0, slow_rate: float = 0.0, slow_latency: float = 2.0,
+                 count_spread: float = 0.0, pad_bytes: int = 0,
+                 fixture_dir: Optional[str | Path] = None, fixtures_only: bool = False):
+        super().__init__(address, _RtmsHandler)
+        self.total_count = total_count
+        self.latency = latency
+        self.error_rate = error_rate
+        self.slow_rate = slow_rate
+        self.slow_latency = slow_latency
+        self.count_spread = count_spread
+        self.pad_bytes = pad_bytes
+        self.fixture_dir = fixture_dir
+        self.fixtures_only = fixtures_only
+        self.rng = random.Random(0)
+        self.request_count = 0
+        self.bytes_sent = 0
+        self._items: Dict[Tuple[str, str], List[Dict[str, str]]] = {}
+        self._lock = threading.Lock()
+
+    def items_for(self, lawd_cd: str, deal_ymd: str) -> List[Dict[str, str]]:
+        key = (lawd_cd, deal_ymd)
+        with self._lock:
+            if key not in self._items:
+                self._items[key] = self._load_items(lawd_cd, deal_ymd)
+            return self._items[key]
+
+    def _load_items(self, lawd_cd: str, deal_ymd: str) -> List[Dict[str, str]]:
+        if self.fixture_dir is not None:
+            path = fixture_path(self.fixture_dir, lawd_cd, deal_ymd)
+            if path.exists():
+                return load_fixture(path)
+            if self.fixtures_only:
+                return []
+        return build_items(lawd_cd, deal_ymd, month_count(lawd_cd, deal_ymd, self.total_count, self.count_spread))
+
+    def count_request(self, payload_bytes: int = 0) -> None:
+        with self._lock:
+            self.request_count += 1
+            self.bytes_sent += payload_bytes
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/getRTMSDataSvcAptTradeDev"
+
+
+def start_mock_server(total_count: int = 2500, latency: float = 0.0,
+                      host: str = "127.0.0.1", port: int = 0, **options) -> MockRtmsServer:
+    """
+    목 서버를 백그라운드 데몬 스레드에서 실행하고 서버 객체를 반환합니다.
+    options로 error_rate, slow_rate, slow_latency, count_spread, pad_bytes, fixture_dir, fixtures_only를 지정할 수 있습니다.
+    종료 시에는 `server.shutdown()`을 호출합니다.
+    """
+    server = MockRtmsServer((host, port), total_count=total_count, latency=latency, **options)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="RTMS API 로컬 목 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8099)
+    parser.add_argument("--total-count", type=int, default=2500, help="월별 거래 건수")
+    parser.add_argument("--latency", type=float, default=0.0, help="요청당 응답 지연(초)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="503 오류 응답 비율(0~1)")
+    parser.add_argument("--slow-rate", type=float, default=0.0, help="느린 응답 비율(0~1)")
+    parser.add_argument("--slow-latency", type=float, default=2.0, help="느린 응답의 추가 지연(초)")
+    parser.add_argument("--count-spread", type=float, default=0.0, help="월별 거래 건수 편차 비율(0~1)")
+    parser.add_argument("--pad-bytes", type=int, default=0, help="item마다 덧붙일 바이트 수")
+    parser.add_argument("--fixtures", default=None, help="녹화된 응답 디렉토리 (record_fixtures.py)")
+    parser.add_argument("--fixtures-only", action="store_true", help="녹화 파일이 없는 달은 0건으로 응답")
+    args = parser.parse_args()
+
+    srv = MockRtmsServer((args.host, args.port), total_count=args.total_count, latency=args.latency,
+                         error_rate=args.error_rate, slow_rate=args.slow_rate, slow_latency=args.slow_latency,
+                         count_spread=args.count_spread, pad_bytes=args.pad_bytes,
+                         fixture_dir=args.fixtures, fixtures_only=args.fixtures_only)
+    print(f"Mock RTMS server listening on {srv.url}")
+    srv.serve_forever()
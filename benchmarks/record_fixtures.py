@@ -0,0 +1,61 @@
+# record_fixtures.py - 실제 RTMS 응답 녹화 스크립트
+# 실제 API(RTMS_KEY 필요)에서 (법정동 코드, 년월)별 한 달치 item 전체를 받아
+# 목 서버가 재생할 수 있는 XML 파일({법정동 코드}_{년월}.xml)로 저장합니다.
+# 녹화는 한 번만 쿼터를 쓰고, 이후 벤치마크는 --fixtures 옵션으로 오프라인에서 반복할 수 있습니다.
+#
+# 실행: python -m benchmarks.record_fixtures --lawd 11680 41135 --start 202401 --end 202406 --out benchmarks/fixtures
+from __future__ import annotations
+
+import argparse
+import math
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from typing import Dict, List
+
+from .mock_rtms_server import fixture_path, render_page
+
+
+def _fetch_items(lawd_cd: str, deal_ymd: str, rows: int) -> List[Dict[str, str]]:
+    """한 달치 item을 모든 페이지에 걸쳐 원본 필드 그대로 가져옵니다."""
+    from src.config import ENDPOINT, SERVICE_KEY  # 실제 API 키가 필요하므로 실행 시점에 임포트
+    from src.http_pool import http_get
+
+    items: List[Dict[str, str]] = []
+    page, last_page = 1, 1
+    while page <= last_page:
+        res = http_get(ENDPOINT, params={"serviceKey": SERVICE_KEY, "LAWD_CD": lawd_cd, "DEAL_YMD": deal_ymd,
+                                         "numOfRows": rows, "pageNo": page})
+        res.raise_for_status()
+        root = ET.fromstring(res.content)
+        msg = root.findtext(".//resultMsg")
+        if msg != "OK":
+            raise RuntimeError(f"{lawd_cd} {deal_ymd} (page {page}): {msg}")
+        items += [{child.tag: child.text or "" for child in item} for item in root.iter("item")]
+        last_page = max(1, math.ceil(int(root.findtext(".//totalCount") or 0) / rows))
+        page += 1
+    return items
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="실제 RTMS 응답을 목 서버용 fixture로 녹화")
+    parser.add_argument("--lawd", nargs="+", required=True, help="5자리 법정동 코드 목록")
+    parser.add_argument("--start", required=True, help="시작년월 (YYYYMM)")
+    parser.add_argument("--end", required=True, help="종료년월 (YYYYMM)")
+    parser.add_argument("--out", default=str(Path(__file__).resolve().parent / "fixtures"), help="저장 디렉토리")
+    parser.add_argument("--rows", type=int, default=1000, help="녹화 시 페이지당 행 수")
+    args = parser.parse_args()
+
+    from src.rtms_client import month_range
+
+    out = Path(args.out)
+    out.mkdir(parents=True, exist_ok=True)
+    for lawd_cd in args.lawd:
+        for ym in month_range(args.start, args.end):
+            items = _fetch_items(lawd_cd, ym, args.rows)
+            path = fixture_path(out, lawd_cd, ym)
+            path.write_bytes(render_page(items, 1, max(1, len(items)), len(items)))
+            print(f"{path.name}: {len(items)} items, {path.stat().st_size:,} bytes")
+
+
+if __name__ == "__main__":
+    main()
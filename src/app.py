@@ -1,11 +1,52 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import Depends, FastAPI, HTTPException, Query, Request
 from fastapi.middleware.cors import CORSMiddleware # CORS 미들웨어 임포트
+from fastapi.responses import Response, StreamingResponse
+from starlette.concurrency import run_in_threadpool
 from pydantic import BaseModel
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple, Union
 import pandas as pd
 
 # main.py에서 분리된 로직과 LAWD_CODES를 임포트합니다.
-from .main import LAWD_CODES, get_trade_data, get_geocoded_data, get_forecast_data, get_chat_agent
+from .main import (
+    LAWD_CODES,
+    get_chat_agent,
+    get_forecast_data,
+    get_geocoded_data,
+    get_trade_data_async,
+    iter_trade_data,
+    iter_trade_data_multi,
+    resolve_lawd_cds,
+)
+from .http_pool import aclose_async_client, close_all as close_http_pool
+from .upstream_scheduler import get_scheduler
+from .config import PREFETCH_ENABLED, TRADE_PAGE_MAX_LIMIT
+from .prefetch_daemon import get_prefetch_daemon
+from .result_store import get_result_store
+from .json_response import DataFrameResponse, to_json_bytes
+from .bulk_response import (
+    FORMAT_ARROW,
+    FORMAT_CSV,
+    FORMAT_JSON,
+    MEDIA_TYPES,
+    available,
+    frame_to_arrow,
+    frame_to_parquet,
+    iter_csv,
+    negotiate,
+)
+from .request_body import trade_body, trade_body_openapi
+from .trade_page import Cursor, parse_fields, parse_sort, project, sort_trades
+from .trade_schema import add_derived_columns, concat_trades
+from .trade_stats import DEFAULT_PERCENTILES, GROUP_BY, GROUP_MONTH, trade_stats
+from .rtms_client import (
+    CELL_FAILED,
+    CELL_STALE,
+    FAILED_MONTHS_ATTR,
+    STALE_MONTHS_ATTR,
+    get_circuit_breaker,
+    month_range,
+    with_lawd_column,
+)
 
 app = FastAPI()
 
@@ -24,8 +65,26 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # 부분 결과/대체 응답 여부, 결과 ID, 페이지 정보를 프론트엔드에서 읽을 수 있도록 노출
+    expose_headers=["X-RTMS-Failed-Months", "X-RTMS-Degraded", "X-RTMS-Stale-Months", "X-Result-Id",
+                    "X-Total-Count", "X-Next-Cursor"],
 )
 
+@app.on_event("startup")
+async def start_prefetch_daemon():
+    """PREFETCH_ENABLED=1이면 최신 월 프리페치 작업을 백그라운드에서 시작합니다."""
+    if PREFETCH_ENABLED:
+        get_prefetch_daemon().start()
+
+@app.on_event("shutdown")
+async def shutdown_http_pool():
+    """서버 종료 시 프리페치 작업을 멈추고 업스트림 keep-alive 연결을 정리합니다."""
+    if PREFETCH_ENABLED:
+        get_prefetch_daemon().stop()
+    close_http_pool()
+    await aclose_async_client()
+    get_scheduler().flush()  # 일일 쿼터 사용량 저장
+
 # LAWD_DATA는 이제 main.py에서 LAWD_CODES로 관리됩니다.
 @app.get("/")
 def read_root():
@@ -59,60 +118,364 @@ def get_district_code(sido: str, district_name: str) -> Dict:
         return {"district_name": district_name, "district_code": district_code}
     raise HTTPException(status_code=404, detail=f"'{sido} {district_name}'에 해당하는 지역을 찾을 수 없습니다.")
 
+@app.get("/upstream-budget")
+def get_upstream_budget() -> Dict:
+    """
+    RTMS API 호출 예산(토큰 버킷 상태, 일일 쿼터 사용량/잔여량)과 서킷 브레이커 상태를 반환합니다.
+    쿼터가 소진되거나 업스트림 장애로 회로가 열렸을 때 알림을 보내는 모니터링 용도로 사용합니다.
+    조회 결과 저장소의 사용량도 함께 반환합니다.
+    """
+    return {
+        **get_scheduler().budget(),
+        "circuit": get_circuit_breaker().snapshot(),
+        "prefetch": get_prefetch_daemon().last_stats if PREFETCH_ENABLED else None,
+        "result_store": get_result_store().stats(),
+    }
+
+def _response_format(request: Request, format: Optional[str]) -> str:
+    """format 파라미터(우선) 또는 Accept 헤더로 응답 형식을 고릅니다. 제공할 수 없는 형식이면 400/406."""
+    if format is not None and format not in MEDIA_TYPES:
+        raise HTTPException(status_code=400, detail=f"format은 {', '.join(MEDIA_TYPES)} 중 하나여야 합니다.")
+    fmt = format or negotiate(request.headers.get("accept"))
+    if fmt is None or not available(fmt):
+        raise HTTPException(status_code=406, detail={
+            "message": "요청한 응답 형식을 제공할 수 없습니다.",
+            "supported": [MEDIA_TYPES[f] for f in MEDIA_TYPES if available(f)],
+        })
+    return fmt
+
+def _partial_headers(df: pd.DataFrame) -> Dict[str, str]:
+    """조회 실패/대체 응답 년월 헤더를 만듭니다."""
+    headers = {}
+    failed_months = df.attrs.get(FAILED_MONTHS_ATTR, [])
+    if failed_months:
+        headers["X-RTMS-Failed-Months"] = ",".join(failed_months)
+    stale_months = df.attrs.get(STALE_MONTHS_ATTR, [])
+    if stale_months:
+        headers["X-RTMS-Degraded"] = "1"
+        headers["X-RTMS-Stale-Months"] = ",".join(stale_months)
+    return headers
+
+def _trade_data_response(df: pd.DataFrame, fmt: str, field_list: Optional[List[str]],
+                         headers: Dict[str, str]) -> Response:
+    """/trade-data 응답을 만듭니다. 본문을 직렬화하므로 스레드 풀에서 호출합니다."""
+    # 그래프용 파생 필드(deal_amount, deal_year, deal_month)는 응답 직전에, 필요한 경우에만 계산합니다.
+    df = project(df, field_list, derived=fmt == FORMAT_JSON)
+    if fmt == FORMAT_CSV:
+        # 동기 이터레이터이므로 CSV 조각도 Starlette가 스레드 풀에서 만들어 보냅니다.
+        return StreamingResponse(iter_csv(df), media_type=MEDIA_TYPES[fmt], headers=headers)
+    if fmt != FORMAT_JSON:
+        body = frame_to_arrow(df) if fmt == FORMAT_ARROW else frame_to_parquet(df)
+        return Response(body, media_type=MEDIA_TYPES[fmt], headers=headers)
+    return DataFrameResponse(df, headers=headers)  # 생성할 때 본문을 직렬화함
+
 # 새로운 /trade-data 엔드포인트 (기존 get_trade_history 대체)
 @app.get("/trade-data")
-def get_filtered_trade_data(
+async def get_filtered_trade_data(
+    request: Request,
     lawd_cd: str,
     start_ym: str,
     end_ym: str,
     min_area: Optional[float] = None,
     max_area: Optional[float] = None,
     apt_name: Optional[str] = None,
+    format: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1, le=TRADE_PAGE_MAX_LIMIT),
+    cursor: Optional[str] = None,
+    sort: Optional[str] = None,
+    fields: Optional[str] = None,
 ) -> List[Dict]:
     """
     지정된 기간 동안의 실거래가 데이터를 조회하고 필터링합니다.
+    비동기 조회 엔진을 사용하므로 요청마다 스레드 풀을 만들지 않습니다.
+
+    재시도 후에도 조회에 실패한 달이 있으면 결과는 부분 결과이며,
+    실패한 년월 목록을 `X-RTMS-Failed-Months` 헤더(쉼표 구분)로 알려줍니다.
+    업스트림 장애로 만료된 캐시 데이터를 대신 사용한 경우(degraded mode)에는
+    `X-RTMS-Degraded: 1`과 해당 년월 목록 `X-RTMS-Stale-Months` 헤더를 붙입니다.
+
+    조회 결과는 서버에 보관되며, 결과 ID를 `X-Result-Id` 헤더로 알려줍니다.
+    /geocode-trade-history, /forecast, /chat에는 trade_data 대신 이 result_id를 보낼 수 있습니다.
+
+    응답 형식은 Accept 헤더(또는 `format=json|arrow|parquet|csv`)로 고릅니다. 기본값은 JSON입니다.
+      - application/vnd.apache.arrow.stream: Arrow IPC 스트림 (pyarrow 필요)
+      - application/vnd.apache.parquet: Parquet 파일 (pyarrow 필요)
+      - text/csv: CSV 스트리밍
+    JSON 외 형식은 파생 문자열 필드 없이 표준 스키마 컬럼만 담습니다. 제공할 수 없는 형식만 요청하면 406을 반환합니다.
+
+    페이지 조회, 정렬, 필드 선택:
+      - `sort=거래금액(만원),-거래일`: 정렬 기준 ('-'는 내림차순, 같은 값은 거래일 순서 유지)
+      - `fields=아파트,거래금액(만원),도로명`: 응답할 필드 (파생 필드 deal_amount 등도 지정 가능)
+      - `limit=100`: 한 페이지 행 수. 전체 행 수는 `X-Total-Count`, 다음 페이지 커서는 `X-Next-Cursor` 헤더로
+        알려주며, 마지막 페이지에는 `X-Next-Cursor`가 없습니다.
+      - `cursor=...`: 다음 페이지 요청. 첫 페이지 조회 시점의 결과를 그대로 이어서 자르며(업스트림 조회 없음),
+        결과가 만료되었으면 410을 반환합니다. limit을 생략하면 첫 페이지의 limit을 사용합니다.
+    """
+    fmt = _response_format(request, format)
+    try:
+        sort_keys = parse_sort(sort)
+        field_list = parse_fields(fields)
+        page = Cursor.decode(cursor) if cursor else None
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    headers = {"Vary": "Accept"}
+
+    if page is not None:
+        if sort is not None and sort != page.sort:
+            raise HTTPException(status_code=400, detail="커서와 다른 sort로 다음 페이지를 조회할 수 없습니다.")
+        sort = page.sort  # sort를 생략한 요청의 다음 커서에도 첫 페이지의 정렬을 이어서 담음
+        limit = min(limit or page.limit, TRADE_PAGE_MAX_LIMIT)
+        sliced = get_result_store().page(page.result_id, page.offset, page.offset + limit)
+        if sliced is None:
+            raise HTTPException(status_code=410, detail="조회 결과가 만료되었습니다. 첫 페이지부터 다시 조회해주세요.")
+        df, total = sliced
+        result_id, offset = page.result_id, page.offset
+    else:
+        df = await get_trade_data_async(lawd_cd, start_ym, end_ym, min_area, max_area, apt_name)
+        failed_months = df.attrs.get(FAILED_MONTHS_ATTR, [])
+        if df.empty:
+            if failed_months:
+                raise HTTPException(status_code=503, detail={
+                    "message": "실거래가 API 조회에 실패했습니다. 잠시 후 다시 시도해주세요.",
+                    "failed_months": failed_months,
+                })
+            raise HTTPException(status_code=404, detail="해당 조건에 맞는 거래 내역이 없습니다.")
+        # 정렬된 결과를 보관하므로, 다음 페이지는 다시 정렬하지 않고 자르기만 합니다.
+        df = await run_in_threadpool(sort_trades, df, sort_keys)
+        result_id = get_result_store().put(df)
+        total, offset = len(df), 0
+        if limit is not None:
+            if result_id is None:
+                raise HTTPException(status_code=503, detail="조회 결과가 너무 커서 페이지 조회를 할 수 없습니다. "
+                                                            "조회 기간을 줄여주세요.")
+            df = df.iloc[:limit]
+
+    headers.update(_partial_headers(df))
+    if result_id:
+        headers["X-Result-Id"] = result_id
+    if limit is not None:
+        headers["X-Total-Count"] = str(total)
+        next_offset = offset + len(df)
+        if next_offset < total:
+            headers["X-Next-Cursor"] = Cursor(result_id, next_offset, limit, sort).encode()
+
+    # 수십만 행의 파생 필드 계산과 직렬화는 수백 ms가 걸리므로 이벤트 루프를 막지 않도록 스레드 풀에서 처리합니다.
+    return await run_in_threadpool(_trade_data_response, df, fmt, field_list, headers)
+
+@app.get("/trade-stats")
+async def get_trade_stats(
+    lawd_cd: str,
+    start_ym: str,
+    end_ym: str,
+    min_area: Optional[float] = None,
+    max_area: Optional[float] = None,
+    apt_name: Optional[str] = None,
+    group_by: str = GROUP_MONTH,
+    percentiles: str = ",".join(f"{p:g}" for p in DEFAULT_PERCENTILES),
+) -> Dict:
+    """
+    /trade-data와 같은 조건으로 조회한 거래의 그룹별 집계 통계를 반환합니다. (대시보드 그래프용)
+    원본 거래 대신 그룹마다 한 행인 표를 돌려주므로, 응답이 MB 단위에서 KB 단위로 줄어듭니다.
+
+      - group_by: month(YYYYMM) | apartment(아파트명) | area(전용면적 구간) | floor(층 구간)
+      - percentiles: 함께 계산할 백분위수 목록 (쉼표 구분, 중앙값은 항상 포함)
+      - 응답: {"group_by", "rows", "groups": [{"group", "count", "price_mean", "price_median", "price_p10", ...,
+        "price_per_m2_*", "price_per_pyeong_*"}]} (금액 단위: 만원)
+    부분 결과/대체 응답 헤더는 /trade-data와 같습니다.
     """
-    df = get_trade_data(lawd_cd, start_ym, end_ym, min_area, max_area, apt_name)
+    if group_by not in GROUP_BY:
+        raise HTTPException(status_code=400, detail=f"group_by는 {', '.join(GROUP_BY)} 중 하나여야 합니다.")
+    try:
+        percentile_list = [float(p) for p in percentiles.split(",") if p.strip()]
+    except ValueError:
+        raise HTTPException(status_code=400, detail="percentiles는 쉼표로 구분한 숫자여야 합니다. (예: 10,25,75,90)")
+    if any(not 0 <= p <= 100 for p in percentile_list):
+        raise HTTPException(status_code=400, detail="percentiles는 0~100 사이여야 합니다.")
+    df = await get_trade_data_async(lawd_cd, start_ym, end_ym, min_area, max_area, apt_name)
+    failed_months = df.attrs.get(FAILED_MONTHS_ATTR, [])
     if df.empty:
+        if failed_months:
+            raise HTTPException(status_code=503, detail={
+                "message": "실거래가 API 조회에 실패했습니다. 잠시 후 다시 시도해주세요.",
+                "failed_months": failed_months,
+            })
         raise HTTPException(status_code=404, detail="해당 조건에 맞는 거래 내역이 없습니다.")
-    return df.to_dict(orient="records")
+    # 100만 행 집계는 수백 ms가 걸리므로 이벤트 루프를 막지 않도록 스레드 풀에서 계산합니다.
+    stats = await run_in_threadpool(trade_stats, df, group_by, percentile_list)
+    return DataFrameResponse({"group_by": group_by, "rows": len(df), "groups": stats}, headers=_partial_headers(df))
+
+def _ndjson_line(obj: Dict) -> bytes:
+    return to_json_bytes(obj) + b"\n"
+
+def _sse_event(obj: Dict) -> bytes:
+    return f"event: {obj['type']}\ndata: ".encode("utf-8") + to_json_bytes(obj) + b"\n\n"
+
+@app.get("/trade-data/stream")
+async def stream_trade_data(
+    request: Request,
+    lawd_cd: str,
+    start_ym: str,
+    end_ym: str,
+    min_area: Optional[float] = None,
+    max_area: Optional[float] = None,
+    apt_name: Optional[str] = None,
+    format: Optional[str] = None,
+) -> StreamingResponse:
+    """
+    /trade-data의 스트리밍 버전. 가장 느린 달을 기다리지 않고, 달이 준비되는 순서대로
+    (캐시에 있는 달 먼저, 이후 조회가 끝난 달부터) 한 달씩 내보내므로 첫 달부터 그래프를 그릴 수 있습니다.
+
+    형식은 `format=ndjson|sse` 또는 Accept 헤더(text/event-stream이면 SSE)로 고릅니다. 기본값은 NDJSON입니다.
+      - {"type": "month", "deal_ymd", "status": "ok"|"stale"|"failed", "rows": [...]}
+      - 마지막: {"type": "done", "months", "rows", "failed", "stale", "result_id"}
+    SSE에서는 type이 이벤트 이름(event: month / event: done)이 됩니다.
+    """
+    if format is None:
+        format = "sse" if "text/event-stream" in request.headers.get("accept", "") else "ndjson"
+    if format not in ("ndjson", "sse"):
+        raise HTTPException(status_code=400, detail="format은 ndjson 또는 sse여야 합니다.")
+    try:
+        month_range(start_ym, end_ym)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="start_ym, end_ym은 YYYYMM 형식이어야 합니다.")
+    encode = _sse_event if format == "sse" else _ndjson_line
+
+    async def stream():
+        n_months, n_rows = 0, 0
+        months = {CELL_FAILED: [], CELL_STALE: []}
+        frames = {}
+        async for ym, df, status in iter_trade_data(lawd_cd, start_ym, end_ym, min_area, max_area, apt_name):
+            n_months += 1
+            if status in months:
+                months[status].append(ym)
+            rows = pd.DataFrame()
+            if df is not None and not df.empty:
+                frames[ym] = df
+                rows = add_derived_columns(df)
+            n_rows += len(rows)
+            yield encode({"type": "month", "deal_ymd": ym, "status": status, "rows": rows})
+        # 전체 결과를 년월 순서로 합쳐 보관하고, 다른 엔드포인트에서 쓸 결과 ID를 알려줍니다.
+        result_id = get_result_store().put(concat_trades([frames[ym] for ym in sorted(frames)])) if frames else None
+        yield encode({"type": "done", "months": n_months, "rows": n_rows,
+                      "failed": sorted(months[CELL_FAILED]), "stale": sorted(months[CELL_STALE]),
+                      "result_id": result_id})
+
+    media_type = "text/event-stream" if format == "sse" else "application/x-ndjson"
+    # 프록시가 스트림을 모아서 보내지 않도록 버퍼링을 끕니다.
+    return StreamingResponse(stream(), media_type=media_type,
+                             headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
+@app.get("/trade-data/multi")
+async def get_multi_region_trade_data(
+    start_ym: str,
+    end_ym: str,
+    sido: Optional[str] = None,
+    lawd_cds: Optional[str] = None,
+    min_area: Optional[float] = None,
+    max_area: Optional[float] = None,
+    apt_name: Optional[str] = None,
+) -> StreamingResponse:
+    """
+    여러 지역(시/도 전체 또는 쉼표로 구분한 법정동 코드 목록)의 실거래가 데이터를 한 번에 조회합니다.
+    `sido`를 지정하면 해당 시/도의 모든 시/군/구 코드로 확장됩니다.
+
+    (지역, 년월) 격자 전체를 하나의 동시성 한도 안에서 조회하며, 완료된 칸부터
+    NDJSON(application/x-ndjson)으로 한 줄씩 스트리밍합니다.
+      - {"type": "cell", "lawd_cd", "deal_ymd", "status": "ok"|"stale"|"failed", "rows": [...]}
+      - 마지막 줄: {"type": "done", "cells", "rows", "failed", "stale"}
+    각 행에는 법정동코드 필드가 포함됩니다.
+    """
+    try:
+        codes = resolve_lawd_cds(sido, lawd_cds.split(",") if lawd_cds else None)
+    except KeyError:
+        raise HTTPException(status_code=404, detail=f"'{sido}'에 해당하는 시/도를 찾을 수 없습니다.")
+    if not codes:
+        raise HTTPException(status_code=400, detail="sido 또는 lawd_cds 중 하나 이상을 지정해야 합니다.")
+    try:
+        month_range(start_ym, end_ym)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="start_ym, end_ym은 YYYYMM 형식이어야 합니다.")
+
+    async def stream():
+        n_cells, n_rows = 0, 0
+        cells = {CELL_FAILED: [], CELL_STALE: []}
+        async for lawd_cd, ym, df, status in iter_trade_data_multi(codes, start_ym, end_ym,
+                                                                   min_area, max_area, apt_name):
+            n_cells += 1
+            if status in cells:
+                cells[status].append(f"{lawd_cd}:{ym}")
+            rows = pd.DataFrame()
+            if df is not None and not df.empty:
+                rows = add_derived_columns(with_lawd_column(df, lawd_cd))
+            n_rows += len(rows)
+            yield _ndjson_line({"type": "cell", "lawd_cd": lawd_cd, "deal_ymd": ym, "status": status, "rows": rows})
+        yield _ndjson_line({"type": "done", "cells": n_cells, "rows": n_rows,
+                    "failed": sorted(cells[CELL_FAILED]), "stale": sorted(cells[CELL_STALE])})
+
+    return StreamingResponse(stream(), media_type="application/x-ndjson")
+
+def _request_frame(trade_df: Optional[pd.DataFrame], result_id: Optional[str], empty_detail: str) -> pd.DataFrame:
+    """
+    POST 요청의 거래 데이터를 데이터프레임으로 만듭니다.
+    result_id가 있으면 /trade-data가 보관한 결과를 JSON 파싱 없이 그대로 사용하고(응답과 같은 파생 필드 포함),
+    없으면 요청 본문에서 읽은 거래 데이터(request_body)를 사용합니다.
+    """
+    if result_id:
+        df = get_result_store().get(result_id)
+        if df is None:
+            raise HTTPException(status_code=404, detail="조회 결과(result_id)가 만료되었거나 존재하지 않습니다. "
+                                                        "/trade-data를 다시 조회해주세요.")
+        return add_derived_columns(df)
+    if trade_df is None or trade_df.empty:
+        raise HTTPException(status_code=400, detail=empty_detail)
+    return trade_df
+
+# POST 요청의 trade_data는 행 배열 또는 컬럼 배열({컬럼: [값, ...]})로 보낼 수 있습니다.
+# 요청 모델은 나머지 필드의 검증과 문서화에 쓰이고, trade_data는 행마다 검증하지 않고 바로 데이터프레임으로 변환됩니다.
+# Content-Type이 application/vnd.apache.arrow.stream이면 본문 전체가 거래 데이터(Arrow IPC)이고,
+# 나머지 필드는 쿼리 파라미터로 받습니다.
+TradeData = Optional[Union[List[Dict], Dict[str, List]]]
 
 # geocode-trade-history 엔드포인트 업데이트 (get_geocoded_data 사용)
 class TradeHistoryRequest(BaseModel):
-    trade_data: List[Dict]
+    trade_data: TradeData = None
+    result_id: Optional[str] = None  # /trade-data의 X-Result-Id (trade_data 대신 사용)
 
-@app.post("/geocode-trade-history")
-def geocode_trade_history(request: TradeHistoryRequest) -> List[Dict]:
+@app.post("/geocode-trade-history", openapi_extra=trade_body_openapi(TradeHistoryRequest))
+def geocode_trade_history(
+    body: Tuple[TradeHistoryRequest, Optional[pd.DataFrame]] = Depends(trade_body(TradeHistoryRequest)),
+) -> List[Dict]:
     """
     실거래가 데이터에 위도, 경도 좌표를 추가합니다.
     """
-    if not request.trade_data:
-        raise HTTPException(status_code=400, detail="거래 데이터가 비어 있습니다.")
+    request, trade_df = body
+    df = _request_frame(trade_df, request.result_id, "거래 데이터가 비어 있습니다.")
 
-    geocoded_df = get_geocoded_data(request.trade_data)
+    geocoded_df = get_geocoded_data(df)
 
     if geocoded_df.empty:
         raise HTTPException(status_code=404, detail="좌표를 변환할 수 있는 주소가 없습니다.")
 
-    return geocoded_df.to_dict(orient="records")
+    return DataFrameResponse(geocoded_df)
 
 # 새로운 /forecast 엔드포인트
 class ForecastRequest(BaseModel):
-    trade_data: List[Dict]
+    trade_data: TradeData = None
+    result_id: Optional[str] = None  # /trade-data의 X-Result-Id (trade_data 대신 사용)
     periods: Optional[int] = 12
 
-@app.post("/forecast")
-def get_apartment_forecast(request: ForecastRequest) -> Dict:
+@app.post("/forecast", openapi_extra=trade_body_openapi(ForecastRequest))
+def get_apartment_forecast(
+    body: Tuple[ForecastRequest, Optional[pd.DataFrame]] = Depends(trade_body(ForecastRequest)),
+) -> Dict:
     """
     주어진 실거래가 데이터로 아파트 가격을 예측합니다.
     """
-    if not request.trade_data:
-        raise HTTPException(status_code=400, detail="예측을 위한 거래 데이터가 비어 있습니다.")
-
     # 서비스 로직(get_forecast_data)은 DataFrame을 인자로 받으므로,
-    # 요청으로 받은 list[dict]를 DataFrame으로 변환합니다.
-
-    df_for_forecast = pd.DataFrame(request.trade_data)
+    # 요청 본문의 거래 데이터(또는 보관된 조회 결과)를 DataFrame으로 가져옵니다.
+    request, trade_df = body
+    df_for_forecast = _request_frame(trade_df, request.result_id,
+                                     "예측을 위한 거래 데이터가 비어 있습니다.")
     if df_for_forecast.empty:
         raise HTTPException(status_code=400, detail="예측을 위한 유효한 거래 데이터가 없습니다.")
 
@@ -128,25 +491,23 @@ def get_apartment_forecast(request: ForecastRequest) -> Dict:
     if hist_df is None or fcst_df is None:
         raise HTTPException(status_code=400, detail="예측을 수행할 수 없습니다. 데이터가 충분한지 확인하세요.")
 
-    return {
-        "historical_data": hist_df.to_dict(orient="records"),
-        "forecast_data": fcst_df.to_dict(orient="records"),
-    }
+    return DataFrameResponse({"historical_data": hist_df, "forecast_data": fcst_df})
 
 # 챗봇 에이전트 엔드포인트 (상태 관리가 필요하므로 초기 버전에서는 간단히 구현)
 class ChatRequest(BaseModel):
-    trade_data: List[Dict]
+    trade_data: TradeData = None
+    result_id: Optional[str] = None  # /trade-data의 X-Result-Id (trade_data 대신 사용)
     question: str
 
-@app.post("/chat")
-def chat_with_agent(request: ChatRequest) -> Dict:
+@app.post("/chat", openapi_extra=trade_body_openapi(ChatRequest))
+def chat_with_agent(
+    body: Tuple[ChatRequest, Optional[pd.DataFrame]] = Depends(trade_body(ChatRequest)),
+) -> Dict:
     """
     주어진 데이터에 대해 AI 챗봇에게 질문하고 답변을 받습니다.
     """
-    if not request.trade_data:
-        raise HTTPException(status_code=400, detail="챗봇을 위한 거래 데이터가 비어 있습니다.")
-
-    df_for_chat = pd.DataFrame(request.trade_data)
+    request, trade_df = body
+    df_for_chat = _request_frame(trade_df, request.result_id, "챗봇을 위한 거래 데이터가 비어 있습니다.")
     if df_for_chat.empty:
         raise HTTPException(status_code=400, detail="챗봇을 위한 유효한 거래 데이터가 없습니다.")
 
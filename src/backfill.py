@@ -0,0 +1,253 @@
+# backfill.py - 과거 실거래 데이터 일괄 적재(백필) CLI
+# 지역 목록 × 기간의 (법정동 코드, 년월) 칸을 모두 조회하여 로컬 거래 캐시(trade_cache)에 저장합니다.
+#   - 진행 상황을 체크포인트 파일에 주기적으로 기록하여, 중단 후 다시 실행하면 이어서 진행합니다.
+#   - 모든 요청은 BACKGROUND 우선순위로 업스트림 스케줄러를 거치며, 일일 쿼터가 소진되면
+#     (--wait-on-quota) 쿼터가 초기화되는 자정(KST)까지 기다렸다가 계속합니다.
+#   - 처리량(months/s, rows/s)과 쿼터 잔여량을 주기적으로 출력합니다.
+#
+# 실행 예:
+#   python -m src.backfill --regions 서울특별시 41135 --start 2015 --end 2024 --workers 8
+#   python -m src.backfill --regions all --start 2006 --end 2024 --wait-on-quota   # 전국, 무인 실행
+from __future__ import annotations
+
+import argparse
+import json
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from datetime import datetime
+from pathlib import Path
+from typing import Deque, Dict, List, Set, Tuple
+
+from .circuit_breaker import CircuitOpenError
+from .config import BASE_DIR
+from .district_code_loader import district_codes
+from .rtms_client import get_circuit_breaker, load_month, month_range
+from .trade_cache import get_trade_cache
+from .upstream_scheduler import Priority, QuotaExceededError, get_scheduler
+
+Cell = Tuple[str, str]  # (법정동 코드, 년월)
+
+DEFAULT_CHECKPOINT = BASE_DIR.parent / "data" / "backfill_checkpoint.json"
+
+
+# --- 1. 대상 지역 / 기간 ---
+def resolve_regions(regions: List[str]) -> List[str]:
+    """
+    시/도 이름, 5자리 법정동 코드, 또는 'all'을 법정동 코드 목록으로 변환합니다. (중복 제거, 순서 유지)
+
+    Raises:
+        ValueError: 알 수 없는 시/도 이름인 경우.
+    """
+    codes: List[str] = []
+    for region in regions:
+        if region == "all":
+            codes += district_codes()
+        elif region.isdigit() and len(region) == 5:
+            codes.append(region)
+        else:
+            try:
+                codes += district_codes(region)  # 구가 있는 시는 구 코드까지 포함
+            except KeyError:
+                raise ValueError(f"알 수 없는 지역입니다: {region}") from None
+    return list(dict.fromkeys(codes))
+
+
+def _to_ym(value: str, end: bool) -> str:
+    """'2015' 또는 '201503' 형식을 YYYYMM으로 변환합니다. 연도만 주면 1월(시작) 또는 12월(끝)."""
+    if len(value) == 4:
+        return value + ("12" if end else "01")
+    return value
+
+
+# --- 2. 체크포인트 ---
+class Checkpoint:
+    """
+    완료한 칸과 실패한 칸을 JSON 파일에 기록합니다. 기록 도중 종료되어도 파일이 깨지지 않도록
+    임시 파일에 쓴 뒤 원자적으로 교체합니다.
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self.done: Set[str] = set()
+        self.failed: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        try:
+            state = json.loads(self.path.read_text(encoding="utf-8"))
+            self.done = set(state.get("done", []))
+            self.failed = dict(state.get("failed", {}))
+        except (FileNotFoundError, ValueError):
+            pass
+
+    @staticmethod
+    def key(cell: Cell) -> str:
+        return f"{cell[0]}:{cell[1]}"
+
+    def mark_done(self, cell: Cell) -> None:
+        with self._lock:
+            self.done.add(self.key(cell))
+            self.failed.pop(self.key(cell), None)
+
+    def mark_failed(self, cell: Cell, error: Exception) -> None:
+        with self._lock:
+            self.failed[self.key(cell)] = f"{type(error).__name__}: {error}"
+
+    def save(self) -> None:
+        with self._lock:
+            state = {"updated_at": datetime.now().isoformat(timespec="seconds"),
+                     "done": sorted(self.done), "failed": self.failed}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(state, ensure_ascii=False), encoding="utf-8")
+        tmp.replace(self.path)
+
+
+def plan_cells(lawd_cds: List[str], start_ym: str, end_ym: str, checkpoint: Checkpoint) -> Deque[Cell]:
+    """
+    남은 작업 칸을 만듭니다. 체크포인트에 완료로 기록되었거나 캐시에 신선한 파티션이 있는 칸은 제외합니다.
+    최근 달부터 처리하여, 중간에 멈추더라도 자주 조회되는 기간이 먼저 채워지도록 합니다.
+    """
+    months = sorted(month_range(start_ym, end_ym), reverse=True)
+    cache = get_trade_cache()
+    cached = {lawd_cd: cache.fresh_months(lawd_cd, months) for lawd_cd in lawd_cds}
+    return deque(
+        (lawd_cd, ym) for ym in months for lawd_cd in lawd_cds
+        if ym not in cached[lawd_cd] and Checkpoint.key((lawd_cd, ym)) not in checkpoint.done
+    )
+
+
+# --- 3. 실행 ---
+class Backfill:
+    """
+    백필 작업 실행기.
+
+    Args:
+        cells (Deque[Cell]): 처리할 칸 목록.
+        checkpoint (Checkpoint): 진행 상황 기록.
+        workers (int): 동시에 조회할 칸 수. 실제 요청 속도는 업스트림 스케줄러가 제한합니다.
+        wait_on_quota (bool): 일일 쿼터가 소진되면 초기화 시각까지 기다렸다가 계속할지 여부.
+        report_every (float): 진행 상황 출력 및 체크포인트 저장 간격(초).
+    """
+
+    def __init__(self, cells: Deque[Cell], checkpoint: Checkpoint, workers: int = 4,
+                 wait_on_quota: bool = False, report_every: float = 30.0):
+        self.cells = cells
+        self.checkpoint = checkpoint
+        self.workers = workers
+        self.wait_on_quota = wait_on_quota
+        self.report_every = report_every
+        self.total = len(cells)
+        self.months = 0
+        self.rows = 0
+        self.failed = 0
+        self._started = time.monotonic()
+        self._last_report = self._started
+
+    def _work(self, cell: Cell) -> int:
+        return len(load_month(*cell, priority=Priority.BACKGROUND))
+
+    def _pause(self, error: Exception) -> bool:
+        """쿼터 소진/회로 개방 시 기다릴지 결정합니다. 계속할 수 없으면 False."""
+        if isinstance(error, CircuitOpenError):
+            delay = max(1.0, get_circuit_breaker().snapshot()["retry_in_seconds"])
+            print(f"[Backfill] 업스트림 장애로 회로가 열려 있습니다. {delay:.0f}초 후 다시 시도합니다.")
+            time.sleep(delay)
+            return True
+        if not self.wait_on_quota:
+            print(f"[Backfill] 일일 쿼터 소진으로 중단합니다. 다시 실행하면 이어서 진행합니다. ({error})")
+            return False
+        resets_at = datetime.fromisoformat(get_scheduler().budget()["resets_at"])
+        delay = max(60.0, (resets_at - datetime.now(resets_at.tzinfo)).total_seconds() + 60)
+        self.report()
+        print(f"[Backfill] 일일 쿼터 소진. 초기화 시각({resets_at:%Y-%m-%d %H:%M} KST)까지 {delay / 3600:.1f}시간 대기합니다.")
+        time.sleep(delay)
+        return True
+
+    def report(self) -> None:
+        elapsed = max(1e-9, time.monotonic() - self._started)
+        budget = get_scheduler().budget()
+        remaining = self.total - self.months - self.failed
+        rate = self.months / elapsed
+        eta = f"{remaining / rate / 3600:.1f}h" if rate > 0 else "-"
+        print(f"[Backfill] {self.months + self.failed}/{self.total} months "
+              f"(failed {self.failed}) | {rate:.2f} months/s, {self.rows / elapsed:,.0f} rows/s | "
+              f"rows {self.rows:,} | quota {budget['used_today']}/{budget['daily_quota']} | ETA {eta}")
+        self._last_report = time.monotonic()
+
+    def run(self) -> None:
+        """모든 칸을 처리하거나, 쿼터 소진으로 멈추거나, Ctrl+C로 중단될 때까지 실행합니다."""
+        in_flight: Dict[Future, Cell] = {}
+        stopping = False
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="rtms-backfill") as executor:
+            try:
+                while self.cells or in_flight:
+                    # 한꺼번에 제출하지 않고 동시 실행 수만큼만 유지 (재시도할 칸을 앞에 다시 넣을 수 있도록)
+                    while self.cells and len(in_flight) < self.workers and not stopping:
+                        cell = self.cells.popleft()
+                        in_flight[executor.submit(self._work, cell)] = cell
+                    if not in_flight:
+                        break
+                    done, _ = wait(in_flight, timeout=self.report_every, return_when=FIRST_COMPLETED)
+                    pause_error = None
+                    for future in done:
+                        cell = in_flight.pop(future)
+                        try:
+                            self.rows += future.result()
+                            self.months += 1
+                            self.checkpoint.mark_done(cell)
+                        except (QuotaExceededError, CircuitOpenError) as e:
+                            self.cells.appendleft(cell)  # 나중에 다시 시도
+                            pause_error = e
+                        except Exception as e:
+                            print(f"[Backfill] {cell[0]} {cell[1]} 실패: {e}")
+                            self.failed += 1
+                            self.checkpoint.mark_failed(cell, e)
+                    if pause_error is not None and not stopping:
+                        self.checkpoint.save()
+                        stopping = not self._pause(pause_error)
+                    if time.monotonic() - self._last_report >= self.report_every:
+                        self.checkpoint.save()
+                        self.report()
+                    if stopping and not in_flight:
+                        break
+            except KeyboardInterrupt:
+                print("[Backfill] 중단 요청. 진행 중인 조회를 마무리하고 체크포인트를 저장합니다.")
+                for future in in_flight:
+                    future.cancel()
+            finally:
+                self.checkpoint.save()
+                get_scheduler().flush()
+        self.report()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="RTMS 과거 실거래 데이터 백필")
+    parser.add_argument("--regions", nargs="+", default=["all"],
+                        help="시/도 이름, 5자리 법정동 코드, 또는 all (기본값: all)")
+    parser.add_argument("--start", required=True, help="시작 연도(YYYY) 또는 년월(YYYYMM)")
+    parser.add_argument("--end", default=datetime.now().strftime("%Y%m"), help="종료 연도 또는 년월 (기본값: 이번 달)")
+    parser.add_argument("--workers", type=int, default=4, help="동시에 조회할 (지역, 년월) 수")
+    parser.add_argument("--checkpoint", default=str(DEFAULT_CHECKPOINT), help="체크포인트 파일 경로")
+    parser.add_argument("--wait-on-quota", action="store_true",
+                        help="일일 쿼터 소진 시 종료하지 않고 초기화 시각까지 기다렸다가 계속")
+    parser.add_argument("--retry-failed", action="store_true", help="이전 실행에서 실패한 칸도 다시 시도")
+    parser.add_argument("--report-every", type=float, default=30.0, help="진행 상황 출력 간격(초)")
+    args = parser.parse_args()
+
+    lawd_cds = resolve_regions(args.regions)
+    start_ym, end_ym = _to_ym(args.start, end=False), _to_ym(args.end, end=True)
+    checkpoint = Checkpoint(args.checkpoint)
+    cells = plan_cells(lawd_cds, start_ym, end_ym, checkpoint)
+    if not args.retry_failed:
+        cells = deque(c for c in cells if Checkpoint.key(c) not in checkpoint.failed)
+
+    budget = get_scheduler().budget()
+    print(f"[Backfill] 지역 {len(lawd_cds)}곳 × {start_ym}~{end_ym}: 남은 {len(cells)}칸 "
+          f"(완료 {len(checkpoint.done)}, 이전 실패 {len(checkpoint.failed)}) | "
+          f"오늘 쿼터 잔여 {budget['remaining_today']}, 백그라운드 한도 {budget['background_limit']}")
+    Backfill(cells, checkpoint, args.workers, args.wait_on_quota, args.report_every).run()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+# bulk_response.py - 대용량 거래 데이터 응답 형식 모듈
+# 여러 해·여러 지역의 거래 데이터를 내려받는 분석용 클라이언트를 위해, 같은 조회 결과를
+# 행 단위 JSON 대신 컬럼 단위 형식으로 직렬화합니다. 형식은 Accept 헤더로 협상합니다.
+#   - Arrow IPC 스트림 (application/vnd.apache.arrow.stream): 표준 스키마의 컬럼 버퍼를 그대로 담음
+#     (category → dictionary, Int32/Int16 → int32/int16, float32 → float, 거래일 → timestamp)
+#   - Parquet (application/vnd.apache.parquet): Arrow 테이블을 압축(PARQUET_COMPRESSION)하여 저장
+#   - CSV (text/csv): CSV_CHUNK_ROWS행씩 나누어 스트리밍
+# 세 형식 모두 표준 스키마(trade_schema.COLUMNS)만 담고, 그래프용 파생 문자열 필드는 포함하지 않습니다.
+# POST 요청 본문으로 받은 Arrow IPC 스트림을 데이터프레임으로 읽는 데에도 사용합니다. (request_body)
+# Arrow/Parquet은 pyarrow(requirements.txt에 포함)가 설치된 경우에만 협상 대상이 됩니다.
+from __future__ import annotations
+
+from typing import Iterator, List, Optional, Tuple
+
+import pandas as pd
+
+from .config import CSV_CHUNK_ROWS, PARQUET_COMPRESSION
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc as pa_ipc
+    import pyarrow.parquet as pq
+    HAVE_PYARROW = True
+except ImportError:  # pyarrow 없이 설치한 경우 JSON/CSV만 제공
+    HAVE_PYARROW = False
+
+FORMAT_JSON = "json"
+FORMAT_ARROW = "arrow"
+FORMAT_PARQUET = "parquet"
+FORMAT_CSV = "csv"
+
+MEDIA_TYPES = {
+    FORMAT_JSON: "application/json",
+    FORMAT_ARROW: "application/vnd.apache.arrow.stream",
+    FORMAT_PARQUET: "application/vnd.apache.parquet",
+    FORMAT_CSV: "text/csv; charset=utf-8",
+}
+
+# Accept 헤더의 미디어 타입 → 형식 (별칭과 와일드카드 포함, 와일드카드는 기본 형식으로)
+_ACCEPT_FORMATS = {
+    "application/json": FORMAT_JSON,
+    "application/*": FORMAT_JSON,
+    "*/*": FORMAT_JSON,
+    "application/vnd.apache.arrow.stream": FORMAT_ARROW,
+    "application/vnd.apache.parquet": FORMAT_PARQUET,
+    "application/x-parquet": FORMAT_PARQUET,
+    "text/csv": FORMAT_CSV,
+    "text/*": FORMAT_CSV,
+}
+
+_PYARROW_FORMATS = (FORMAT_ARROW, FORMAT_PARQUET)
+
+
+def available(fmt: str) -> bool:
+    """이 서버에서 제공할 수 있는 형식인지 반환합니다. (Arrow/Parquet은 pyarrow 필요)"""
+    return fmt in MEDIA_TYPES and (HAVE_PYARROW or fmt not in _PYARROW_FORMATS)
+
+
+def _parse_accept(accept: str) -> List[Tuple[str, float]]:
+    """Accept 헤더를 (미디어 타입, q) 목록으로 파싱하여 q가 높은 순서로 반환합니다. (같은 q는 헤더 순서 유지)"""
+    entries = []
+    for part in accept.split(","):
+        media_type, *params = [p.strip() for p in part.split(";")]
+        if not media_type:
+            continue
+        q = 1.0
+        for param in params:
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        entries.append((media_type.lower(), q))
+    return sorted(entries, key=lambda e: -e[1])
+
+
+def negotiate(accept: Optional[str]) -> Optional[str]:
+    """
+    Accept 헤더에 맞는 응답 형식을 고릅니다. 헤더가 없으면 JSON.
+    제공할 수 있는 형식이 하나도 없으면 None (호출자는 406으로 응답).
+    """
+    if not accept:
+        return FORMAT_JSON
+    for media_type, q in _parse_accept(accept):
+        fmt = _ACCEPT_FORMATS.get(media_type)
+        if q > 0 and fmt is not None and available(fmt):
+            return fmt
+    return None
+
+
+def _to_table(df: pd.DataFrame) -> "pa.Table":
+    # 숫자 컬럼은 numpy 버퍼를 복사 없이 감싸고, category는 정수 코드를 그대로 dictionary 인덱스로 씁니다.
+    return pa.Table.from_pandas(df, preserve_index=False)
+
+
+def frame_to_arrow(df: pd.DataFrame) -> memoryview:
+    """데이터프레임을 Arrow IPC 스트림으로 직렬화합니다. (버퍼를 bytes로 복사하지 않고 memoryview로 반환)"""
+    table = _to_table(df)
+    sink = pa.BufferOutputStream()
+    with pa_ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return memoryview(sink.getvalue())
+
+
+def frame_to_parquet(df: pd.DataFrame) -> memoryview:
+    """데이터프레임을 Parquet 파일로 직렬화합니다."""
+    sink = pa.BufferOutputStream()
+    pq.write_table(_to_table(df), sink, compression=PARQUET_COMPRESSION)
+    return memoryview(sink.getvalue())
+
+
+def frame_from_arrow(body: bytes) -> pd.DataFrame:
+    """Arrow IPC 스트림을 데이터프레임으로 읽습니다. (dictionary 컬럼은 category로) 형식이 잘못되면 pa.ArrowInvalid."""
+    return pa_ipc.open_stream(pa.py_buffer(body)).read_pandas()
+
+
+def iter_csv(df: pd.DataFrame, chunk_rows: int = CSV_CHUNK_ROWS) -> Iterator[bytes]:
+    """데이터프레임을 헤더 줄과 chunk_rows행 단위의 CSV 바이트 조각으로 나누어 내보냅니다."""
+    yield df.iloc[:0].to_csv(index=False).encode("utf-8")
+    for start in range(0, len(df), chunk_rows):
+        yield df.iloc[start:start + chunk_rows].to_csv(index=False, header=False).encode("utf-8")
@@ -0,0 +1,175 @@
+# circuit_breaker.py - 업스트림 서킷 브레이커 모듈
+# 최근 요청의 실패율이 임계치를 넘으면 회로를 '열어(OPEN)' 일정 시간 동안 업스트림 호출을 즉시 실패시키고,
+# 대기 시간이 지나면 '반개방(HALF_OPEN)' 상태에서 시험 요청을 보내 회복 여부를 확인합니다.
+# API 장애 시 요청마다 타임아웃까지 기다리며 워커가 쌓이는 것을 막기 위한 장치입니다.
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from enum import Enum
+from typing import Any, Awaitable, Callable, Dict, TypeVar
+
+T = TypeVar("T")
+
+
+class CircuitState(str, Enum):
+    CLOSED = "closed"        # 정상: 모든 요청 허용
+    OPEN = "open"            # 차단: 모든 요청 즉시 실패
+    HALF_OPEN = "half_open"  # 시험: 제한된 수의 시험 요청만 허용
+
+
+class CircuitOpenError(RuntimeError):
+    """회로가 열려 있어 업스트림 요청을 보내지 않고 즉시 실패한 경우 발생합니다."""
+
+
+class CircuitBreaker:
+    """
+    실패율 기반 서킷 브레이커. 스레드와 asyncio 코드에서 함께 사용할 수 있습니다.
+
+    Args:
+        name (str): 로그/모니터링에 표시할 이름.
+        failure_rate (float): 회로를 여는 실패율 임계치(0~1).
+        window (int): 실패율을 계산할 최근 요청 수.
+        min_calls (int): 최소 이만큼 요청이 쌓여야 실패율로 판단합니다.
+        open_seconds (float): 회로를 연 뒤 시험 요청을 허용하기까지의 시간(초).
+        half_open_calls (int): 반개방 상태에서 동시에 허용할 시험 요청 수.
+        half_open_timeout (float): 시험 요청이 이 시간(초) 안에 결과를 기록하지 않으면 자리를 회수합니다.
+            (자리를 돌려주지 못한 시험 요청 때문에 회로가 반개방 상태에 영구히 묶이지 않도록)
+        is_failure (Callable): 예외가 업스트림 장애로 집계되어야 하는지 판단하는 함수.
+    """
+
+    def __init__(self, name: str, failure_rate: float = 0.5, window: int = 20, min_calls: int = 10,
+                 open_seconds: float = 30.0, half_open_calls: int = 1, half_open_timeout: float = 60.0,
+                 is_failure: Callable[[BaseException], bool] = lambda e: True):
+        self.name = name
+        self.failure_rate = failure_rate
+        self.min_calls = min_calls
+        self.open_seconds = open_seconds
+        self.half_open_calls = half_open_calls
+        self.half_open_timeout = half_open_timeout
+        self.is_failure = is_failure
+        self._outcomes: deque[bool] = deque(maxlen=window)  # True = 실패
+        self._state = CircuitState.CLOSED
+        self._opened_at = 0.0
+        self._probes = 0
+        self._probe_started = 0.0  # 마지막 시험 요청을 허용한 시각
+        self._lock = threading.Lock()
+
+    # --- 상태 전이 ---
+    def _open(self) -> None:
+        self._state = CircuitState.OPEN
+        self._opened_at = time.monotonic()
+        self._probes = 0
+        print(f"[Circuit] {self.name}: OPEN (최근 실패율 {self._current_rate():.0%})")
+
+    def _close(self) -> None:
+        self._state = CircuitState.CLOSED
+        self._outcomes.clear()
+        self._probes = 0
+        print(f"[Circuit] {self.name}: CLOSED (회복)")
+
+    def _current_rate(self) -> float:
+        return sum(self._outcomes) / len(self._outcomes) if self._outcomes else 0.0
+
+    def before_call(self) -> None:
+        """
+        요청 직전에 호출합니다. 회로가 열려 있으면 CircuitOpenError를 발생시킵니다.
+        """
+        with self._lock:
+            if self._state == CircuitState.OPEN:
+                if time.monotonic() - self._opened_at < self.open_seconds:
+                    raise CircuitOpenError(f"{self.name} 회로가 열려 있습니다 (업스트림 장애).")
+                self._state = CircuitState.HALF_OPEN
+                print(f"[Circuit] {self.name}: HALF_OPEN (시험 요청 허용)")
+            if self._state == CircuitState.HALF_OPEN:
+                now = time.monotonic()
+                if self._probes >= self.half_open_calls:
+                    if now - self._probe_started < self.half_open_timeout:
+                        raise CircuitOpenError(f"{self.name} 회로가 시험 중입니다.")
+                    print(f"[Circuit] {self.name}: 시험 요청이 {self.half_open_timeout:g}초 동안 끝나지 않아 자리를 회수합니다.")
+                    self._probes = 0
+                self._probes += 1
+                self._probe_started = now
+
+    def release(self) -> None:
+        """
+        결과를 기록하지 않고 요청을 끝냅니다. (취소된 요청 등)
+        시험 요청이었다면 다른 요청이 시험할 수 있도록 자리만 돌려줍니다.
+        """
+        with self._lock:
+            if self._state == CircuitState.HALF_OPEN:
+                self._probes = max(0, self._probes - 1)
+
+    def on_success(self) -> None:
+        with self._lock:
+            if self._state == CircuitState.HALF_OPEN:
+                self._close()
+            else:
+                self._outcomes.append(False)
+
+    def on_failure(self, exc: BaseException) -> None:
+        with self._lock:
+            if not self.is_failure(exc):
+                # 업스트림 장애가 아닌 오류(4xx, API 오류 메시지, 쿼터 소진)는 집계하지 않고,
+                # 시험 요청이었다면 다른 요청이 시험할 수 있도록 자리만 돌려줍니다.
+                if self._state == CircuitState.HALF_OPEN:
+                    self._probes = max(0, self._probes - 1)
+                return
+            if self._state == CircuitState.HALF_OPEN:
+                self._open()  # 시험 요청 실패: 다시 차단
+                return
+            self._outcomes.append(True)
+            if (self._state == CircuitState.CLOSED and len(self._outcomes) >= self.min_calls
+                    and self._current_rate() >= self.failure_rate):
+                self._open()
+
+    # --- 호출 래퍼 ---
+    def call(self, fn: Callable[[], T]) -> T:
+        """회로 상태를 확인하고 fn을 실행한 뒤 결과를 기록합니다."""
+        self.before_call()
+        try:
+            result = fn()
+        except Exception as e:
+            self.on_failure(e)
+            raise
+        except BaseException:
+            # 취소(asyncio.CancelledError), KeyboardInterrupt 등은 업스트림 결과가 아니므로 자리만 돌려줍니다.
+            self.release()
+            raise
+        self.on_success()
+        return result
+
+    async def call_async(self, fn: Callable[[], Awaitable[T]]) -> T:
+        """`call`의 비동기 버전."""
+        self.before_call()
+        try:
+            result = await fn()
+        except Exception as e:
+            self.on_failure(e)
+            raise
+        except BaseException:
+            # 헤지 요청에서 진 쪽이나 클라이언트 연결 종료로 취소된 요청은 결과 없이 자리만 돌려줍니다.
+            self.release()
+            raise
+        self.on_success()
+        return result
+
+    @property
+    def state(self) -> CircuitState:
+        with self._lock:
+            return self._state
+
+    def snapshot(self) -> Dict[str, Any]:
+        """현재 상태와 최근 실패율을 반환합니다. (모니터링용)"""
+        with self._lock:
+            retry_in = 0.0
+            if self._state == CircuitState.OPEN:
+                retry_in = max(0.0, self.open_seconds - (time.monotonic() - self._opened_at))
+            return {
+                "name": self.name,
+                "state": self._state.value,
+                "recent_failure_rate": round(self._current_rate(), 3),
+                "recent_calls": len(self._outcomes),
+                "retry_in_seconds": round(retry_in, 1),
+            }
@@ -30,11 +30,22 @@ if not SERVICE_KEY.endswith("=="):
     SERVICE_KEY += "=="
 
 # --- API 엔드포인트 정의 ---
-ENDPOINT = (
-    "http://apis.data.go.kr/1613000/RTMSDataSvcAptTradeDev/"
-    "getRTMSDataSvcAptTradeDev"
+# 벤치마크나 로컬 목(mock) 서버를 사용할 때는 `RTMS_ENDPOINT` 환경 변수로 덮어쓸 수 있습니다.
+ENDPOINT = os.getenv(
+    "RTMS_ENDPOINT",
+    default=(
+        "http://apis.data.go.kr/1613000/RTMSDataSvcAptTradeDev/"
+        "getRTMSDataSvcAptTradeDev"
+    ),
 )
 
+# --- RTMS 페이지 조회 설정 ---
+# 한 페이지에 요청할 행 수와, 2페이지 이후를 동시에 요청할 최대 스레드 수입니다.
+RTMS_PAGE_ROWS = int(os.getenv("RTMS_PAGE_ROWS", "1000"))
+RTMS_PAGE_WORKERS = int(os.getenv("RTMS_PAGE_WORKERS", "8"))
+# 비동기 조회 경로에서 프로세스 전체가 동시에 보낼 수 있는 최대 업스트림 요청 수입니다.
+RTMS_ASYNC_CONCURRENCY = int(os.getenv("RTMS_ASYNC_CONCURRENCY", "32"))
+
 # --- 기타 공통 경로 --- (필요시 사용)
 BASE_DIR = Path(__file__).resolve().parent
 
@@ -45,3 +56,82 @@ LAWD_CODE_FILE = os.getenv(
     "LAWD_CODE_FILE_PATH",
     default=str(BASE_DIR.parent / "법정동코드_전체자료.csv")
 )
+
+# --- 실거래 데이터 로컬 캐시 설정 ---
+# (법정동 코드, 년월) 단위 파티션을 SQLite 파일에 저장합니다.
+# 마감된 달은 변경되지 않는 것으로 간주하고, 이번 달과 지난 달만 짧은 TTL(초)로 만료시킵니다.
+# (프리페치 데몬을 켜면 순회 주기에 맞춰 늘어남 - 아래 프리페치 설정 참고)
+TRADE_CACHE_PATH = os.getenv(
+    "TRADE_CACHE_PATH",
+    default=str(BASE_DIR.parent / "data" / "trade_cache.sqlite3")
+)
+TRADE_CACHE_RECENT_TTL = int(os.getenv("TRADE_CACHE_RECENT_TTL", "1800"))
+
+# --- 업스트림 HTTP 연결 풀 설정 ---
+# 업스트림 호스트(data.go.kr, vworld.kr 등)마다 하나의 keep-alive 연결 풀을 공유합니다.
+HTTP_POOL_SIZE = int(os.getenv("HTTP_POOL_SIZE", "32"))            # 호스트당 최대 유지 연결 수
+HTTP_KEEP_ALIVE = os.getenv("HTTP_KEEP_ALIVE", "1") != "0"         # 0이면 매 요청 후 연결 종료
+HTTP_CONNECT_TIMEOUT = float(os.getenv("HTTP_CONNECT_TIMEOUT", "3.05"))  # 연결 타임아웃(초)
+HTTP_READ_TIMEOUT = float(os.getenv("HTTP_READ_TIMEOUT", "10"))          # 응답 대기 타임아웃(초)
+
+# --- 업스트림 요청 스케줄러 설정 ---
+# 모든 RTMS 요청은 프로세스 전역 토큰 버킷과 일일 쿼터 카운터를 거칩니다.
+RTMS_RATE_PER_SEC = float(os.getenv("RTMS_RATE_PER_SEC", "20"))  # 초당 최대 요청 수
+RTMS_BURST = int(os.getenv("RTMS_BURST", "40"))                   # 순간 허용 요청 수
+RTMS_DAILY_QUOTA = int(os.getenv("RTMS_DAILY_QUOTA", "10000"))    # 인증키별 일일 호출 한도
+# 일일 쿼터 중 백그라운드 작업(프리페치, 백필)이 사용할 수 있는 비율. 나머지는 대화형 요청 몫입니다.
+RTMS_BACKGROUND_QUOTA_SHARE = float(os.getenv("RTMS_BACKGROUND_QUOTA_SHARE", "0.9"))
+RTMS_QUOTA_STATE_PATH = os.getenv(
+    "RTMS_QUOTA_STATE_PATH",
+    default=str(BASE_DIR.parent / "data" / "rtms_quota.json")
+)
+
+# --- 업스트림 재시도 / 헤지 요청 설정 ---
+# 일시적 오류(연결 실패, 타임아웃, 429/5xx)는 지터가 있는 지수 백오프로 재시도합니다.
+RTMS_RETRY_ATTEMPTS = int(os.getenv("RTMS_RETRY_ATTEMPTS", "3"))           # 최초 시도 포함 최대 시도 횟수
+RTMS_RETRY_BASE_DELAY = float(os.getenv("RTMS_RETRY_BASE_DELAY", "0.5"))   # 첫 재시도 최대 대기(초)
+RTMS_RETRY_MAX_DELAY = float(os.getenv("RTMS_RETRY_MAX_DELAY", "8"))       # 재시도 대기 상한(초)
+# 최근 응답 시간의 p95(하한 RTMS_HEDGE_MIN_DELAY초)를 넘긴 페이지 요청은 한 번 더 보내 먼저 온 응답을 씁니다.
+RTMS_HEDGE_ENABLED = os.getenv("RTMS_HEDGE_ENABLED", "1") != "0"
+RTMS_HEDGE_PERCENTILE = float(os.getenv("RTMS_HEDGE_PERCENTILE", "95"))
+RTMS_HEDGE_MIN_DELAY = float(os.getenv("RTMS_HEDGE_MIN_DELAY", "1.0"))
+
+# --- 업스트림 서킷 브레이커 설정 ---
+# 최근 RTMS_CB_WINDOW개 요청 중 실패 비율이 RTMS_CB_FAILURE_RATE 이상이면 회로를 열어
+# RTMS_CB_OPEN_SECONDS초 동안 업스트림 요청을 즉시 실패시키고(만료된 캐시로 대체 응답), 이후 시험 요청으로 회복을 확인합니다.
+RTMS_CB_FAILURE_RATE = float(os.getenv("RTMS_CB_FAILURE_RATE", "0.5"))
+RTMS_CB_WINDOW = int(os.getenv("RTMS_CB_WINDOW", "20"))
+RTMS_CB_MIN_CALLS = int(os.getenv("RTMS_CB_MIN_CALLS", "10"))
+RTMS_CB_OPEN_SECONDS = float(os.getenv("RTMS_CB_OPEN_SECONDS", "30"))
+# 반개방 상태의 시험 요청이 이 시간(초) 안에 끝나지 않으면 자리를 회수하고 새 시험 요청을 허용합니다.
+RTMS_CB_HALF_OPEN_TIMEOUT = float(os.getenv("RTMS_CB_HALF_OPEN_TIMEOUT", "60"))
+
+# --- 다중 지역 조회 설정 ---
+# 시/도 전체 조회처럼 여러 (법정동 코드, 년월) 칸을 한 번에 조회할 때 동시에 처리할 칸 수
+RTMS_GRID_CONCURRENCY = int(os.getenv("RTMS_GRID_CONCURRENCY", "16"))
+
+# --- 최신 월 프리페치 데몬 설정 ---
+# PREFETCH_ENABLED=1이면 서버 시작 시 백그라운드 작업이 전국 시/군/구의 이번 달·지난 달을
+# PREFETCH_INTERVAL초마다 BACKGROUND 우선순위로 다시 조회하여 캐시에 병합합니다.
+PREFETCH_ENABLED = os.getenv("PREFETCH_ENABLED", "0") == "1"
+PREFETCH_INTERVAL = int(os.getenv("PREFETCH_INTERVAL", "10800"))  # 순회 주기(초)
+PREFETCH_WORKERS = int(os.getenv("PREFETCH_WORKERS", "4"))        # 동시에 조회할 (지역, 년월) 수
+# 프리페치가 켜져 있으면 데몬이 갱신한 최신 월이 다음 갱신 전에 만료되지 않도록, 최신 월 TTL을
+# 순회 주기의 2배(순회 소요 시간과, 최근에 조회되어 한 번 건너뛴 파티션까지 감안한 여유) 이상으로 맞춥니다.
+if PREFETCH_ENABLED:
+    TRADE_CACHE_RECENT_TTL = max(TRADE_CACHE_RECENT_TTL, 2 * PREFETCH_INTERVAL)
+
+# --- 조회 결과 저장소 설정 ---
+# /trade-data의 조회 결과를 서버 메모리에 결과 ID로 보관하여, /geocode-trade-history, /forecast, /chat이
+# 거래 데이터 전체 대신 result_id만 받을 수 있게 합니다. 마지막 사용 후 RESULT_STORE_TTL초가 지나거나
+# 전체 크기가 RESULT_STORE_MAX_MB를 넘으면 가장 오래 사용하지 않은 결과부터 제거합니다.
+RESULT_STORE_TTL = int(os.getenv("RESULT_STORE_TTL", "1800"))          # 결과 유효 시간(초)
+RESULT_STORE_MAX_MB = float(os.getenv("RESULT_STORE_MAX_MB", "256"))   # 보관할 결과의 최대 메모리(MB)
+# /trade-data의 limit/cursor 페이지 조회는 보관된 결과를 잘라서 응답합니다. (한 페이지 최대 행 수)
+TRADE_PAGE_MAX_LIMIT = int(os.getenv("TRADE_PAGE_MAX_LIMIT", "10000"))
+
+# --- 대용량 응답 형식 설정 ---
+# /trade-data는 Accept 헤더(또는 format 파라미터)에 따라 JSON 대신 Arrow IPC, Parquet, CSV로 응답합니다.
+# Arrow/Parquet은 pyarrow(requirements.txt에 포함)가 설치된 경우에만 제공합니다.
+PARQUET_COMPRESSION = os.getenv("PARQUET_COMPRESSION", "zstd")   # Parquet 압축 코덱 (zstd, snappy, none 등)
+CSV_CHUNK_ROWS = int(os.getenv("CSV_CHUNK_ROWS", "10000"))       # CSV 스트리밍 시 한 번에 내보낼 행 수
@@ -5,7 +5,7 @@ from __future__ import annotations
 
 import os
 from functools import lru_cache
-from typing import Dict
+from typing import Dict, List, Optional
 from pathlib import Path
 
 import pandas as pd
@@ -107,3 +107,28 @@ def build_lawd_dict() -> Dict[str, Dict[str, str]]:
     for sido, sgg_dict in mapping.items():
         mapping[sido] = dict(sorted(sgg_dict.items()))
     return mapping
+
+# --- 3. 조회 대상 법정동 코드 목록 ---
+@lru_cache(maxsize=32)
+def _district_codes(sido: Optional[str]) -> tuple:
+    table = load_lawd_table()
+    if sido is not None:
+        table = table[table["시도"] == sido]
+        if table.empty:
+            raise KeyError(sido)
+    # 시/도 단위 코드(예: 41000)는 조회 대상이 아닙니다.
+    return tuple(sorted({code for code in table["LAWD_CD"] if not code.endswith("000")}))
+
+
+def district_codes(sido: Optional[str] = None) -> List[str]:
+    """
+    시/도(생략하면 전국)의 모든 시/군/구 법정동 코드(5자리)를 정렬하여 반환합니다.
+
+    `build_lawd_dict()`는 UI용으로 시/군/구 이름마다 코드 하나만 남기므로, 구가 있는 시
+    (예: 수원시의 장안구·권선구·팔달구·영통구)의 코드가 빠집니다. 지역 전체를 조회하는
+    다중 지역 조회, 프리페치, 백필은 이 함수로 원본 표에서 코드 목록을 만듭니다.
+
+    Raises:
+        KeyError: 없는 시/도 이름인 경우.
+    """
+    return list(_district_codes(sido))
@@ -8,6 +8,7 @@ import pandas as pd
 import requests
 import time
 from .config import VWORLD_API_KEY  # config에서 API 키 임포트
+from .http_pool import http_get  # 공유 keep-alive 연결 풀
 
 # --- VWorld API를 이용한 지오코딩 함수 ---
 def _vworld_geocode(address: str) -> tuple[float, float] | None:
@@ -27,7 +28,7 @@ def _vworld_geocode(address: str) -> tuple[float, float] | None:
     }
 
     try:
-        response = requests.get(url, params=params, timeout=10)
+        response = http_get(url, params=params)
         response.raise_for_status()
         json_data = response.json()
         
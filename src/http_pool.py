@@ -0,0 +1,100 @@
+# http_pool.py - 업스트림 HTTP 연결 풀 모듈
+# 업스트림 호스트마다 하나의 requests.Session(keep-alive 연결 풀)을 만들어 프로세스 전역에서 공유합니다.
+# 매 요청마다 새 TCP 연결을 맺는 대신 기존 연결을 재사용하여 핸드셰이크 지연을 줄입니다.
+# 비동기 경로용 httpx.AsyncClient도 이벤트 루프마다 하나씩 공유합니다.
+from __future__ import annotations
+
+import asyncio
+import threading
+import weakref
+from typing import Any, Dict, Tuple
+from urllib.parse import urlsplit
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+
+from .config import HTTP_CONNECT_TIMEOUT, HTTP_KEEP_ALIVE, HTTP_POOL_SIZE, HTTP_READ_TIMEOUT
+
+DEFAULT_TIMEOUT: Tuple[float, float] = (HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT)
+
+_sessions: Dict[str, requests.Session] = {}
+_lock = threading.Lock()
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+
+
+def _new_session() -> requests.Session:
+    session = requests.Session()
+    # 재시도는 호출하는 쪽에서 결정하므로 어댑터 수준의 재시도는 끕니다.
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=HTTP_POOL_SIZE, max_retries=0)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    if not HTTP_KEEP_ALIVE:
+        session.headers["Connection"] = "close"
+    return session
+
+
+def get_session(url: str) -> requests.Session:
+    """
+    URL의 호스트(scheme://host:port)에 해당하는 공유 세션을 반환합니다.
+    처음 요청된 호스트라면 새 연결 풀을 만들어 등록합니다.
+    """
+    parts = urlsplit(url)
+    key = f"{parts.scheme}://{parts.netloc}"
+    session = _sessions.get(key)
+    if session is None:
+        with _lock:
+            session = _sessions.get(key)
+            if session is None:
+                session = _sessions[key] = _new_session()
+    return session
+
+
+def http_get(url: str, params: Dict[str, Any] | None = None,
+             timeout: float | Tuple[float, float] = DEFAULT_TIMEOUT) -> requests.Response:
+    """
+    공유 연결 풀을 통해 GET 요청을 보냅니다. `requests.get`과 같은 방식으로 사용합니다.
+
+    Args:
+        url (str): 요청 URL.
+        params (dict, optional): 쿼리 파라미터.
+        timeout (float | tuple, optional): (연결, 응답) 타임아웃(초). Defaults to DEFAULT_TIMEOUT.
+
+    Returns:
+        requests.Response: 응답 객체.
+    """
+    return get_session(url).get(url, params=params, timeout=timeout)
+
+
+def close_all() -> None:
+    """모든 공유 세션과 연결을 닫습니다. (애플리케이션 종료 시 호출)"""
+    with _lock:
+        for session in _sessions.values():
+            session.close()
+        _sessions.clear()
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """
+    현재 이벤트 루프에서 공유하는 httpx.AsyncClient를 반환합니다.
+    연결 풀 크기, keep-alive, 타임아웃은 동기 세션과 같은 설정을 따릅니다.
+    """
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None:
+        client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=HTTP_POOL_SIZE,
+                max_keepalive_connections=HTTP_POOL_SIZE if HTTP_KEEP_ALIVE else 0,
+            ),
+            timeout=httpx.Timeout(HTTP_READ_TIMEOUT, connect=HTTP_CONNECT_TIMEOUT),
+        )
+        _async_clients[loop] = client
+    return client
+
+
+async def aclose_async_client() -> None:
+    """현재 이벤트 루프의 비동기 클라이언트를 닫습니다. (애플리케이션 종료 시 호출)"""
+    client = _async_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
@@ -0,0 +1,49 @@
+# json_response.py - 데이터프레임 JSON 응답 모듈
+# 데이터프레임을 to_dict(orient="records")로 셀마다 파이썬 객체를 만들고 FastAPI의 jsonable_encoder가
+# 다시 셀마다 변환하는 대신, pandas의 C 구현 JSON 직렬화(DataFrame.to_json)로 컬럼 단위로 바로 바이트를 만듭니다.
+#   - 결측값(NaN, pd.NA, NaT)은 null
+#   - 날짜는 기존 응답과 같은 ISO 형식("2024-01-01T00:00:00")
+#   - float32 면적은 기존 응답과 같이 소수 4자리로 되돌림
+# 별도 의존성(orjson 등) 없이 pandas만으로 동작합니다.
+from __future__ import annotations
+
+import json
+from typing import Any
+
+import numpy as np
+import pandas as pd
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import Response
+
+
+def frame_to_json(df: pd.DataFrame) -> bytes:
+    """데이터프레임을 레코드 배열 JSON([{컬럼: 값}, ...]) 바이트로 직렬화합니다."""
+    if df.empty:
+        return b"[]"
+    float32_columns = [c for c in df.columns if df[c].dtype == np.float32]
+    if float32_columns:
+        df = df.assign(**{c: df[c].astype(np.float64).round(4) for c in float32_columns})
+    return df.to_json(orient="records", date_format="iso", date_unit="s", force_ascii=False).encode("utf-8")
+
+
+def to_json_bytes(obj: Any) -> bytes:
+    """
+    JSON 바이트로 직렬화합니다. 딕셔너리 안의 데이터프레임 값은 `frame_to_json`으로 직렬화하여 끼워 넣으므로,
+    {"type": "month", "rows": df}처럼 데이터프레임을 담은 응답도 행마다 파이썬 객체를 만들지 않습니다.
+    """
+    if isinstance(obj, pd.DataFrame):
+        return frame_to_json(obj)
+    if isinstance(obj, dict):
+        items = (json.dumps(str(k), ensure_ascii=False).encode("utf-8") + b":" + to_json_bytes(v)
+                 for k, v in obj.items())
+        return b"{" + b",".join(items) + b"}"
+    return json.dumps(jsonable_encoder(obj), ensure_ascii=False).encode("utf-8")
+
+
+class DataFrameResponse(Response):
+    """데이터프레임(또는 데이터프레임을 담은 딕셔너리)을 `to_json_bytes`로 직렬화하는 JSON 응답."""
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return to_json_bytes(content)
@@ -2,11 +2,21 @@ from __future__ import annotations
 
 # main.py - 메인 애플리케이션 (FastAPI 백엔드 로직 포함)
 
+import asyncio
 import pandas as pd
 from datetime import datetime
 
-from .district_code_loader import build_lawd_dict
-from .rtms_client import fetch_rtms_range
+from .district_code_loader import build_lawd_dict, district_codes
+from .rtms_client import (
+    FAILED_MONTHS_ATTR,
+    STALE_MONTHS_ATTR,
+    fetch_rtms_range,
+    fetch_rtms_range_async,
+    iter_rtms_multi_async,
+    iter_rtms_range_async,
+)
+from .trade_cache import get_trade_cache
+from .trade_filter import TradeFilter
 from .chatbot_agent import get_df_agent
 from .price_predictor import make_forecast
 from .geocoder import add_coordinates_to_df # 지도 기능 임포트
@@ -21,28 +31,78 @@ def get_trade_data(lawd_cd: str, start_ym: str, end_ym: str,
                    apt_name: str | None = None) -> pd.DataFrame:
     """
     지정된 기간 동안의 실거래가 데이터를 조회하고 필터링합니다.
+    면적·아파트명 조건은 거래 캐시로 넘겨, 캐시에 있는 달은 조건에 맞는 행만 읽습니다.
     """
-    df = fetch_rtms_range(lawd_cd, start_ym, end_ym)
-    if df.empty:
-        return pd.DataFrame()
+    return fetch_rtms_range(lawd_cd, start_ym, end_ym, where=TradeFilter(min_area, max_area, apt_name))
+
+async def get_trade_data_async(lawd_cd: str, start_ym: str, end_ym: str,
+                               min_area: float | None = None, max_area: float | None = None,
+                               apt_name: str | None = None) -> pd.DataFrame:
+    """
+    get_trade_data의 비동기 버전입니다. (FastAPI async 엔드포인트용)
+    """
+    return await fetch_rtms_range_async(lawd_cd, start_ym, end_ym, where=TradeFilter(min_area, max_area, apt_name))
 
-    # Apply area filter
-    if min_area is not None:
-        df = df[df["전용면적(m²)"] >= min_area]
-    if max_area is not None:
-        df = df[df["전용면적(m²)"] <= max_area]
+async def iter_trade_data(lawd_cd: str, start_ym: str, end_ym: str,
+                          min_area: float | None = None, max_area: float | None = None,
+                          apt_name: str | None = None):
+    """
+    기간 내 달이 준비되는 순서대로 필터링된 (년월, 데이터프레임 또는 None, 상태)를 내보냅니다. (스트리밍 응답용)
+    캐시에 있는 달이 먼저, API로 조회하는 달은 완료되는 순서대로 나옵니다.
+    """
+    where = TradeFilter(min_area, max_area, apt_name)
+    async for month in iter_rtms_range_async(lawd_cd, start_ym, end_ym, where=where):
+        yield month
+
+def resolve_lawd_cds(sido: str | None = None, lawd_cds: list[str] | None = None) -> list[str]:
+    """
+    시/도 이름과 법정동 코드 목록을 조회할 법정동 코드 목록으로 합칩니다.
+    시/도 이름은 해당 시/도의 모든 시/군/구 코드(구가 있는 시는 구 코드까지)로 확장되며, 중복 코드는 제거됩니다.
 
-    # Apply apartment name filter
-    if apt_name:
-        df = df[df["아파트"].str.contains(apt_name, case=False, na=False)]
+    Raises:
+        KeyError: 법정동 코드 표에 없는 시/도 이름인 경우.
+    """
+    codes = district_codes(sido) if sido else []
+    codes += [c.strip() for c in lawd_cds or [] if c.strip()]
+    return list(dict.fromkeys(codes))
+
+async def iter_trade_data_multi(lawd_cds: list[str], start_ym: str, end_ym: str,
+                                min_area: float | None = None, max_area: float | None = None,
+                                apt_name: str | None = None):
+    """
+    여러 지역 × 기간을 동시에 조회하면서, 완료된 (법정동 코드, 년월) 칸마다
+    필터링된 (법정동 코드, 년월, 데이터프레임 또는 None, 상태)를 내보냅니다. (스트리밍 응답용)
+    """
+    async for lawd_cd, ym, df, status in iter_rtms_multi_async(lawd_cds, start_ym, end_ym):
+        if df is not None:  # pandas 필터는 이벤트 루프를 막지 않도록 스레드에서 처리
+            df = await asyncio.to_thread(_filter_trades, df, min_area, max_area, apt_name, lawd_cd)
+        yield lawd_cd, ym, df, status
+
+def _filter_trades(df: pd.DataFrame, min_area: float | None, max_area: float | None,
+                   apt_name: str | None, lawd_cd: str | None = None) -> pd.DataFrame:
+    """
+    조회된 실거래 데이터에 면적, 아파트 이름 필터를 적용합니다.
+    아파트 이름은 대소문자를 무시한 부분 일치이며, '^'로 시작하면 접두 일치입니다.
+    단일 지역(lawd_cd)이면 거래 캐시의 아파트명 색인으로 검색합니다.
+    조회에 실패한 년월 목록(attrs["failed_months"])과 만료된 캐시로 대체한 년월 목록(attrs["stale_months"])은
+    필터링 후에도 유지합니다.
+    """
+    status = {key: df.attrs.get(key, []) for key in (FAILED_MONTHS_ATTR, STALE_MONTHS_ATTR)}
+    if df.empty:
+        empty = pd.DataFrame()
+        empty.attrs.update(status)
+        return empty
 
+    index = get_trade_cache().name_index(lawd_cd) if lawd_cd and apt_name else None
+    df = TradeFilter(min_area, max_area, apt_name).apply(df, index)
+    df.attrs.update(status)
     return df
 
-def get_geocoded_data(trade_data: list[dict]) -> pd.DataFrame:
+def get_geocoded_data(trade_data: list[dict] | pd.DataFrame) -> pd.DataFrame:
     """
-    실거래가 데이터에 위도, 경도 좌표를 추가합니다.
+    실거래가 데이터(레코드 리스트 또는 데이터프레임)에 위도, 경도 좌표를 추가합니다.
     """
-    df = pd.DataFrame(trade_data)
+    df = trade_data if isinstance(trade_data, pd.DataFrame) else pd.DataFrame(trade_data)
     if df.empty:
         return pd.DataFrame()
 
@@ -0,0 +1,123 @@
+# name_index.py - 아파트명 n-gram 역색인 모듈
+# 아파트명 필터(apt_name)를 매번 전체 행에 대한 문자열 검색으로 처리하지 않도록,
+# 지역별로 서로 다른 아파트명만 모아 2-gram 역색인과 정렬된 이름 목록을 만들어 둡니다.
+#   - 부분 일치: 검색어의 2-gram 목록(posting)을 교집합한 후보만 실제 문자열로 확인
+#   - 접두 일치: 정렬된 이름 목록에서 이진 탐색
+# 찾은 이름 집합은 데이터프레임의 category 코드로 바꾸어 행을 고르므로, 행마다 문자열을 비교하지 않습니다.
+# 색인은 거래 캐시(trade_cache)에 데이터가 저장될 때 함께 갱신됩니다.
+from __future__ import annotations
+
+import bisect
+import threading
+from typing import Dict, Iterable, List, Optional, Set
+
+import numpy as np
+import pandas as pd
+
+NGRAM = 2  # 아파트명은 짧은 한글 이름이 많아 2-gram이 후보를 가장 잘 줄입니다.
+
+
+def normalize(name: str) -> str:
+    """대소문자를 구분하지 않도록 검색용 키로 정규화합니다."""
+    return name.casefold()
+
+
+def _grams(text: str) -> Set[str]:
+    return {text[i:i + NGRAM] for i in range(len(text) - NGRAM + 1)}
+
+
+class NameIndex:
+    """
+    서로 다른 아파트명 집합에 대한 부분/접두 일치 색인. (스레드 안전)
+
+    이름을 추가만 할 수 있으며, 거래가 삭제되어 더 이상 쓰이지 않는 이름이 남아 있어도
+    검색 결과에 후보가 하나 늘 뿐 필터 결과는 달라지지 않습니다.
+    """
+
+    def __init__(self, names: Iterable[str] = ()):
+        self._lock = threading.Lock()
+        self._keys: Dict[str, Set[str]] = {}      # 정규화된 키 -> 원래 이름들
+        self._postings: Dict[str, Set[str]] = {}  # 2-gram -> 정규화된 키들
+        self._sorted: List[str] = []              # 정규화된 키 (접두 검색용)
+        self._names: Set[str] = set()             # 원래 이름 전체
+        self.add(names)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._names
+
+    def missing(self, names: Iterable[str]) -> Set[str]:
+        """주어진 이름 중 색인에 없는 이름의 집합을 반환합니다."""
+        with self._lock:
+            return set(names) - self._names
+
+    def add(self, names: Iterable[str]) -> int:
+        """새 이름을 색인에 추가하고, 추가된 이름 수를 반환합니다. (None/빈 문자열은 무시)"""
+        added = 0
+        with self._lock:
+            for name in names:
+                if not isinstance(name, str) or not name:
+                    continue
+                key = normalize(name)
+                originals = self._keys.get(key)
+                if originals is None:
+                    originals = self._keys[key] = set()
+                    for gram in _grams(key):
+                        self._postings.setdefault(gram, set()).add(key)
+                    bisect.insort(self._sorted, key)
+                if name not in originals:
+                    originals.add(name)
+                    self._names.add(name)
+                    added += 1
+        return added
+
+    def search(self, query: str) -> Set[str]:
+        """query를 포함하는 이름(대소문자 무시)의 집합을 반환합니다."""
+        query = normalize(query)
+        with self._lock:
+            if len(query) < NGRAM:
+                keys: Iterable[str] = self._keys
+            else:
+                postings = sorted((self._postings.get(g, set()) for g in _grams(query)), key=len)
+                keys = set.intersection(*postings) if postings[0] else ()
+            return {name for key in keys if query in key for name in self._keys[key]}
+
+    def prefix(self, query: str) -> Set[str]:
+        """query로 시작하는 이름(대소문자 무시)의 집합을 반환합니다."""
+        query = normalize(query)
+        with self._lock:
+            lo = bisect.bisect_left(self._sorted, query)
+            hi = bisect.bisect_left(self._sorted, query + "\U0010ffff")
+            return {name for key in self._sorted[lo:hi] for name in self._keys[key]}
+
+    def match(self, pattern: str) -> Set[str]:
+        """'^'로 시작하면 접두 일치, 그 밖에는 부분 일치로 검색합니다."""
+        if pattern.startswith("^"):
+            return self.prefix(pattern[1:])
+        return self.search(pattern)
+
+
+def name_mask(names: pd.Series, pattern: str, index: Optional[NameIndex] = None) -> np.ndarray:
+    """
+    아파트명 컬럼에서 pattern과 일치하는 행의 불리언 마스크를 반환합니다.
+    category 컬럼이면 서로 다른 이름(카테고리)만 검사한 뒤 정수 코드로 행을 고릅니다.
+    index가 주어지면 카테고리 대신 색인으로 검색하고, 색인에 없는 카테고리만 직접 검사합니다.
+    """
+    if not isinstance(names.dtype, pd.CategoricalDtype):
+        names = names.astype("category")
+    categories = names.cat.categories
+    if index is None:
+        index = NameIndex(categories)
+        unknown: Set[str] = set()
+    else:
+        unknown = index.missing(categories)
+    matched = index.match(pattern)
+    if unknown:
+        matched |= NameIndex(unknown).match(pattern)
+    # 카테고리별 일치 여부를 만들고, 행의 코드로 펼칩니다. (결측 코드 -1은 마지막 False 칸을 가리킴)
+    hit = np.zeros(len(categories) + 1, dtype=bool)
+    positions = categories.get_indexer(list(matched))
+    hit[positions[positions >= 0]] = True
+    return hit[names.cat.codes.to_numpy()]
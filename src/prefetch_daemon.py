@@ -0,0 +1,164 @@
+# prefetch_daemon.py - 최신 월 실거래 데이터 프리페치 모듈
+# 신고가 계속 추가되는 이번 달과 지난 달은 캐시 TTL이 짧아, 하루 중 처음 조회하는 사용자가
+# 업스트림 조회 비용을 모두 치르게 됩니다. 이 모듈은 백그라운드 스레드에서 전국 시/군/구를
+# 주기적으로 순회하며 최신 두 달을 BACKGROUND 우선순위로 재검증합니다. 원본 응답이 그대로인 달은
+# 해시 비교만으로 건너뛰고, 바뀐 달만 추가·삭제된 거래를 캐시에 반영합니다.
+#
+# 단독 실행(한 번만 순회): python -m src.prefetch_daemon --once
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from dateutil.relativedelta import relativedelta
+
+from .circuit_breaker import CircuitOpenError
+from .config import PREFETCH_INTERVAL, PREFETCH_WORKERS, TRADE_CACHE_RECENT_TTL
+from .district_code_loader import district_codes
+from .rtms_client import refresh_month
+from .trade_cache import get_trade_cache
+from .upstream_scheduler import Priority, QuotaExceededError
+
+
+def latest_months(count: int = 2, now: datetime | None = None) -> List[str]:
+    """이번 달부터 과거로 count개월의 년월(YYYYMM) 목록을 반환합니다."""
+    now = now or datetime.now()
+    return [(now - relativedelta(months=i)).strftime("%Y%m") for i in range(count)]
+
+
+def all_lawd_cds() -> List[str]:
+    """법정동 코드 전체자료에 있는 모든 시/군/구 코드(구가 있는 시는 구 코드까지)를 중복 없이 반환합니다."""
+    return district_codes()
+
+
+class PrefetchDaemon:
+    """
+    최신 월 프리페치 작업을 주기적으로 실행하는 백그라운드 스레드.
+
+    Args:
+        interval (float): 순회 주기(초).
+        workers (int): 동시에 조회할 (지역, 년월) 수. 실제 요청 속도는 업스트림 스케줄러가 제한합니다.
+        months (int): 이번 달부터 거슬러 올라가 갱신할 개월 수.
+    """
+
+    def __init__(self, interval: float = PREFETCH_INTERVAL, workers: int = PREFETCH_WORKERS, months: int = 2):
+        self.interval = interval
+        self.workers = workers
+        self.months = months
+        # 이 시간 안에 이미 조회된 파티션(대화형 요청 등)은 건너뜁니다.
+        self.min_age = interval / 2
+        self.last_stats: Optional[Dict[str, Any]] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    # --- 1. 한 번 순회 ---
+    def run_cycle(self) -> Dict[str, Any]:
+        """
+        모든 시/군/구 × 최신 월을 한 번 갱신하고 통계를 반환합니다.
+        일일 쿼터(백그라운드 몫)가 소진되거나 서킷 브레이커가 열리면 남은 작업을 건너뜁니다.
+        """
+        started = time.time()
+        targets = [(lawd_cd, ym) for ym in latest_months(self.months) for lawd_cd in all_lawd_cds()]
+        stats = {"targets": len(targets), "refreshed": 0, "unchanged": 0, "changed": 0, "skipped": 0,
+                 "failed": 0, "new_rows": 0, "removed_rows": 0, "aborted": None}
+        lock = threading.Lock()
+        abort = threading.Event()
+
+        def work(target: Tuple[str, str]) -> None:
+            if abort.is_set() or self._stop.is_set():
+                return
+            lawd_cd, ym = target
+            info = get_trade_cache().partition_info(lawd_cd, ym)
+            if info is not None and time.time() - info.fetched_at < self.min_age:
+                with lock:
+                    stats["skipped"] += 1
+                return
+            try:
+                result = refresh_month(lawd_cd, ym, Priority.BACKGROUND)
+            except (QuotaExceededError, CircuitOpenError) as e:
+                if not abort.is_set():
+                    abort.set()
+                    stats["aborted"] = str(e)
+                    print(f"[Prefetch] 순회 중단: {e}")
+                return
+            except Exception as e:
+                print(f"[Prefetch] {lawd_cd} {ym} 실패: {e}")
+                with lock:
+                    stats["failed"] += 1
+                return
+            with lock:
+                stats["refreshed"] += 1
+                stats["changed" if result.changed else "unchanged"] += 1
+                stats["new_rows"] += result.added
+                stats["removed_rows"] += result.removed
+
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="rtms-prefetch") as executor:
+            list(executor.map(work, targets))
+
+        stats["started_at"] = datetime.fromtimestamp(started).isoformat(timespec="seconds")
+        stats["elapsed_seconds"] = round(time.time() - started, 1)
+        self.last_stats = stats
+        print(f"[Prefetch] 완료: {stats}")
+        return stats
+
+    # --- 2. 백그라운드 실행 ---
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.run_cycle()
+            except Exception as e:  # 순회 하나가 실패해도 다음 주기에 다시 시도
+                print(f"[Prefetch] 순회 오류: {e}")
+            self._stop.wait(self.interval)
+
+    def start(self) -> None:
+        """백그라운드 스레드를 시작합니다. 이미 실행 중이면 아무 것도 하지 않습니다."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        if TRADE_CACHE_RECENT_TTL < 2 * self.interval:  # config는 PREFETCH_INTERVAL 기준으로 맞춰 둠
+            print(f"[Prefetch] 경고: TRADE_CACHE_RECENT_TTL({TRADE_CACHE_RECENT_TTL}s)이 순회 주기"
+                  f"({self.interval}s)의 2배보다 짧아, 프리페치한 최신 월이 다음 갱신 전에 만료될 수 있습니다.")
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="rtms-prefetch-daemon", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """진행 중인 조회가 끝나면 멈추도록 신호를 보내고, 최대 timeout초 동안 기다립니다."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+
+_daemon: PrefetchDaemon | None = None
+_daemon_lock = threading.Lock()
+
+
+def get_prefetch_daemon() -> PrefetchDaemon:
+    """프로세스 전역에서 공유하는 프리페치 데몬을 반환합니다. (스레드 안전)"""
+    global _daemon
+    if _daemon is None:
+        with _daemon_lock:
+            if _daemon is None:
+                _daemon = PrefetchDaemon()
+    return _daemon
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="최신 월 실거래 데이터 프리페치")
+    parser.add_argument("--once", action="store_true", help="한 번만 순회하고 종료")
+    args = parser.parse_args()
+
+    daemon = get_prefetch_daemon()
+    if args.once:
+        daemon.run_cycle()
+    else:
+        daemon.start()
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            daemon.stop()
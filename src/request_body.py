@@ -0,0 +1,109 @@
+# request_body.py - 거래 데이터 POST 요청 본문 모듈
+# /geocode-trade-history, /forecast, /chat의 trade_data를 pydantic이 행(dict)마다 검증한 뒤
+# pd.DataFrame(list[dict])로 다시 복사하는 대신, 요청 본문에서 바로 데이터프레임을 만듭니다.
+#   - JSON 본문: trade_data는 행 배열([{컬럼: 값}, ...]) 또는 컬럼 배열({컬럼: [값, ...]}) 모두 가능.
+#     trade_data를 뺀 나머지 필드(result_id, periods, question 등)만 요청 모델로 검증합니다.
+#   - Arrow IPC 본문(application/vnd.apache.arrow.stream): 본문 전체가 거래 데이터이고,
+#     나머지 필드는 쿼리 파라미터로 받습니다. (pyarrow 필요)
+from __future__ import annotations
+
+import json
+from typing import Any, Dict, Mapping, Optional, Tuple, Type, TypeVar
+
+import pandas as pd
+from fastapi import HTTPException, Request
+from fastapi.exceptions import RequestValidationError
+from pydantic import BaseModel, ValidationError
+from starlette.concurrency import run_in_threadpool
+
+from .bulk_response import FORMAT_ARROW, HAVE_PYARROW, MEDIA_TYPES, frame_from_arrow
+
+TRADE_DATA_FIELD = "trade_data"
+ARROW_MEDIA_TYPE = MEDIA_TYPES[FORMAT_ARROW]
+
+M = TypeVar("M", bound=BaseModel)
+
+
+def _invalid(loc: Tuple, msg: str, value: Any = None) -> RequestValidationError:
+    """FastAPI의 요청 검증 오류(422)와 같은 형식의 오류를 만듭니다."""
+    return RequestValidationError([{"type": "value_error", "loc": ("body", *loc), "msg": msg, "input": value}])
+
+
+def frame_from_payload(trade_data: Any) -> Optional[pd.DataFrame]:
+    """
+    JSON으로 받은 trade_data를 데이터프레임으로 만듭니다.
+    행 배열과 컬럼 배열을 모두 받으며, 컬럼 배열은 컬럼마다 리스트 하나만 변환하므로 행 배열보다 빠릅니다.
+    """
+    if trade_data is None:
+        return None
+    if isinstance(trade_data, list):
+        if not all(isinstance(row, dict) for row in trade_data):
+            raise _invalid((TRADE_DATA_FIELD,), "trade_data의 각 행은 객체여야 합니다.")
+        return pd.DataFrame.from_records(trade_data)
+    if isinstance(trade_data, dict):
+        if not all(isinstance(values, list) for values in trade_data.values()):
+            raise _invalid((TRADE_DATA_FIELD,), "컬럼 형식 trade_data의 각 값은 배열이어야 합니다.")
+        try:
+            return pd.DataFrame(trade_data)
+        except ValueError as e:  # 컬럼 길이가 서로 다름
+            raise _invalid((TRADE_DATA_FIELD,), f"컬럼 형식 trade_data를 변환할 수 없습니다: {e}")
+    raise _invalid((TRADE_DATA_FIELD,), "trade_data는 행 배열 또는 컬럼 배열 객체여야 합니다.", trade_data)
+
+
+def _validate(model: Type[M], fields: Mapping[str, Any]) -> M:
+    try:
+        return model.model_validate(fields)
+    except ValidationError as e:
+        errors = [{**err, "loc": ("body", *err["loc"])} for err in e.errors(include_url=False, include_context=False)]
+        raise RequestValidationError(errors, body=fields)
+
+
+def parse_trade_body(body: bytes, content_type: str, query: Mapping[str, str],
+                     model: Type[M]) -> Tuple[M, Optional[pd.DataFrame]]:
+    """
+    요청 본문을 (trade_data를 제외한 요청 모델, 거래 데이터프레임 또는 None)으로 파싱합니다.
+
+    Raises:
+        RequestValidationError: JSON 형식이나 필드가 잘못된 경우. (422)
+        HTTPException: 지원하지 않는 Content-Type이거나 Arrow 본문이 잘못된 경우. (415/400)
+    """
+    media_type = content_type.split(";")[0].strip().lower()
+    if media_type == ARROW_MEDIA_TYPE:
+        if not HAVE_PYARROW:
+            raise HTTPException(status_code=415, detail="이 서버는 Arrow 요청 본문을 지원하지 않습니다. (pyarrow 없음)")
+        try:
+            df = frame_from_arrow(body)
+        except Exception as e:  # pa.ArrowInvalid 등 잘못된 스트림
+            raise HTTPException(status_code=400, detail=f"Arrow 요청 본문을 읽을 수 없습니다: {e}")
+        return _validate(model, dict(query)), df
+    if media_type not in ("", "application/json") and not media_type.endswith("+json"):
+        raise HTTPException(status_code=415, detail=f"지원하는 Content-Type: application/json, {ARROW_MEDIA_TYPE}")
+    try:
+        payload = json.loads(body) if body else {}
+    except json.JSONDecodeError as e:
+        raise RequestValidationError([{"type": "json_invalid", "loc": ("body", e.pos), "msg": "JSON decode error",
+                                       "input": {}, "ctx": {"error": e.msg}}])
+    if not isinstance(payload, dict):
+        raise _invalid((), "요청 본문은 JSON 객체여야 합니다.")
+    df = frame_from_payload(payload.pop(TRADE_DATA_FIELD, None))
+    return _validate(model, payload), df
+
+
+def trade_body(model: Type[M]):
+    """
+    요청 모델(model)에 대한 FastAPI 의존성을 만듭니다. 의존성은 (요청 모델, 거래 데이터프레임)을 반환합니다.
+    본문 읽기만 비동기로 처리하므로, 엔드포인트는 기존처럼 동기 함수(스레드 풀)로 둘 수 있습니다.
+    수만 행 본문의 파싱은 이벤트 루프를 막지 않도록 스레드 풀에서 실행합니다.
+    """
+    async def dependency(request: Request) -> Tuple[M, Optional[pd.DataFrame]]:
+        return await run_in_threadpool(parse_trade_body, await request.body(),
+                                       request.headers.get("content-type", ""), request.query_params, model)
+    return dependency
+
+
+def trade_body_openapi(model: Type[BaseModel]) -> Dict[str, Any]:
+    """의존성으로 읽는 본문은 OpenAPI 문서에 자동으로 나타나지 않으므로, 요청 본문 스키마를 직접 기술합니다."""
+    return {"requestBody": {"required": True, "content": {
+        "application/json": {"schema": model.model_json_schema()},
+        ARROW_MEDIA_TYPE: {"schema": {"type": "string", "format": "binary"}},
+    }}}
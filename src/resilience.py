@@ -0,0 +1,187 @@
+# resilience.py - 업스트림 요청 재시도 및 헤지(hedged) 요청 모듈
+# 일시적인 네트워크 오류/5xx 응답은 지터(jitter)가 있는 지수 백오프로 제한된 횟수만큼 재시도하고,
+# 최근 응답 시간의 p95보다 오래 걸리는 요청은 같은 요청을 하나 더 보내(헤지) 먼저 끝난 결과를 사용합니다.
+# 동기(스레드) 경로와 비동기(asyncio) 경로를 모두 지원합니다.
+from __future__ import annotations
+
+import asyncio
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Executor, wait
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Optional, TypeVar
+
+import httpx
+import requests
+
+from .rtms_parser import ParseError
+
+T = TypeVar("T")
+
+
+# --- 1. 재시도 정책 ---
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    재시도 정책.
+
+    Args:
+        attempts (int): 최초 시도를 포함한 최대 시도 횟수.
+        base_delay (float): 첫 재시도 전 최대 대기 시간(초). 시도마다 2배씩 늘어납니다.
+        max_delay (float): 재시도 대기 시간의 상한(초).
+    """
+
+    attempts: int = 3
+    base_delay: float = 0.5
+    max_delay: float = 8.0
+
+    def backoff(self, attempt: int) -> float:
+        """'full jitter' 방식: 0 ~ min(max_delay, base_delay * 2^attempt) 사이의 임의 시간."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+
+def is_retryable(exc: BaseException) -> bool:
+    """
+    일시적인 오류인지 판단합니다.
+    연결 실패, 타임아웃, 잘린 응답(XML 파싱 실패), HTTP 429/5xx는 재시도하고
+    그 밖의 4xx, API 오류 메시지, 쿼터 소진은 재시도하지 않습니다.
+    """
+    if isinstance(exc, (requests.exceptions.ConnectionError, requests.exceptions.Timeout,
+                        httpx.TransportError, ParseError)):
+        return True
+    if isinstance(exc, (requests.exceptions.HTTPError, httpx.HTTPStatusError)):
+        status = exc.response.status_code if exc.response is not None else 0
+        return status == 429 or status >= 500
+    return False
+
+
+def retry_call(fn: Callable[[], T], policy: RetryPolicy) -> T:
+    """fn을 호출하고, 재시도 가능한 오류이면 백오프 후 다시 호출합니다. 마지막 오류는 그대로 전파됩니다."""
+    for attempt in range(policy.attempts):
+        try:
+            return fn()
+        except Exception as e:
+            if attempt == policy.attempts - 1 or not is_retryable(e):
+                raise
+            delay = policy.backoff(attempt)
+            print(f"[Retry] {type(e).__name__}: {e} (attempt {attempt + 1}/{policy.attempts}, wait {delay:.2f}s)")
+            time.sleep(delay)
+    raise AssertionError("unreachable")
+
+
+async def retry_call_async(fn: Callable[[], Awaitable[T]], policy: RetryPolicy) -> T:
+    """`retry_call`의 비동기 버전."""
+    for attempt in range(policy.attempts):
+        try:
+            return await fn()
+        except Exception as e:
+            if attempt == policy.attempts - 1 or not is_retryable(e):
+                raise
+            delay = policy.backoff(attempt)
+            print(f"[Retry] {type(e).__name__}: {e} (attempt {attempt + 1}/{policy.attempts}, wait {delay:.2f}s)")
+            await asyncio.sleep(delay)
+    raise AssertionError("unreachable")
+
+
+# --- 2. 응답 시간 추적 ---
+class LatencyTracker:
+    """
+    최근 성공한 요청들의 응답 시간을 보관하고, 헤지 요청을 보낼 기준 시간을 계산합니다.
+
+    Args:
+        percentile (float): 헤지 기준 백분위수 (예: 95).
+        min_delay (float): 헤지 기준 시간의 하한(초). 빠른 요청까지 중복 전송하지 않도록 합니다.
+        window (int): 보관할 최근 표본 수.
+        min_samples (int): 이 수만큼 표본이 쌓이기 전에는 헤지하지 않습니다.
+    """
+
+    def __init__(self, percentile: float = 95, min_delay: float = 1.0, window: int = 200, min_samples: int = 20):
+        self.percentile = percentile
+        self.min_delay = min_delay
+        self.min_samples = min_samples
+        self._samples: deque[float] = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float) -> None:
+        with self._lock:
+            self._samples.append(seconds)
+
+    def hedge_delay(self) -> Optional[float]:
+        """헤지 요청을 보낼 때까지 기다릴 시간(초). 표본이 부족하면 None(헤지 안 함)."""
+        with self._lock:
+            if len(self._samples) < self.min_samples:
+                return None
+            ordered = sorted(self._samples)
+        idx = min(len(ordered) - 1, int(len(ordered) * self.percentile / 100))
+        return max(self.min_delay, ordered[idx])
+
+
+def _timed(fn: Callable[[], T], tracker: LatencyTracker) -> T:
+    start = time.perf_counter()
+    result = fn()
+    tracker.record(time.perf_counter() - start)
+    return result
+
+
+# --- 3. 헤지 요청 ---
+def hedged_call(fn: Callable[[], T], executor: Executor, tracker: LatencyTracker) -> T:
+    """
+    fn을 실행하다가 헤지 기준 시간을 넘기면 같은 호출을 하나 더 실행하고, 먼저 성공한 결과를 반환합니다.
+    두 호출이 모두 실패하면 먼저 실패한 쪽의 예외를 전파합니다.
+    (스레드는 강제로 멈출 수 없으므로 늦게 끝난 호출의 결과는 버려집니다.)
+    """
+    delay = tracker.hedge_delay()
+    if delay is None:
+        return _timed(fn, tracker)
+
+    primary = executor.submit(_timed, fn, tracker)
+    done, _ = wait([primary], timeout=delay)
+    if done:
+        return primary.result()
+
+    print(f"[Hedge] 요청이 {delay:.2f}s를 넘겨 헤지 요청을 보냅니다.")
+    pending = {primary, executor.submit(_timed, fn, tracker)}
+    first_error: Optional[BaseException] = None
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            if future.exception() is None:
+                return future.result()
+            first_error = first_error or future.exception()
+    raise first_error  # type: ignore[misc]
+
+
+async def hedged_call_async(fn: Callable[[], Awaitable[T]], tracker: LatencyTracker) -> T:
+    """`hedged_call`의 비동기 버전. 먼저 성공한 쪽이 나오면 나머지 요청은 취소합니다."""
+
+    async def timed() -> Any:
+        start = time.perf_counter()
+        result = await fn()
+        tracker.record(time.perf_counter() - start)
+        return result
+
+    delay = tracker.hedge_delay()
+    if delay is None:
+        return await timed()
+
+    primary = asyncio.ensure_future(timed())
+    done, _ = await asyncio.wait({primary}, timeout=delay)
+    if done:
+        return primary.result()
+
+    print(f"[Hedge] 요청이 {delay:.2f}s를 넘겨 헤지 요청을 보냅니다.")
+    pending = {primary, asyncio.ensure_future(timed())}
+    first_error: Optional[BaseException] = None
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    return task.result()
+                first_error = first_error or task.exception()
+        raise first_error  # type: ignore[misc]
+    finally:
+        for task in pending:
+            task.cancel()
@@ -0,0 +1,122 @@
+# result_store.py - 조회 결과 저장소 모듈
+# /trade-data로 조회한 결과 데이터프레임을 서버 메모리에 결과 ID로 보관합니다.
+# 프론트엔드는 같은 거래 데이터를 /geocode-trade-history, /forecast, /chat에 다시 올려 보내는 대신
+# 결과 ID만 보내고, 서버는 JSON 파싱·검증 없이 보관된 데이터프레임을 바로 사용합니다.
+#   - 마지막 사용 후 TTL이 지난 결과는 제거합니다.
+#   - 전체 메모리 사용량이 한도를 넘으면 가장 오래 사용하지 않은 결과(LRU)부터 제거합니다.
+from __future__ import annotations
+
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+import pandas as pd
+
+from .config import RESULT_STORE_MAX_MB, RESULT_STORE_TTL
+
+
+@dataclass
+class _Entry:
+    df: pd.DataFrame
+    nbytes: int
+    expires_at: float
+
+
+class ResultStore:
+    """
+    TTL과 메모리 한도가 있는 조회 결과 저장소. (스레드 안전)
+
+    보관된 데이터프레임은 여러 요청이 함께 보므로, `get()`은 사본을 반환합니다.
+
+    Args:
+        ttl (float): 마지막 사용 후 결과를 보관하는 시간(초).
+        max_bytes (int): 보관할 결과의 최대 메모리(바이트). 한도를 넘는 결과 하나는 보관하지 않습니다.
+    """
+
+    def __init__(self, ttl: float = RESULT_STORE_TTL, max_bytes: int = int(RESULT_STORE_MAX_MB * 1024 * 1024)):
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()  # 오래 사용하지 않은 순서
+        self._bytes = 0
+        self._evicted = 0
+        self._lock = threading.Lock()
+
+    def put(self, df: pd.DataFrame) -> Optional[str]:
+        """결과를 보관하고 결과 ID를 반환합니다. 결과 하나가 메모리 한도보다 크면 보관하지 않고 None."""
+        nbytes = int(df.memory_usage(index=True, deep=True).sum())
+        if nbytes > self.max_bytes:
+            return None
+        result_id = uuid.uuid4().hex
+        with self._lock:
+            self._entries[result_id] = _Entry(df, nbytes, time.monotonic() + self.ttl)
+            self._bytes += nbytes
+            self._evict()
+        return result_id
+
+    def get(self, result_id: str) -> Optional[pd.DataFrame]:
+        """결과의 사본을 반환하고 유효 시간을 연장합니다. 없거나 만료되었으면 None."""
+        with self._lock:
+            self._evict()
+            entry = self._entries.get(result_id)
+            if entry is None:
+                return None
+            entry.expires_at = time.monotonic() + self.ttl
+            self._entries.move_to_end(result_id)
+            df = entry.df
+        return df.copy()
+
+    def page(self, result_id: str, start: int, stop: int) -> Optional[Tuple[pd.DataFrame, int]]:
+        """
+        결과의 [start, stop) 행 사본과 전체 행 수를 반환하고 유효 시간을 연장합니다. 없거나 만료되었으면 None.
+        페이지 조회는 요청한 행만 복사하므로, 결과 전체를 복사하는 `get()`보다 요청당 메모리가 작습니다.
+        """
+        with self._lock:
+            self._evict()
+            entry = self._entries.get(result_id)
+            if entry is None:
+                return None
+            entry.expires_at = time.monotonic() + self.ttl
+            self._entries.move_to_end(result_id)
+            df = entry.df
+        return df.iloc[start:stop].copy(), len(df)
+
+    def _evict(self) -> None:
+        """만료된 결과와, 메모리 한도를 넘는 만큼 오래 사용하지 않은 결과를 제거합니다. (락 안에서 호출)"""
+        now = time.monotonic()
+        while self._entries:
+            result_id, entry = next(iter(self._entries.items()))
+            # 사용할 때마다 맨 뒤로 옮기고 TTL이 같으므로, 맨 앞 결과가 가장 먼저 만료됩니다.
+            if entry.expires_at > now and self._bytes <= self.max_bytes:
+                break
+            del self._entries[result_id]
+            self._bytes -= entry.nbytes
+            self._evicted += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """보관 중인 결과 수, 메모리 사용량, 누적 제거 수를 반환합니다. (모니터링용)"""
+        with self._lock:
+            self._evict()
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "evicted": self._evicted,
+                "ttl_seconds": self.ttl,
+            }
+
+
+_store: ResultStore | None = None
+_store_lock = threading.Lock()
+
+
+def get_result_store() -> ResultStore:
+    """프로세스 전역에서 공유하는 ResultStore 인스턴스를 반환합니다. (스레드 안전)"""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = ResultStore()
+    return _store
@@ -2,85 +2,291 @@
 # RTMS(Real Estate Transaction Management System) API로부터 아파트 매매 실거래 데이터를
 # 요청하고, 결과를 Pandas DataFrame으로 정제하여 반환합니다.
 # API 요청은 병렬로 처리하여 응답 속도를 최적화합니다.
+# 동기(스레드) 경로와 FastAPI용 비동기(asyncio) 경로를 함께 제공합니다.
 from __future__ import annotations
 
-import xml.etree.ElementTree as ET
+import asyncio
+import hashlib
+import math
+import re
+import weakref
 from datetime import datetime
-from typing import Any, Dict, List
+from typing import Any, AsyncIterator, Awaitable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import pandas as pd
 import requests
 from dateutil.relativedelta import relativedelta
 
-from .config import ENDPOINT, SERVICE_KEY
+from .config import (
+    ENDPOINT,
+    RTMS_ASYNC_CONCURRENCY,
+    RTMS_CB_FAILURE_RATE,
+    RTMS_CB_HALF_OPEN_TIMEOUT,
+    RTMS_CB_MIN_CALLS,
+    RTMS_CB_OPEN_SECONDS,
+    RTMS_CB_WINDOW,
+    RTMS_GRID_CONCURRENCY,
+    RTMS_HEDGE_ENABLED,
+    RTMS_HEDGE_MIN_DELAY,
+    RTMS_HEDGE_PERCENTILE,
+    RTMS_PAGE_ROWS,
+    RTMS_PAGE_WORKERS,
+    RTMS_RETRY_ATTEMPTS,
+    RTMS_RETRY_BASE_DELAY,
+    RTMS_RETRY_MAX_DELAY,
+    SERVICE_KEY,
+)
+from .circuit_breaker import CircuitBreaker, CircuitOpenError
+from .http_pool import get_async_client, http_get
+from .resilience import (
+    LatencyTracker,
+    RetryPolicy,
+    hedged_call,
+    hedged_call_async,
+    is_retryable,
+    retry_call,
+    retry_call_async,
+)
+from .rtms_parser import Columns, ParseError, columns_to_frame, empty_columns, merge_columns, parse_page
+from .singleflight import AsyncSingleFlight, SingleFlight
+from .trade_cache import get_trade_cache
+from .trade_filter import TradeFilter
+from .trade_schema import concat_trades
+from .upstream_scheduler import Priority, QuotaExceededError, get_scheduler
+
+class RtmsApiError(Exception):
+    """API가 정상 HTTP 응답 안에 오류 결과 메시지(resultMsg != OK)를 돌려준 경우 발생합니다."""
+
+
+# 2페이지 이후의 요청을 처리하는 공용 스레드 풀.
+# fetch_rtms_range의 월 단위 스레드 풀과 분리하여, 월 작업이 페이지 작업을 기다리며
+# 스레드를 모두 점유하는 교착 상태를 방지합니다.
+_PAGE_EXECUTOR = ThreadPoolExecutor(max_workers=RTMS_PAGE_WORKERS, thread_name_prefix="rtms-page")
+
+# 헤지(중복) 요청을 실행하는 스레드 풀과 재시도 정책, 페이지 응답 시간 추적기
+_HEDGE_EXECUTOR = ThreadPoolExecutor(max_workers=RTMS_PAGE_WORKERS * 4, thread_name_prefix="rtms-hedge")
+_RETRY_POLICY = RetryPolicy(RTMS_RETRY_ATTEMPTS, RTMS_RETRY_BASE_DELAY, RTMS_RETRY_MAX_DELAY)
+_page_latency = LatencyTracker(RTMS_HEDGE_PERCENTILE, RTMS_HEDGE_MIN_DELAY)
+
+# 업스트림 서킷 브레이커. 재시도 대상 오류(연결 실패, 타임아웃, 429/5xx)만 장애로 집계합니다.
+# 회로가 열려 있는 동안 페이지 요청은 토큰/쿼터를 쓰지 않고 CircuitOpenError로 즉시 실패합니다.
+_breaker = CircuitBreaker(
+    "rtms", RTMS_CB_FAILURE_RATE, RTMS_CB_WINDOW, RTMS_CB_MIN_CALLS, RTMS_CB_OPEN_SECONDS,
+    half_open_timeout=RTMS_CB_HALF_OPEN_TIMEOUT, is_failure=is_retryable,
+)
+
+# 한 달치 원본 응답(모든 페이지)의 해시를 조회 결과 데이터프레임의 attrs에 기록하는 키.
+# 캐시 파티션에 함께 저장되어, 최근 달을 재검증할 때 응답이 바뀌지 않았으면 파싱과 저장을 생략합니다.
+CONTENT_HASH_ATTR = "content_hash"
+
+# 조회 결과 데이터프레임의 attrs에 조회 실패한 년월 목록을 기록하는 키
+FAILED_MONTHS_ATTR = "failed_months"
+# 업스트림 조회에 실패하여 만료된 캐시 데이터로 대신 채운 년월 목록을 기록하는 키 (degraded mode)
+STALE_MONTHS_ATTR = "stale_months"
+
+# 월 단위 조회 결과 상태: 정상 조회(캐시 포함) / 만료된 캐시로 대체 / 조회 실패
+CELL_OK, CELL_STALE, CELL_FAILED = "ok", "stale", "failed"
+# 다중 지역 조회 결과에 추가되는 법정동 코드 컬럼
+LAWD_COLUMN = "법정동코드"
+
+# 같은 (법정동 코드, 년월, 행 수, 시작 페이지, 우선순위) 조회가 동시에 들어오면 업스트림 요청을 한 번만 보냅니다.
+# 우선순위가 다른 호출은 병합하지 않습니다. 대화형 요청이 프리페치·백필(BACKGROUND) 리더를 기다리면
+# 리더가 토큰을 양보하거나 백그라운드 쿼터 몫 소진으로 거절될 때 사용자 요청도 함께 지연·실패하기 때문입니다.
+_month_flight = SingleFlight()
+_month_flight_async = AsyncSingleFlight()
 
 # --- 1. 단일 월 데이터 요청 함수 ---
-def fetch_rtms(lawd_cd: str, deal_ymd: str, rows: int = 1000, page: int = 1) -> pd.DataFrame:
+def _page_params(lawd_cd: str, deal_ymd: str, rows: int, page: int) -> Dict[str, Any]:
+    """API 요청 파라미터를 생성합니다."""
+    return {
+        "serviceKey": SERVICE_KEY,  # 인증키
+        "LAWD_CD": lawd_cd,         # 법정동 코드
+        "DEAL_YMD": deal_ymd,       # 조회년월
+        "numOfRows": rows,          # 행 수
+        "pageNo": page,             # 페이지 번호
+    }
+
+
+def _parse_page(content: bytes, deal_ymd: str, page: int) -> Tuple[Columns, int]:
+    """
+    API 응답 XML을 스트리밍 파서로 읽어 (필드별 컬럼, 전체 건수 totalCount)를 반환합니다.
+    동기/비동기 조회 경로가 함께 사용합니다.
+    """
+    result = parse_page(content)
+    # API 응답 헤더의 결과 메시지 확인
+    if result.result_msg != "OK":
+        msg = result.result_msg or "Unknown API error"
+        raise RtmsApiError(f"{deal_ymd} (page {page}): {msg}")
+    return result.columns, result.total_count
+
+
+_RESULT_MSG_RE = re.compile(rb"<resultMsg>([^<]*)</resultMsg>")
+_TOTAL_COUNT_RE = re.compile(rb"<totalCount>\s*(\d+)\s*</totalCount>")
+
+
+def _scan_header(content: bytes, deal_ymd: str, page: int) -> int:
+    """
+    item을 파싱하지 않고 응답 헤더(resultMsg, totalCount)만 정규식으로 읽어 totalCount를 반환합니다.
+    헤더를 찾지 못하면 전체 파싱으로 오류 원인을 확인합니다.
+    """
+    msg, total = _RESULT_MSG_RE.search(content), _TOTAL_COUNT_RE.search(content)
+    if msg is None or total is None:
+        return _parse_page(content, deal_ymd, page)[1]
+    if msg.group(1) != b"OK":
+        raise RtmsApiError(f"{deal_ymd} (page {page}): {msg.group(1).decode('utf-8', 'replace')}")
+    return int(total.group(1))
+
+
+class _Page(NamedTuple):
+    """한 페이지의 조회 결과. parse=False로 요청하면 columns는 None입니다."""
+
+    columns: Optional[Columns]
+    total_count: int
+    content: bytes
+
+
+def _read_page(content: bytes, deal_ymd: str, page: int, parse: bool) -> _Page:
+    if parse:
+        columns, total_count = _parse_page(content, deal_ymd, page)
+        return _Page(columns, total_count, content)
+    return _Page(None, _scan_header(content, deal_ymd, page), content)
+
+
+def _content_hash(pages: List[_Page]) -> str:
+    """페이지 순서대로 이어 붙인 원본 응답의 SHA-256 해시."""
+    digest = hashlib.sha256()
+    for p in pages:
+        digest.update(p.content)
+    return digest.hexdigest()
+
+
+def _last_page(total_count: int, rows: int, page: int) -> int:
+    """totalCount와 페이지당 행 수로 마지막 페이지 번호를 계산합니다."""
+    return max(page, math.ceil(total_count / rows)) if rows > 0 else page
+
+
+def _request_page_once(lawd_cd: str, deal_ymd: str, rows: int, page: int,
+                       priority: Priority = Priority.INTERACTIVE, parse: bool = True) -> _Page:
+    """
+    API에 한 페이지를 한 번 요청하고, (필드별 컬럼, 전체 건수 totalCount, 원본 응답)을 반환합니다.
+    parse=False이면 item을 파싱하지 않고 헤더만 확인합니다. (변경 여부 확인용)
+    요청 전에 업스트림 스케줄러에서 토큰을 받아 속도 제한과 일일 쿼터를 지킵니다.
+
+    요청 결과는 서킷 브레이커에 기록되며, 회로가 열려 있으면 요청을 보내지 않습니다.
+
+    Raises:
+        requests.exceptions.RequestException: 네트워크/HTTP 오류.
+        ParseError: 응답 XML 파싱 실패.
+        RtmsApiError: API가 오류 결과 메시지를 반환한 경우.
+        QuotaExceededError: 일일 호출 쿼터를 모두 사용한 경우.
+        CircuitOpenError: 서킷 브레이커가 열려 있는 경우.
+    """
+    def request() -> _Page:
+        get_scheduler().acquire(priority)
+        # 공유 keep-alive 연결 풀을 통해 API 요청
+        res = http_get(ENDPOINT, params=_page_params(lawd_cd, deal_ymd, rows, page))
+        res.raise_for_status()  # HTTP 오류 발생 시 예외 발생
+        return _read_page(res.content, deal_ymd, page, parse)
+
+    return _breaker.call(request)
+
+
+def _request_page(lawd_cd: str, deal_ymd: str, rows: int, page: int,
+                  priority: Priority = Priority.INTERACTIVE, parse: bool = True) -> _Page:
+    """
+    `_request_page_once`에 재시도(지터 백오프)와 헤지 요청을 더한 페이지 요청 함수입니다.
+    재시도 후에도 실패하면 마지막 오류를 전파합니다.
+    """
+    def once() -> _Page:
+        return _request_page_once(lawd_cd, deal_ymd, rows, page, priority, parse)
+
+    if not RTMS_HEDGE_ENABLED:
+        return retry_call(once, _RETRY_POLICY)
+    return retry_call(lambda: hedged_call(once, _HEDGE_EXECUTOR, _page_latency), _RETRY_POLICY)
+
+
+def _fetch_pages(lawd_cd: str, deal_ymd: str, rows: int = RTMS_PAGE_ROWS, page: int = 1,
+                 priority: Priority = Priority.INTERACTIVE, parse: bool = True) -> List[_Page]:
+    """한 달치의 모든 페이지를 페이지 순서대로 조회합니다. 2페이지 이후는 병렬로 요청합니다."""
+    # 첫 페이지를 요청하여 전체 건수(totalCount)를 확인
+    first = _request_page(lawd_cd, deal_ymd, rows, page, priority, parse)
+    last_page = _last_page(first.total_count, rows, page)
+
+    # 남은 페이지를 병렬로 요청하고, 제출 순서(페이지 순서)대로 결과를 모음
+    futures = [
+        _PAGE_EXECUTOR.submit(_request_page, lawd_cd, deal_ymd, rows, p, priority, parse)
+        for p in range(page + 1, last_page + 1)
+    ]
+    return [first, *(future.result() for future in futures)]
+
+
+def _pages_to_frame(pages: List[_Page], deal_ymd: str) -> pd.DataFrame:
+    """
+    페이지들을 병합하여 거래일 순으로 정렬된 데이터프레임을 만들고, 원본 응답 해시를 attrs에 기록합니다.
+    파싱하지 않고 받은 페이지(columns=None)는 여기서 파싱합니다.
+    """
+    columns = empty_columns()
+    for i, p in enumerate(pages, start=1):
+        merge_columns(columns, p.columns if p.columns is not None else _parse_page(p.content, deal_ymd, i)[0])
+    df = _sort_by_date(columns_to_frame(columns))
+    df.attrs[CONTENT_HASH_ATTR] = _content_hash(pages)
+    return df
+
+
+def _fetch_month(lawd_cd: str, deal_ymd: str, rows: int = RTMS_PAGE_ROWS, page: int = 1,
+                 priority: Priority = Priority.INTERACTIVE) -> pd.DataFrame:
+    """
+    한 달치 데이터를 모든 페이지에 걸쳐 조회합니다. 오류를 삼키지 않고 그대로 전파하므로,
+    호출자가 '거래가 없는 달'과 '조회에 실패한 달'을 구분할 수 있습니다(캐시 저장 여부 판단에 사용).
+    원본 응답 해시는 `df.attrs["content_hash"]`에 기록됩니다.
+    """
+    return _pages_to_frame(_fetch_pages(lawd_cd, deal_ymd, rows, page, priority), deal_ymd)
+
+
+def _sort_by_date(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    한 달치 데이터를 거래일 순으로 정렬합니다. 달마다 미리 정렬해 두면(캐시에도 이 순서로 저장)
+    여러 달을 년월 순으로 이어 붙이는 것만으로 전체가 거래일 순이 됩니다.
+    """
+    if df.empty:
+        return df
+    return df.sort_values(by="거래일", kind="stable", ignore_index=True)
+
+
+def fetch_rtms(lawd_cd: str, deal_ymd: str, rows: int = RTMS_PAGE_ROWS, page: int = 1,
+               priority: Priority = Priority.INTERACTIVE) -> pd.DataFrame:
     """
     특정 지역(법정동 코드)의 한 달치 실거래 데이터를 API로부터 조회합니다.
 
+    첫 페이지 응답의 `totalCount`를 읽어 남은 페이지 수를 계산하고,
+    나머지 페이지는 **병렬로 요청**한 뒤 페이지 순서대로 병합합니다.
+
     Args:
         lawd_cd (str): 5자리 법정동 코드 (예: "11110")
         deal_ymd (str): 조회할 년월 (YYYYMM 형식, 예: "202301")
-        rows (int, optional): 한 번에 가져올 데이터 행 수. Defaults to 1000.
-        page (int, optional): 페이지 번호. Defaults to 1.
+        rows (int, optional): 페이지당 요청할 데이터 행 수. Defaults to RTMS_PAGE_ROWS.
+        page (int, optional): 조회를 시작할 페이지 번호. Defaults to 1.
+        priority (Priority, optional): 업스트림 스케줄러 우선순위. Defaults to Priority.INTERACTIVE.
 
     Returns:
         pd.DataFrame: 조회된 실거래 데이터를 담은 데이터프레임.
                       데이터가 없거나 오류 발생 시 빈 데이터프레임을 반환할 수 있음.
     """
-    # API 요청 파라미터 설정
-    params: Dict[str, Any] = {
-        "serviceKey": SERVICE_KEY,  # 인증키
-        "LAWD_CD": lawd_cd,         # 법정동 코드
-        "DEAL_YMD": deal_ymd,       # 조회년월
-        "numOfRows": rows,          # 행 수
-        "pageNo": page,             # 페이지 번호
-    }
     try:
-        # API 요청 및 예외 처리 (타임아웃 10초)
-        res = requests.get(ENDPOINT, params=params, timeout=10)
-        res.raise_for_status()  # HTTP 오류 발생 시 예외 발생
-
-        # XML 응답 파싱
-        root = ET.fromstring(res.content)
-        # API 응답 헤더의 결과 메시지 확인
-        if root.findtext("./header/resultMsg") != "OK":
-            msg = root.findtext("./header/resultMsg") or "Unknown API error"
-            print(f"[API Error] {deal_ymd}: {msg}")
-            return pd.DataFrame() # 오류 발생 시 빈 데이터프레임 반환
-
-        # XML item을 순회하며 딕셔너리 리스트 생성
-        items: List[Dict[str, Any]] = []
-        for it in root.findall(".//item"):
-            g = it.findtext
-            items.append({
-                "아파트": g("aptNm"),
-                "거래금액(만원)": g("dealAmount"),
-                "deal_amount": g("dealAmount"), # 그래프용 필드 추가
-                "전용면적(m²)": g("excluUseAr"),
-                "층": g("floor"),
-                "건축년도": g("buildYear"),
-                "거래일": f"{g('dealYear')}-{g('dealMonth'):0>2}-{g('dealDay'):0>2}",
-                "deal_year": g("dealYear"), # 그래프용 필드 추가
-                "deal_month": g("dealMonth"), # 그래프용 필드 추가
-                "도로명": g("roadNm"),
-            })
-
-        # 데이터프레임 생성 및 데이터 타입 정제
-        df = pd.DataFrame(items)
-        if not df.empty:
-            df["거래금액(만원)"] = pd.to_numeric(df["거래금액(만원)"].str.replace(",", ""), errors="coerce")
-            df["전용면적(m²)"] = pd.to_numeric(df["전용면적(m²)"], errors="coerce")
-            df["층"] = pd.to_numeric(df["층"], errors="coerce")
-            df["건축년도"] = pd.to_numeric(df["건축년도"], errors="coerce")
-            df["거래일"] = pd.to_datetime(df["거래일"], errors="coerce")
+        df, _ = _month_flight.do(
+            (lawd_cd, deal_ymd, rows, page, priority), _fetch_month, lawd_cd, deal_ymd, rows, page, priority
+        )
         return df
-
-    except requests.exceptions.RequestException as e:
+    except (RtmsApiError, QuotaExceededError, CircuitOpenError) as e:
+        print(f"[API Error] {e}")
+    except (requests.exceptions.RequestException, ParseError) as e:
         print(f"[Request Error] {deal_ymd}: {e}")
-        return pd.DataFrame() # 네트워크 오류 시 빈 데이터프레임 반환
+    return pd.DataFrame() # 오류 발생 시 빈 데이터프레임 반환
+
+def get_circuit_breaker() -> CircuitBreaker:
+    """RTMS 업스트림 서킷 브레이커를 반환합니다. (모니터링용)"""
+    return _breaker
 
 # --- 2. 기간별 데이터 조회 및 병합 함수 ---
 def month_range(start_ym: str, end_ym: str) -> List[str]:
@@ -99,38 +305,422 @@ def month_range(start_ym: str, end_ym: str) -> List[str]:
         current += relativedelta(months=1)
     return months
 
-def fetch_rtms_range(lawd_cd: str, start_ym: str, end_ym: str) -> pd.DataFrame:
+def _fetch_month_cached(lawd_cd: str, deal_ymd: str, use_cache: bool,
+                        priority: Priority = Priority.INTERACTIVE) -> pd.DataFrame:
+    """
+    캐시에 신선한 파티션이 있으면 그것을 반환하고, 없으면 API로 조회한 뒤 캐시에 저장합니다.
+    만료된 파티션에 원본 응답 해시가 있으면 재검증(`refresh_month`)하여 바뀐 행만 반영한 뒤 캐시에서 읽습니다.
+    조회에 실패한 달은 캐시에 저장하지 않고 예외를 그대로 전파합니다.
+    """
+    cache = get_trade_cache() if use_cache else None
+    if cache is not None:
+        cached = cache.get(lawd_cd, deal_ymd)
+        if cached is not None:
+            return cached
+        info = cache.partition_info(lawd_cd, deal_ymd)
+        if info is not None and info.content_hash:
+            refresh_month(lawd_cd, deal_ymd, priority)
+            revalidated = cache.get(lawd_cd, deal_ymd, allow_stale=True)
+            if revalidated is not None:
+                return revalidated
+
+    df, shared = _month_flight.do(
+        (lawd_cd, deal_ymd, RTMS_PAGE_ROWS, 1, priority), _fetch_month, lawd_cd, deal_ymd, priority=priority
+    )
+    if cache is not None and not shared:  # 병합된 호출이면 리더가 이미 저장함
+        cache.put(lawd_cd, deal_ymd, df, df.attrs.get(CONTENT_HASH_ATTR))
+    return df
+
+
+def load_month(lawd_cd: str, deal_ymd: str, priority: Priority = Priority.BACKGROUND) -> pd.DataFrame:
+    """
+    캐시에 신선한 파티션이 없으면 한 달치 데이터를 API로 조회하여 캐시에 저장합니다.
+    백필 같은 일괄 작업용이며, 쿼터 소진·회로 개방 등의 오류를 그대로 전파하므로 호출자가 재시도를 결정합니다.
+    """
+    return _fetch_month_cached(lawd_cd, deal_ymd, True, priority)
+
+
+class Revalidation(NamedTuple):
+    """한 달 재검증 결과. changed가 False이면 원본 응답이 그대로여서 파싱·저장을 생략한 경우입니다."""
+
+    changed: bool
+    added: int
+    removed: int
+
+
+def _revalidate_month(lawd_cd: str, deal_ymd: str, priority: Priority) -> Revalidation:
+    cache = get_trade_cache()
+    # item을 파싱하지 않고 원본 응답만 받아 해시를 비교
+    pages = _fetch_pages(lawd_cd, deal_ymd, RTMS_PAGE_ROWS, 1, priority, parse=False)
+    info = cache.partition_info(lawd_cd, deal_ymd)
+    if info is not None and info.content_hash == _content_hash(pages):
+        cache.touch(lawd_cd, deal_ymd)
+        return Revalidation(False, 0, 0)
+    df = _pages_to_frame(pages, deal_ymd)
+    added, removed = cache.apply_diff(lawd_cd, deal_ymd, df, df.attrs[CONTENT_HASH_ATTR])
+    return Revalidation(True, added, removed)
+
+
+def refresh_month(lawd_cd: str, deal_ymd: str, priority: Priority = Priority.BACKGROUND) -> Revalidation:
+    """
+    캐시 신선도와 관계없이 한 달치 데이터를 다시 조회하여 캐시를 재검증합니다.
+    원본 응답의 해시가 저장된 값과 같으면 파싱과 저장 없이 조회 시각만 갱신하고,
+    다르면 새 결과와 캐시의 행을 비교하여 추가·삭제된 행만 반영합니다(지연 신고, 계약 취소).
+    같은 달을 같은 우선순위로 동시에 재검증하는 요청은 하나로 병합됩니다. 오류는 그대로 전파됩니다.
+
+    Returns:
+        Revalidation: (변경 여부, 추가된 행 수, 삭제된 행 수).
+    """
+    result, _ = _month_flight.do(
+        ("revalidate", lawd_cd, deal_ymd, priority), _revalidate_month, lawd_cd, deal_ymd, priority
+    )
+    return result
+
+
+def _stale_fallback(lawd_cd: str, deal_ymd: str, use_cache: bool, error: Exception) -> Optional[pd.DataFrame]:
+    """
+    업스트림 조회에 실패한 달에 만료된 캐시 파티션이 있으면 그것을 대신 반환합니다. (degraded mode)
+    캐시를 사용하지 않거나 한 번도 저장된 적 없는 달이면 None을 반환합니다.
+    """
+    if not use_cache:
+        return None
+    stale = get_trade_cache().get(lawd_cd, deal_ymd, allow_stale=True)
+    if stale is not None:
+        print(f"[Degraded] {lawd_cd} {deal_ymd}: 업스트림 조회 실패({type(error).__name__}), "
+              f"만료된 캐시 데이터로 응답합니다.")
+    return stale
+
+
+def _fetch_cell(lawd_cd: str, deal_ymd: str, use_cache: bool,
+                priority: Priority = Priority.INTERACTIVE) -> Tuple[Optional[pd.DataFrame], str]:
+    """
+    (법정동 코드, 년월) 한 칸을 조회하여 (데이터프레임, 상태)를 반환합니다. 예외를 전파하지 않습니다.
+    조회에 실패하면 만료된 캐시로 대체하고(CELL_STALE), 그마저 없으면 (None, CELL_FAILED)를 반환합니다.
+    """
+    try:
+        return _fetch_month_cached(lawd_cd, deal_ymd, use_cache, priority), CELL_OK
+    except Exception as e:
+        print(f"[Fetch Error] {lawd_cd} {deal_ymd}: {e}")
+        df = _stale_fallback(lawd_cd, deal_ymd, use_cache, e)
+        return (None, CELL_FAILED) if df is None else (df, CELL_STALE)
+
+
+def fetch_rtms_range(lawd_cd: str, start_ym: str, end_ym: str, use_cache: bool = True,
+                     priority: Priority = Priority.INTERACTIVE, where: Optional[TradeFilter] = None) -> pd.DataFrame:
     """
     지정된 기간 동안의 실거래 데이터를 **병렬로 조회**하여 하나의 데이터프레임으로 병합합니다.
+    먼저 로컬 거래 캐시(trade_cache)에서 신선한 달을 한 번에 읽고, 캐시에 없는 달만 API로 조회합니다.
+    (조회 기간을 한 달 넓히면 업스트림 요청도 그 한 달만 발생합니다.)
+
+    재시도 후에도 조회에 실패한 달(서킷 브레이커가 열려 즉시 실패한 달 포함)은
+    만료된 캐시 파티션이 있으면 그것으로 대신 채우고 `df.attrs["stale_months"]`(STALE_MONTHS_ATTR)에,
+    캐시에도 없으면 결과에서 빠지며 `df.attrs["failed_months"]`(FAILED_MONTHS_ATTR)에 기록됩니다.
+
+    where(면적, 아파트명 조건)를 주면 캐시에 있는 달은 저장소에서 조건에 맞는 행만 읽고,
+    API로 조회한 달은 전체를 캐시에 저장한 뒤 같은 조건으로 걸러 반환합니다.
 
     Args:
         lawd_cd (str): 5자리 법정동 코드.
         start_ym (str): 조회 시작년월 (YYYYMM).
         end_ym (str): 조회 종료년월 (YYYYMM).
+        use_cache (bool, optional): 로컬 거래 캐시 사용 여부. Defaults to True.
+        priority (Priority, optional): 업스트림 스케줄러 우선순위. Defaults to Priority.INTERACTIVE.
+        where (TradeFilter, optional): 면적, 아파트명 조건. Defaults to None (전체).
 
     Returns:
         pd.DataFrame: 지정된 기간의 모든 실거래 데이터를 담은 데이터프레임.
     """
+    return _collect_months(month_range(start_ym, end_ym),
+                           iter_rtms_range(lawd_cd, start_ym, end_ym, use_cache, priority, where))
+
+
+def iter_rtms_range(lawd_cd: str, start_ym: str, end_ym: str, use_cache: bool = True,
+                    priority: Priority = Priority.INTERACTIVE,
+                    where: Optional[TradeFilter] = None) -> Iterator[Tuple[str, Optional[pd.DataFrame], str]]:
+    """
+    `fetch_rtms_range`의 점진적 버전. 달이 준비되는 순서대로 (년월, 데이터프레임 또는 None, 상태)를 내보냅니다.
+    캐시에 있는 달을 년월 순서로 먼저 내보내고, 이후 API로 조회하는 달은 완료되는 순서대로 내보냅니다.
+    가장 느린 달을 기다리지 않고 첫 달부터 처리할 수 있으며, 전체를 이어 붙인 사본도 만들지 않습니다.
+    소비자가 중간에 반복을 멈추면(close) 아직 시작하지 않은 달의 조회는 취소되고, 진행 중인 달이 끝날 때까지 기다립니다.
+    """
+    parts, gaps = _plan_range(lawd_cd, month_range(start_ym, end_ym), use_cache, where)
+    for ym, df in sorted(parts.items()):
+        yield ym, df, CELL_OK
+    del parts  # 내보낸 달을 소비자만 참조하도록
+    if not gaps:
+        return
+    # ThreadPoolExecutor를 사용하여 캐시에 없는 달만 병렬로 API 요청
+    executor = ThreadPoolExecutor(max_workers=min(10, len(gaps)))
+    try:
+        future_to_ym = {executor.submit(_fetch_cell, lawd_cd, ym, use_cache, priority): ym for ym in gaps}
+        # 작업이 완료되는 순서대로 결과를 내보냄
+        for future in as_completed(future_to_ym):
+            df, status = future.result()
+            yield future_to_ym[future], _filter_fetched(lawd_cd, df, use_cache, where), status
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+
+def _collect_months(ym_list: List[str], months: Iterable[Tuple[str, Optional[pd.DataFrame], str]]) -> pd.DataFrame:
+    """`iter_rtms_range`가 내보낸 달들을 년월 순서로 모아 하나의 데이터프레임으로 병합합니다."""
+    parts: Dict[str, pd.DataFrame] = {}
+    cells: Dict[str, List[str]] = {CELL_STALE: [], CELL_FAILED: []}
+    for ym, df, status in months:
+        if status != CELL_OK:
+            cells[status].append(ym)
+        if df is not None:
+            parts[ym] = df
+    return _merge_months(_in_month_order(ym_list, parts), sorted(cells[CELL_FAILED]), sorted(cells[CELL_STALE]))
+
+
+def _plan_range(lawd_cd: str, ym_list: List[str], use_cache: bool,
+                where: Optional[TradeFilter] = None) -> Tuple[Dict[str, pd.DataFrame], List[str]]:
+    """
+    조회 계획: 캐시에서 신선한 파티션을 한 번의 조회로 읽고, ({년월: 데이터프레임}, 조회가 필요한 년월 목록)을 반환합니다.
+    조건(where)은 저장소로 넘겨, 캐시에 있는 달은 조건에 맞는 행만 읽습니다.
+    """
+    parts = get_trade_cache().get_many(lawd_cd, ym_list, where) if use_cache else {}
+    return parts, [ym for ym in ym_list if ym not in parts]
+
+
+def _filter_fetched(lawd_cd: str, df: Optional[pd.DataFrame], use_cache: bool,
+                    where: Optional[TradeFilter]) -> Optional[pd.DataFrame]:
+    """API로 조회한(또는 만료된 캐시로 대체한) 달에 저장소와 같은 조건을 메모리에서 적용합니다."""
+    if df is None or not where:
+        return df
+    return where.apply(df, get_trade_cache().name_index(lawd_cd) if use_cache else None)
+
+
+def _in_month_order(ym_list: List[str], parts: Dict[str, pd.DataFrame]) -> List[pd.DataFrame]:
+    """달별 데이터프레임을 년월 순서대로 나열합니다. (빈 달과 실패한 달은 제외)"""
+    return [parts[ym] for ym in ym_list if ym in parts and not parts[ym].empty]
+
+
+def _merge_months(frames: List[pd.DataFrame], failed: List[str], stale: List[str]) -> pd.DataFrame:
+    """
+    년월 순서로 나열된 월별 데이터프레임을 이어 붙이고,
+    조회 실패한 달과 만료된 캐시로 대체한 달 목록을 attrs에 기록합니다.
+    각 달은 거래일 순으로 정렬되어 있으므로 전체를 다시 정렬하지 않습니다.
+    """
+    if frames:
+        df = concat_trades(frames)
+    else:
+        df = pd.DataFrame()
+    df.attrs[FAILED_MONTHS_ATTR] = sorted(failed)
+    df.attrs[STALE_MONTHS_ATTR] = sorted(stale)
+    return df
+
+
+# --- 3. 비동기(asyncio) 조회 엔진 ---
+# FastAPI의 async 엔드포인트에서 스레드를 점유하지 않고 조회하기 위한 경로입니다.
+# 업스트림 응답은 이벤트 루프에서 기다리고, XML 파싱, 데이터프레임 생성·필터, 캐시 입출력은 스레드로 넘깁니다.
+# 프로세스 전역 세마포어로 동시에 진행 중인 업스트림 요청 수를 RTMS_ASYNC_CONCURRENCY로 제한합니다.
+_async_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = weakref.WeakKeyDictionary()
+
+
+def _async_semaphore() -> asyncio.Semaphore:
+    """현재 이벤트 루프에 묶인 동시성 제한 세마포어를 반환합니다."""
+    loop = asyncio.get_running_loop()
+    sem = _async_semaphores.get(loop)
+    if sem is None:
+        sem = _async_semaphores[loop] = asyncio.Semaphore(RTMS_ASYNC_CONCURRENCY)
+    return sem
+
+
+async def _request_page_once_async(lawd_cd: str, deal_ymd: str, rows: int, page: int,
+                                   priority: Priority = Priority.INTERACTIVE) -> _Page:
+    """`_request_page_once`의 비동기 버전. 오류는 httpx.HTTPError 등으로 전파됩니다."""
+    async def request() -> _Page:
+        await get_scheduler().acquire_async(priority)
+        async with _async_semaphore():
+            res = await get_async_client().get(ENDPOINT, params=_page_params(lawd_cd, deal_ymd, rows, page))
+        res.raise_for_status()
+        # 1,000건 페이지의 XML 파싱은 수십 ms가 걸리므로 이벤트 루프를 막지 않도록 스레드에서 처리합니다.
+        return await asyncio.to_thread(_read_page, res.content, deal_ymd, page, True)
+
+    return await _breaker.call_async(request)
+
+
+async def _request_page_async(lawd_cd: str, deal_ymd: str, rows: int, page: int,
+                              priority: Priority = Priority.INTERACTIVE) -> _Page:
+    """`_request_page`의 비동기 버전 (재시도 + 헤지 요청)."""
+    def once() -> Awaitable[_Page]:
+        return _request_page_once_async(lawd_cd, deal_ymd, rows, page, priority)
+
+    if not RTMS_HEDGE_ENABLED:
+        return await retry_call_async(once, _RETRY_POLICY)
+    return await retry_call_async(lambda: hedged_call_async(once, _page_latency), _RETRY_POLICY)
+
+
+async def _fetch_month_async(lawd_cd: str, deal_ymd: str, rows: int = RTMS_PAGE_ROWS, page: int = 1,
+                             priority: Priority = Priority.INTERACTIVE) -> pd.DataFrame:
+    """`_fetch_month`의 비동기 버전. 2페이지 이후는 동시에 요청하여 페이지 순서대로 병합합니다."""
+    first = await _request_page_async(lawd_cd, deal_ymd, rows, page, priority)
+    last_page = _last_page(first.total_count, rows, page)
+    rest = await asyncio.gather(*(
+        _request_page_async(lawd_cd, deal_ymd, rows, p, priority) for p in range(page + 1, last_page + 1)
+    ))
+    return await asyncio.to_thread(_pages_to_frame, [first, *rest], deal_ymd)
+
+
+async def _fetch_month_cached_async(lawd_cd: str, deal_ymd: str, use_cache: bool,
+                                    priority: Priority = Priority.INTERACTIVE) -> pd.DataFrame:
+    """`_fetch_month_cached`의 비동기 버전. SQLite 캐시 입출력은 스레드로 넘겨 이벤트 루프를 막지 않습니다."""
+    cache = get_trade_cache() if use_cache else None
+    if cache is not None:
+        cached = await asyncio.to_thread(cache.get, lawd_cd, deal_ymd)
+        if cached is not None:
+            return cached
+        info = await asyncio.to_thread(cache.partition_info, lawd_cd, deal_ymd)
+        if info is not None and info.content_hash:
+            await asyncio.to_thread(refresh_month, lawd_cd, deal_ymd, priority)
+            revalidated = await asyncio.to_thread(cache.get, lawd_cd, deal_ymd, True)
+            if revalidated is not None:
+                return revalidated
+
+    df, shared = await _month_flight_async.do(
+        (lawd_cd, deal_ymd, RTMS_PAGE_ROWS, 1, priority), _fetch_month_async, lawd_cd, deal_ymd, priority=priority
+    )
+    if cache is not None and not shared:  # 병합된 호출이면 리더가 이미 저장함
+        await asyncio.to_thread(cache.put, lawd_cd, deal_ymd, df, df.attrs.get(CONTENT_HASH_ATTR))
+    return df
+
+
+async def _fetch_cell_async(lawd_cd: str, deal_ymd: str, use_cache: bool,
+                            priority: Priority = Priority.INTERACTIVE) -> Tuple[Optional[pd.DataFrame], str]:
+    """`_fetch_cell`의 비동기 버전."""
+    try:
+        return await _fetch_month_cached_async(lawd_cd, deal_ymd, use_cache, priority), CELL_OK
+    except Exception as e:
+        print(f"[Fetch Error] {lawd_cd} {deal_ymd}: {e}")
+        df = await asyncio.to_thread(_stale_fallback, lawd_cd, deal_ymd, use_cache, e)
+        return (None, CELL_FAILED) if df is None else (df, CELL_STALE)
+
+
+async def fetch_rtms_range_async(lawd_cd: str, start_ym: str, end_ym: str, use_cache: bool = True,
+                                 priority: Priority = Priority.INTERACTIVE,
+                                 where: Optional[TradeFilter] = None) -> pd.DataFrame:
+    """
+    `fetch_rtms_range`의 비동기 버전입니다. 월별 요청을 코루틴으로 동시에 진행하며,
+    실제 업스트림 동시 요청 수는 프로세스 전역 한도(RTMS_ASYNC_CONCURRENCY)를 넘지 않습니다.
+    조회에 실패한 달과 만료된 캐시로 대체한 달 목록은 각각
+    `df.attrs["failed_months"]`, `df.attrs["stale_months"]`에 기록됩니다.
+
+    Args:
+        lawd_cd (str): 5자리 법정동 코드.
+        start_ym (str): 조회 시작년월 (YYYYMM).
+        end_ym (str): 조회 종료년월 (YYYYMM).
+        use_cache (bool, optional): 로컬 거래 캐시 사용 여부. Defaults to True.
+        priority (Priority, optional): 업스트림 스케줄러 우선순위. Defaults to Priority.INTERACTIVE.
+        where (TradeFilter, optional): 면적, 아파트명 조건. Defaults to None (전체).
+
+    Returns:
+        pd.DataFrame: 지정된 기간의 모든 실거래 데이터를 담은 데이터프레임.
+    """
+    months = [m async for m in iter_rtms_range_async(lawd_cd, start_ym, end_ym, use_cache, priority, where)]
+    return await asyncio.to_thread(_collect_months, month_range(start_ym, end_ym), months)
+
+
+async def iter_rtms_range_async(
+    lawd_cd: str, start_ym: str, end_ym: str, use_cache: bool = True,
+    priority: Priority = Priority.INTERACTIVE, where: Optional[TradeFilter] = None,
+) -> AsyncIterator[Tuple[str, Optional[pd.DataFrame], str]]:
+    """
+    `iter_rtms_range`의 비동기 버전입니다. (스트리밍 응답용)
+    소비자가 중간에 반복을 멈추면 남은 달의 조회는 취소됩니다.
+    """
+    parts, gaps = await asyncio.to_thread(_plan_range, lawd_cd, month_range(start_ym, end_ym), use_cache, where)
+    for ym, df in sorted(parts.items()):
+        yield ym, df, CELL_OK
+    del parts
+
+    async def cell(ym: str) -> Tuple[str, Optional[pd.DataFrame], str]:
+        df, status = await _fetch_cell_async(lawd_cd, ym, use_cache, priority)
+        # 조건 필터(pandas)와 아파트명 색인 조회(SQLite)도 스레드에서 처리합니다.
+        return ym, await asyncio.to_thread(_filter_fetched, lawd_cd, df, use_cache, where), status
+
+    tasks = [asyncio.ensure_future(cell(ym)) for ym in gaps]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+# --- 4. 다중 지역(법정동 코드 × 년월) 조회 ---
+# 시/도 전체처럼 여러 지역을 한 번에 조회할 때, 지역마다 fetch_rtms_range를 따로 호출하지 않고
+# (지역, 년월) 격자 전체를 하나의 작업 목록으로 만들어 RTMS_GRID_CONCURRENCY 한도 안에서 처리합니다.
+def _grid(lawd_cds: Iterable[str], start_ym: str, end_ym: str) -> List[Tuple[str, str]]:
+    """(법정동 코드, 년월) 조회 격자를 만듭니다. 중복된 법정동 코드는 한 번만 조회합니다."""
     ym_list = month_range(start_ym, end_ym)
+    return [(lawd_cd, ym) for lawd_cd in dict.fromkeys(lawd_cds) for ym in ym_list]
+
+
+def with_lawd_column(df: pd.DataFrame, lawd_cd: str) -> pd.DataFrame:
+    """여러 지역의 결과를 합칠 수 있도록 법정동 코드 컬럼(LAWD_COLUMN)을 추가한 사본을 반환합니다."""
+    return df.assign(**{LAWD_COLUMN: pd.Categorical([lawd_cd] * len(df))})
+
+
+def fetch_rtms_multi(lawd_cds: Iterable[str], start_ym: str, end_ym: str, use_cache: bool = True,
+                     priority: Priority = Priority.INTERACTIVE) -> pd.DataFrame:
+    """
+    여러 지역의 지정된 기간 실거래 데이터를 하나의 스레드 풀에서 **병렬로 조회**하여 병합합니다.
+    결과에는 법정동 코드 컬럼(LAWD_COLUMN)이 추가되며, 조회에 실패하거나 만료된 캐시로 대체한 칸은
+    "법정동코드:년월" 형식으로 `df.attrs["failed_months"]`, `df.attrs["stale_months"]`에 기록됩니다.
+
+    Args:
+        lawd_cds (Iterable[str]): 5자리 법정동 코드 목록.
+        start_ym (str): 조회 시작년월 (YYYYMM).
+        end_ym (str): 조회 종료년월 (YYYYMM).
+        use_cache (bool, optional): 로컬 거래 캐시 사용 여부. Defaults to True.
+        priority (Priority, optional): 업스트림 스케줄러 우선순위. Defaults to Priority.INTERACTIVE.
+
+    Returns:
+        pd.DataFrame: 모든 지역, 기간의 실거래 데이터를 담은 데이터프레임.
+    """
     frames = []
-    # ThreadPoolExecutor를 사용하여 API 요청을 병렬로 처리
-    with ThreadPoolExecutor(max_workers=10) as executor:
-        # 각 년월별로 fetch_rtms 함수를 실행하는 작업을 제출
-        future_to_ym = {executor.submit(fetch_rtms, lawd_cd, ym): ym for ym in ym_list}
+    cells: Dict[str, List[str]] = {CELL_STALE: [], CELL_FAILED: []}
+    with ThreadPoolExecutor(max_workers=RTMS_GRID_CONCURRENCY) as executor:
+        future_to_cell = {
+            executor.submit(_fetch_cell, lawd_cd, ym, use_cache, priority): (lawd_cd, ym)
+            for lawd_cd, ym in _grid(lawd_cds, start_ym, end_ym)
+        }
+        for future in as_completed(future_to_cell):
+            lawd_cd, ym = future_to_cell[future]
+            df, status = future.result()
+            if status != CELL_OK:
+                cells[status].append(f"{lawd_cd}:{ym}")
+            if df is not None and not df.empty:
+                frames.append(with_lawd_column(df, lawd_cd))
+    # 같은 달이라도 지역마다 거래일이 섞이므로, 여러 지역의 결과는 한 번 정렬합니다.
+    merged = [_sort_by_date(concat_trades(frames))] if frames else []
+    return _merge_months(merged, cells[CELL_FAILED], cells[CELL_STALE])
+
+
+async def iter_rtms_multi_async(
+    lawd_cds: Iterable[str], start_ym: str, end_ym: str, use_cache: bool = True,
+    priority: Priority = Priority.INTERACTIVE,
+) -> AsyncIterator[Tuple[str, str, Optional[pd.DataFrame], str]]:
+    """
+    여러 지역 × 기간의 격자를 동시에 조회하면서, 칸이 완료되는 순서대로
+    (법정동 코드, 년월, 데이터프레임 또는 None, 상태)를 내보내는 비동기 제너레이터입니다.
+    동시에 진행하는 칸 수는 RTMS_GRID_CONCURRENCY로 제한되며, 업스트림 요청은 다시
+    프로세스 전역 한도(RTMS_ASYNC_CONCURRENCY)와 스케줄러를 거칩니다.
+    소비자가 중간에 반복을 멈추면 남은 칸의 조회는 취소됩니다.
+    """
+    sem = asyncio.Semaphore(RTMS_GRID_CONCURRENCY)
+
+    async def cell(lawd_cd: str, ym: str) -> Tuple[str, str, Optional[pd.DataFrame], str]:
+        async with sem:
+            df, status = await _fetch_cell_async(lawd_cd, ym, use_cache, priority)
+        return lawd_cd, ym, df, status
+
+    tasks = [asyncio.ensure_future(cell(lawd_cd, ym)) for lawd_cd, ym in _grid(lawd_cds, start_ym, end_ym)]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        for task in tasks:
+            task.cancel()
 
-        # 작업이 완료되는 순서대로 결과를 처리
-        for future in as_completed(future_to_ym):
-            try:
-                df = future.result()
-                if not df.empty:
-                    frames.append(df)
-            except Exception as e:
-                ym = future_to_ym[future]
-                print(f"[Future Error] {ym}: {e}")
-
-    # 모든 데이터프레임을 하나로 합침
-    if not frames:
-        return pd.DataFrame()
-
-    # 월(거래일) 기준으로 정렬하여 최종 결과 반환
-    return pd.concat(frames, ignore_index=True).sort_values(by="거래일").reset_index(drop=True)
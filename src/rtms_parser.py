@@ -0,0 +1,152 @@
+# rtms_parser.py - RTMS 응답 XML 스트리밍 파서 모듈
+# 응답 전체를 트리로 만든 뒤 item마다 딕셔너리를 만드는 대신,
+# iterparse로 item을 하나씩 읽어 필드별 컬럼 리스트에 바로 쌓고
+# 마지막에 한 번에 타입이 지정된 배열(numpy)로 변환합니다.
+# lxml이 설치되어 있으면 lxml의 iterparse를, 없으면 표준 라이브러리를 사용합니다.
+from __future__ import annotations
+
+from io import BytesIO
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from .trade_schema import to_compact
+
+try:
+    from lxml import etree as _etree
+    HAVE_LXML = True
+except ImportError:  # lxml(requirements.txt에 포함) 없이 설치한 경우 표준 라이브러리 사용
+    import xml.etree.ElementTree as _etree
+    HAVE_LXML = False
+
+# 파싱 오류 타입 (호출자가 예외 처리에 사용). 두 구현 모두 SyntaxError의 하위 클래스입니다.
+ParseError = _etree.XMLSyntaxError if HAVE_LXML else _etree.ParseError
+
+# 데이터프레임 생성에 사용하는 item 하위 필드
+FIELDS = ("aptNm", "dealAmount", "excluUseAr", "floor", "buildYear",
+          "dealYear", "dealMonth", "dealDay", "roadNm")
+
+Columns = Dict[str, List[Optional[str]]]
+
+
+class PageResult:
+    """한 페이지의 파싱 결과. 필드별 원본 문자열 컬럼과 헤더 정보를 담습니다."""
+
+    __slots__ = ("columns", "total_count", "result_msg")
+
+    def __init__(self, columns: Columns, total_count: int, result_msg: Optional[str]):
+        self.columns = columns
+        self.total_count = total_count
+        self.result_msg = result_msg
+
+
+def empty_columns() -> Columns:
+    return {f: [] for f in FIELDS}
+
+
+def merge_columns(target: Columns, other: Columns) -> None:
+    """other 페이지의 컬럼을 target 뒤에 이어 붙입니다. (페이지 순서 유지)"""
+    for f in FIELDS:
+        target[f].extend(other[f])
+
+
+# --- 1. 스트리밍 파싱 ---
+def parse_page(content: bytes) -> PageResult:
+    """
+    RTMS 응답 XML 한 페이지를 스트리밍 방식으로 파싱합니다.
+
+    Args:
+        content (bytes): 응답 본문.
+
+    Returns:
+        PageResult: 필드별 컬럼 리스트, totalCount, resultMsg.
+    """
+    columns = empty_columns()
+    appenders = {f: columns[f].append for f in FIELDS}
+    n_items = 0
+    total_count = 0
+    result_msg: Optional[str] = None
+
+    # lxml은 C 수준에서 필요한 태그만 걸러 이벤트를 보내므로, 나머지 20여 개 필드는 파이썬까지 오지 않습니다.
+    kwargs = {"tag": (*FIELDS, "item", "resultMsg", "totalCount")} if HAVE_LXML else {}
+    for _, elem in _etree.iterparse(BytesIO(content), events=("end",), **kwargs):
+        tag = elem.tag
+        append = appenders.get(tag)
+        if append is not None:
+            append(elem.text)
+        elif tag == "item":
+            # 필드가 누락된 item이 있어도 컬럼 길이(행 정렬)가 어긋나지 않도록 None으로 채움
+            n_items += 1
+            for col in columns.values():
+                if len(col) < n_items:
+                    col.append(None)
+            elem.clear()  # 처리한 item은 메모리에서 해제
+        elif tag == "resultMsg":
+            result_msg = elem.text
+        elif tag == "totalCount":
+            total_count = int(elem.text or 0)
+
+    return PageResult(columns, total_count, result_msg)
+
+
+# --- 2. 타입 변환 ---
+def _int_array(values: List[Optional[str]], strip_commas: bool = False) -> np.ndarray:
+    """문자열 리스트를 int64 배열로 변환합니다. 결측/비정상 값이 있으면 float64(NaN) 배열이 됩니다."""
+    try:
+        if strip_commas:
+            return np.array([int(v.replace(",", "")) for v in values], dtype=np.int64)
+        return np.array([int(v) for v in values], dtype=np.int64)
+    except (TypeError, ValueError, AttributeError):
+        series = pd.Series(values, dtype=object)
+        if strip_commas:
+            series = series.str.replace(",", "")
+        return pd.to_numeric(series, errors="coerce").to_numpy()
+
+
+def _float_array(values: List[Optional[str]]) -> np.ndarray:
+    try:
+        return np.array([float(v) for v in values], dtype=np.float64)
+    except (TypeError, ValueError):
+        return pd.to_numeric(pd.Series(values, dtype=object), errors="coerce").to_numpy(dtype=np.float64)
+
+
+def _date_array(years: np.ndarray, months: np.ndarray, days: np.ndarray) -> np.ndarray:
+    """
+    정수 년/월/일 배열로 datetime64[ns] 배열을 만듭니다.
+    문자열 포맷팅과 pd.to_datetime 없이 월 오프셋 + 일 오프셋 연산만 사용합니다.
+    pd.to_datetime(errors="coerce")처럼 없는 날짜(13월, 2월 30일 등)나 datetime64[ns] 범위 밖의 년도는
+    다음 달로 넘기지 않고 NaT로 둡니다.
+    """
+    parts = np.vstack([years, months, days]).astype(np.float64)
+    valid = ~np.isnan(parts).any(axis=0)
+    y, m, d = np.where(valid, parts, 1).astype(np.int64)
+    valid &= (y >= 1678) & (y <= 2261) & (m >= 1) & (m <= 12)
+    y, m = np.where(valid, y, 1970), np.where(valid, m, 1)
+    month_start = ((y - 1970) * 12 + (m - 1)).astype("datetime64[M]")
+    days_in_month = ((month_start + 1).astype("datetime64[D]") - month_start.astype("datetime64[D]")).astype(np.int64)
+    valid &= (d >= 1) & (d <= days_in_month)
+    dates = (month_start.astype("datetime64[D]") + np.where(valid, d - 1, 0)).astype("datetime64[ns]")
+    dates[~valid] = np.datetime64("NaT")
+    return dates
+
+
+def columns_to_frame(columns: Columns) -> pd.DataFrame:
+    """
+    필드별 원본 문자열 컬럼을 표준 스키마(trade_schema)의 실거래 데이터프레임으로 변환합니다.
+    """
+    if not columns["aptNm"]:
+        return pd.DataFrame()
+
+    years = _int_array(columns["dealYear"])
+    months = _int_array(columns["dealMonth"])
+    days = _int_array(columns["dealDay"])
+    return to_compact(pd.DataFrame({
+        "아파트": columns["aptNm"],
+        "거래금액(만원)": _int_array(columns["dealAmount"], strip_commas=True),
+        "전용면적(m²)": _float_array(columns["excluUseAr"]),
+        "층": _int_array(columns["floor"]),
+        "건축년도": _int_array(columns["buildYear"]),
+        "거래일": _date_array(years, months, days),
+        "도로명": columns["roadNm"],
+    }))
@@ -0,0 +1,72 @@
+# singleflight.py - 동일 요청 병합(single-flight) 모듈
+# 같은 키로 동시에 들어온 호출 중 첫 번째(리더)만 실제 작업을 수행하고,
+# 나머지 호출은 리더의 결과를 기다렸다가 그대로 공유합니다.
+# 인기 지역을 여러 사용자가 동시에 조회할 때 같은 (법정동 코드, 년월) 요청이
+# 업스트림으로 중복 전송되는 것을 막습니다.
+from __future__ import annotations
+
+import asyncio
+import threading
+import weakref
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple
+
+
+class SingleFlight:
+    """
+    스레드 기반 호출용 single-flight 그룹.
+
+    `do()`는 (결과, 공유 여부)를 반환합니다. 공유 여부가 True이면 다른 호출의 결과를
+    받아 온 것이므로, 캐시 저장 같은 후처리는 리더에게 맡기고 생략할 수 있습니다.
+    공유된 결과 객체는 여러 호출자가 함께 보므로 제자리(in-place) 수정하면 안 됩니다.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, Future] = {}
+
+    def do(self, key: Hashable, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Tuple[Any, bool]:
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = Future()
+
+        if not leader:
+            return future.result(), True  # 리더의 예외도 그대로 전파됨
+
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result, False
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+
+
+class AsyncSingleFlight:
+    """
+    asyncio 코루틴용 single-flight 그룹. 이벤트 루프마다 진행 중인 작업을 따로 관리합니다.
+
+    공유 작업은 `asyncio.shield`로 감싸므로, 기다리던 요청 하나가 취소되어도
+    같은 작업을 기다리는 다른 요청에는 영향을 주지 않습니다.
+    """
+
+    def __init__(self) -> None:
+        self._calls: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Hashable, asyncio.Task]]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    async def do(self, key: Hashable, fn: Callable[..., Awaitable[Any]], *args: Any, **kwargs: Any) -> Tuple[Any, bool]:
+        calls = self._calls.setdefault(asyncio.get_running_loop(), {})
+        task = calls.get(key)
+        shared = task is not None
+        if not shared:
+            task = asyncio.ensure_future(fn(*args, **kwargs))
+            calls[key] = task
+            task.add_done_callback(lambda _t: calls.pop(key, None))
+        return await asyncio.shield(task), shared
@@ -0,0 +1,383 @@
+# trade_cache.py - 실거래 데이터 로컬 캐시 모듈
+# (법정동 코드, 년월) 단위로 조회 결과를 SQLite 파일에 파티션으로 저장합니다.
+# 마감된 달은 변경되지 않는 것으로 보고 영구 보관하며, 신고가 계속 추가되는
+# 이번 달과 지난 달만 짧은 TTL이 지나면 만료시켜 다시 조회하도록 합니다.
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from dateutil.relativedelta import relativedelta
+
+from .config import TRADE_CACHE_PATH, TRADE_CACHE_RECENT_TTL
+from .name_index import NameIndex
+from .trade_filter import AREA_COLUMN, TradeFilter
+from .trade_schema import to_compact
+
+# 데이터프레임 컬럼명 -> SQLite 컬럼명 매핑
+_COLUMNS = {
+    "아파트": "apt",
+    "거래금액(만원)": "price",
+    "전용면적(m²)": "area",
+    "층": "floor",
+    "건축년도": "build_year",
+    "거래일": "deal_date",
+    "도로명": "road",
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS partitions (
+    lawd_cd    TEXT NOT NULL,
+    deal_ymd   TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    row_count  INTEGER NOT NULL,
+    content_hash TEXT,
+    min_area   REAL,
+    max_area   REAL,
+    PRIMARY KEY (lawd_cd, deal_ymd)
+);
+CREATE TABLE IF NOT EXISTS trades (
+    lawd_cd    TEXT NOT NULL,
+    deal_ymd   TEXT NOT NULL,
+    apt        TEXT,
+    price      INTEGER,
+    area       REAL,
+    floor      INTEGER,
+    build_year INTEGER,
+    deal_date  TEXT,
+    road       TEXT
+);
+-- 파티션을 거래일 순으로 읽을 수 있도록 거래일까지 포함한 인덱스를 사용합니다.
+-- 거래일이 없는 행은 _sort_by_date(pandas 정렬)와 같이 맨 뒤에 오도록 `deal_date IS NULL`을 먼저 둡니다.
+DROP INDEX IF EXISTS idx_trades_partition;
+DROP INDEX IF EXISTS idx_trades_partition_date;
+CREATE INDEX IF NOT EXISTS idx_trades_partition_date_nulls_last
+    ON trades (lawd_cd, deal_ymd, deal_date IS NULL, deal_date);
+-- 면적 조건이 있는 조회는 파티션 안에서 면적 범위만 읽도록 면적순 인덱스를 사용합니다.
+CREATE INDEX IF NOT EXISTS idx_trades_partition_area ON trades (lawd_cd, deal_ymd, area);
+"""
+
+# 면적 조건에 맞을 것으로 추정되는 행의 비율이 이보다 작으면 면적순 인덱스로 읽습니다.
+# (넓은 범위는 거래일 인덱스로 읽는 편이 정렬이 필요 없어 더 빠름)
+_AREA_INDEX_MAX_FRACTION = 0.3
+
+# 이전 버전에서 만든 캐시 파일의 partitions 테이블에 없을 수 있는 컬럼
+_PARTITION_MIGRATIONS = {
+    "content_hash": "TEXT",
+    "min_area": "REAL",
+    "max_area": "REAL",
+}
+
+_INSERT_TRADES = (
+    f"INSERT INTO trades (lawd_cd, deal_ymd, {', '.join(_COLUMNS.values())}) "
+    f"VALUES (?, ?, {', '.join('?' * len(_COLUMNS))})"
+)
+_UPSERT_PARTITION = (
+    "INSERT OR REPLACE INTO partitions "
+    "(lawd_cd, deal_ymd, fetched_at, row_count, content_hash, min_area, max_area) VALUES (?, ?, ?, ?, ?, ?, ?)"
+)
+
+
+class PartitionInfo(NamedTuple):
+    """파티션 메타데이터. content_hash는 원본 응답 해시가 없던 시절에 저장된 파티션이면 None입니다."""
+
+    fetched_at: float
+    row_count: int
+    content_hash: Optional[str]
+
+
+# --- 1. 파티션 신선도 판단 ---
+def is_closed_month(deal_ymd: str, now: datetime | None = None) -> bool:
+    """
+    지난 달보다 이전의 달이면 '마감된 달'로 보고 True를 반환합니다.
+    (이번 달과 지난 달은 지연 신고·취소가 반영될 수 있으므로 False)
+    """
+    now = now or datetime.now()
+    previous_ym = (now - relativedelta(months=1)).strftime("%Y%m")
+    return deal_ymd < previous_ym
+
+
+# --- 2. 캐시 저장소 ---
+class TradeCache:
+    """
+    SQLite 기반의 월 단위 실거래 파티션 저장소.
+
+    스레드마다 별도의 SQLite 연결을 사용하므로 fetch_rtms_range의 스레드 풀에서
+    동시에 호출해도 안전합니다.
+
+    Args:
+        path (str | Path): SQLite 파일 경로. 상위 디렉토리는 자동으로 생성됩니다.
+        recent_ttl (int): 이번 달·지난 달 파티션의 유효 시간(초).
+    """
+
+    def __init__(self, path: str | Path = TRADE_CACHE_PATH, recent_ttl: int = TRADE_CACHE_RECENT_TTL):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.recent_ttl = recent_ttl
+        self._local = threading.local()
+        self._name_indexes: Dict[str, NameIndex] = {}
+        self._name_synced: Dict[str, Dict[str, float]] = {}  # 지역 -> {년월: 색인에 반영한 파티션 조회 시각}
+        self._name_lock = threading.Lock()
+        conn = self._conn()
+        # 이전 버전에서 만든 캐시 파일에 없는 컬럼을 먼저 추가합니다. (새 파일이면 테이블이 없어 건너뜀)
+        existing = {row[1] for row in conn.execute("PRAGMA table_info(partitions)")}
+        if existing:
+            for column, sql_type in _PARTITION_MIGRATIONS.items():
+                if column not in existing:
+                    conn.execute(f"ALTER TABLE partitions ADD COLUMN {column} {sql_type}")
+            conn.commit()
+        conn.executescript(_SCHEMA)
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")  # 읽기와 쓰기가 서로를 막지 않도록 설정
+            self._local.conn = conn
+        return conn
+
+    def is_fresh(self, deal_ymd: str, fetched_at: float) -> bool:
+        """마감된 달은 항상 신선하고, 최근 달은 TTL 이내에 조회된 경우에만 신선합니다."""
+        if is_closed_month(deal_ymd):
+            return True
+        return time.time() - fetched_at < self.recent_ttl
+
+    def get(self, lawd_cd: str, deal_ymd: str, allow_stale: bool = False) -> Optional[pd.DataFrame]:
+        """
+        신선한 파티션이 있으면 데이터프레임으로 반환하고, 없거나 만료되었으면 None을 반환합니다.
+        거래가 없는 달도 캐시되며, 이 경우 빈 데이터프레임을 반환합니다.
+        allow_stale=True이면 만료된 파티션도 반환합니다. (업스트림 장애 시 대체 응답용)
+        """
+        conn = self._conn()
+        row = conn.execute(
+            "SELECT fetched_at, row_count FROM partitions WHERE lawd_cd = ? AND deal_ymd = ?",
+            (lawd_cd, deal_ymd),
+        ).fetchone()
+        if row is None or not (allow_stale or self.is_fresh(deal_ymd, row[0])):
+            return None
+        if row[1] == 0:
+            return pd.DataFrame()
+
+        raw = pd.read_sql_query(
+            f"SELECT {', '.join(_COLUMNS.values())} FROM trades WHERE lawd_cd = ? AND deal_ymd = ? "
+            f"ORDER BY deal_date IS NULL, deal_date, rowid",
+            conn, params=(lawd_cd, deal_ymd),
+        )
+        return _rows_to_frame(raw)
+
+    def fresh_months(self, lawd_cd: str, months: Iterable[str]) -> set[str]:
+        """주어진 달 중 신선한 파티션이 있는 달의 집합을 반환합니다. (거래 행은 읽지 않음)"""
+        months = list(months)
+        if not months:
+            return set()
+        rows = self._conn().execute(
+            f"SELECT deal_ymd, fetched_at FROM partitions WHERE lawd_cd = ? AND deal_ymd IN ({', '.join('?' * len(months))})",
+            (lawd_cd, *months),
+        )
+        return {ym for ym, fetched_at in rows if self.is_fresh(ym, fetched_at)}
+
+    def get_many(self, lawd_cd: str, months: Iterable[str],
+                 where: Optional[TradeFilter] = None) -> Dict[str, pd.DataFrame]:
+        """
+        여러 달 중 신선한 파티션을 한 번의 조회로 읽어 {년월: 데이터프레임}으로 반환합니다.
+        없거나 만료된 달은 결과에 포함되지 않습니다. 각 데이터프레임은 거래일 순으로 정렬되어 있고,
+        모든 달이 같은 카테고리 집합을 공유하므로 이어 붙여도 category 타입이 유지됩니다.
+
+        where(면적, 아파트명 조건)가 주어지면 조건에 맞는 행만 읽습니다. 파티션의 면적 최소/최대 통계로
+        맞는 행이 있을 수 없는 달은 거래 행을 읽지 않고 빈 데이터프레임으로 반환하며,
+        아파트명은 지역 색인(다른 프로세스가 저장한 파티션까지 반영)으로 이름 목록을 구한 뒤 SQL 조건으로 넘깁니다.
+        """
+        months = list(months)
+        if not months:
+            return {}
+        where = where or TradeFilter()
+        names = where.names(self.name_index(lawd_cd)) if where.apt_name else None
+        condition, condition_params = where.sql(names)
+        placeholders = ", ".join("?" * len(months))
+        conn = self._conn()
+        conn.execute("BEGIN")  # 두 조회가 같은 스냅샷을 보도록 읽기 트랜잭션으로 묶음
+        try:
+            # 년월 -> (행 수, 조건에 맞을 것으로 추정되는 행 수). 추정치가 0이면 거래 행을 읽지 않습니다.
+            fresh = {
+                ym: (count, count * where.area_fraction(lo, hi) if names != set() else 0)
+                for ym, fetched_at, count, lo, hi in conn.execute(
+                    f"SELECT deal_ymd, fetched_at, row_count, min_area, max_area FROM partitions "
+                    f"WHERE lawd_cd = ? AND deal_ymd IN ({placeholders})",
+                    (lawd_cd, *months),
+                )
+                if self.is_fresh(ym, fetched_at)
+            }
+            filled = sorted(ym for ym, (_, expected) in fresh.items() if expected > 0)
+            raw = None
+            if filled:
+                total, expected = (sum(v) for v in zip(*(fresh[ym] for ym in filled)))
+                use_area_index = expected < total * _AREA_INDEX_MAX_FRACTION
+                raw = pd.read_sql_query(
+                    f"SELECT deal_ymd, {', '.join(_COLUMNS.values())} FROM trades "
+                    f"{'INDEXED BY idx_trades_partition_area ' if use_area_index else ''}"
+                    f"WHERE lawd_cd = ? AND deal_ymd IN ({', '.join('?' * len(filled))}){condition} "
+                    f"ORDER BY deal_ymd, deal_date IS NULL, deal_date, rowid",
+                    conn, params=(lawd_cd, *filled, *condition_params),
+                )
+        finally:
+            conn.commit()
+
+        result = {ym: pd.DataFrame() for ym, (_, expected) in fresh.items() if expected <= 0}
+        if raw is not None:
+            # 행이 년월 순으로 정렬되어 있으므로 경계 위치만 찾아 달별로 나눕니다.
+            keys = raw.pop("deal_ymd").to_numpy(dtype=str)
+            frame = _rows_to_frame(raw)
+            starts = np.searchsorted(keys, filled, side="left")
+            ends = np.searchsorted(keys, filled, side="right")
+            for ym, lo, hi in zip(filled, starts, ends):
+                result[ym] = frame.iloc[lo:hi]
+        return result
+
+    def partition_info(self, lawd_cd: str, deal_ymd: str) -> Optional[PartitionInfo]:
+        """파티션의 (마지막 조회 시각, 행 수, 원본 응답 해시)를 반환합니다. 저장된 적 없으면 None."""
+        row = self._conn().execute(
+            "SELECT fetched_at, row_count, content_hash FROM partitions WHERE lawd_cd = ? AND deal_ymd = ?",
+            (lawd_cd, deal_ymd),
+        ).fetchone()
+        return PartitionInfo(*row) if row is not None else None
+
+    def put(self, lawd_cd: str, deal_ymd: str, df: pd.DataFrame, content_hash: Optional[str] = None) -> None:
+        """해당 파티션의 기존 데이터를 지우고 새 조회 결과로 교체합니다."""
+        rows = _frame_to_rows(df)
+        conn = self._conn()
+        with conn:  # 하나의 트랜잭션으로 교체
+            conn.execute("DELETE FROM trades WHERE lawd_cd = ? AND deal_ymd = ?", (lawd_cd, deal_ymd))
+            conn.executemany(_INSERT_TRADES, [(lawd_cd, deal_ymd, *r) for r in rows])
+            conn.execute(_UPSERT_PARTITION,
+                         (lawd_cd, deal_ymd, time.time(), len(rows), content_hash, *_area_range(df)))
+        self._index_names(lawd_cd, df)
+
+    def touch(self, lawd_cd: str, deal_ymd: str) -> None:
+        """재검증 결과 원본 응답이 바뀌지 않았을 때, 거래 행은 그대로 두고 조회 시각만 갱신합니다."""
+        with self._conn() as conn:
+            conn.execute(
+                "UPDATE partitions SET fetched_at = ? WHERE lawd_cd = ? AND deal_ymd = ?",
+                (time.time(), lawd_cd, deal_ymd),
+            )
+
+    def apply_diff(self, lawd_cd: str, deal_ymd: str, df: pd.DataFrame,
+                   content_hash: Optional[str] = None) -> Tuple[int, int]:
+        """
+        새 조회 결과와 파티션의 행을 비교하여, 새로 나타난 행은 추가하고 사라진 행(계약 취소 등)은
+        삭제합니다. 같은 값의 거래가 여러 건일 수 있으므로 행을 다중집합으로 비교합니다.
+        파티션의 조회 시각과 원본 응답 해시도 갱신하며, (추가한 행 수, 삭제한 행 수)를 반환합니다.
+        """
+        rows = _frame_to_rows(df)
+        conn = self._conn()
+        with conn:
+            existing: Dict[tuple, List[int]] = defaultdict(list)
+            for rowid, *values in conn.execute(
+                f"SELECT rowid, {', '.join(_COLUMNS.values())} FROM trades WHERE lawd_cd = ? AND deal_ymd = ?",
+                (lawd_cd, deal_ymd),
+            ):
+                existing[tuple(values)].append(rowid)
+            added = []
+            for row in rows:
+                rowids = existing.get(row)
+                if rowids:
+                    rowids.pop()
+                else:
+                    added.append(row)
+            removed = [(rowid,) for rowids in existing.values() for rowid in rowids]
+            conn.executemany("DELETE FROM trades WHERE rowid = ?", removed)
+            conn.executemany(_INSERT_TRADES, [(lawd_cd, deal_ymd, *r) for r in added])
+            conn.execute(_UPSERT_PARTITION,
+                         (lawd_cd, deal_ymd, time.time(), len(rows), content_hash, *_area_range(df)))
+        if added:
+            self._index_names(lawd_cd, df)
+        return len(added), len(removed)
+
+    def name_index(self, lawd_cd: str) -> NameIndex:
+        """
+        지역의 아파트명 색인을 반환합니다.
+
+        캐시 파일은 다른 프로세스(백필 CLI, 다른 워커의 프리페치 등)도 함께 쓰므로, 호출할 때마다
+        partitions 테이블의 조회 시각을 마지막으로 색인에 반영한 값과 비교하여, 그 사이 저장된 파티션의
+        아파트명을 색인에 추가합니다. (바뀐 파티션이 없으면 partitions 조회 한 번으로 끝남)
+        """
+        conn = self._conn()
+        with self._name_lock:
+            index = self._name_indexes.get(lawd_cd)
+            if index is None:
+                index = self._name_indexes[lawd_cd] = NameIndex()
+            synced = self._name_synced.setdefault(lawd_cd, {})
+            conn.execute("BEGIN")  # 파티션 목록과 거래 행이 같은 스냅샷을 보도록 읽기 트랜잭션으로 묶음
+            try:
+                changed = {
+                    ym: fetched_at
+                    for ym, fetched_at in conn.execute(
+                        "SELECT deal_ymd, fetched_at FROM partitions WHERE lawd_cd = ?", (lawd_cd,)
+                    )
+                    if synced.get(ym) != fetched_at
+                }
+                if changed:
+                    rows = conn.execute(
+                        f"SELECT DISTINCT apt FROM trades "
+                        f"WHERE lawd_cd = ? AND deal_ymd IN ({', '.join('?' * len(changed))})",
+                        (lawd_cd, *changed),
+                    )
+                    index.add(apt for apt, in rows)
+            finally:
+                conn.commit()
+            synced.update(changed)
+        return index
+
+    def _index_names(self, lawd_cd: str, df: pd.DataFrame) -> None:
+        """
+        저장한 파티션의 아파트명을 이미 만든 지역 색인에 바로 추가합니다. (category 컬럼이면 카테고리만 확인)
+        색인이 아직 없으면 처음 `name_index()`를 호출할 때 캐시에서 만듭니다.
+        """
+        index = self._name_indexes.get(lawd_cd)
+        if index is None or df.empty:
+            return
+        names = df["아파트"]
+        index.add(names.cat.categories if isinstance(names.dtype, pd.CategoricalDtype) else names.unique())
+
+
+# --- 3. 데이터프레임 <-> 저장 행 변환 ---
+def _area_range(df: pd.DataFrame) -> Tuple[Optional[float], Optional[float]]:
+    """파티션 통계용 (최소, 최대) 전용면적. 행이 없거나 면적이 모두 비어 있으면 (None, None)."""
+    if df.empty or df[AREA_COLUMN].isna().all():
+        return None, None
+    return float(df[AREA_COLUMN].min()), float(df[AREA_COLUMN].max())
+
+
+def _frame_to_rows(df: pd.DataFrame) -> list[tuple]:
+    if df.empty:
+        return []
+    frame = df[list(_COLUMNS)].copy()
+    frame["거래일"] = frame["거래일"].dt.strftime("%Y-%m-%d")
+    frame = frame.astype(object).where(frame.notna(), None)
+    return list(frame.itertuples(index=False, name=None))
+
+
+def _rows_to_frame(raw: pd.DataFrame) -> pd.DataFrame:
+    df = raw.rename(columns={v: k for k, v in _COLUMNS.items()})
+    df["거래일"] = pd.to_datetime(df["거래일"], errors="coerce")
+    return to_compact(df)
+
+
+_cache: TradeCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_trade_cache() -> TradeCache:
+    """프로세스 전역에서 공유하는 TradeCache 인스턴스를 반환합니다. (스레드 안전)"""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = TradeCache()
+    return _cache
@@ -0,0 +1,100 @@
+# trade_filter.py - 실거래 조회 조건(면적, 아파트명) 모듈
+# 같은 조건을 두 곳에서 일관되게 적용하기 위한 모듈입니다.
+#   - 저장소(trade_cache): SQL WHERE 절과 파티션 통계(면적 최소/최대)로 맞지 않는 행을 읽지 않음
+#   - 메모리(pandas): 캐시에 없어 API로 조회한 달, 여러 지역을 합친 결과 등
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import List, Optional, Set, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .name_index import NameIndex, name_mask
+
+AREA_COLUMN = "전용면적(m²)"
+NAME_COLUMN = "아파트"
+
+
+def _float32(value: Optional[float]) -> Optional[float]:
+    """
+    면적은 float32로 저장되므로, 경계값도 float32로 반올림해야 pandas와 SQLite의 비교 결과가 같습니다.
+    (예: 84.99는 float32로 84.98999786...이 되어, 반올림하지 않은 경계와 비교하면 SQLite에서만 빠짐)
+    """
+    return None if value is None else float(np.float32(value))
+
+
+@dataclass(frozen=True)
+class TradeFilter:
+    """
+    면적 범위와 아파트명 조건.
+
+    Args:
+        min_area (float, optional): 최소 전용면적(m², 포함).
+        max_area (float, optional): 최대 전용면적(m², 포함).
+        apt_name (str, optional): 아파트명 부분 일치(대소문자 무시). '^'로 시작하면 접두 일치.
+    """
+
+    min_area: Optional[float] = None
+    max_area: Optional[float] = None
+    apt_name: Optional[str] = None
+
+    def __bool__(self) -> bool:
+        return self.min_area is not None or self.max_area is not None or bool(self.apt_name)
+
+    def area_overlaps(self, lo: Optional[float], hi: Optional[float]) -> bool:
+        """면적 범위가 [lo, hi]인 파티션에 조건을 만족하는 행이 있을 수 있는지 판단합니다. (통계가 없으면 True)"""
+        if lo is None or hi is None:
+            return True
+        min_area, max_area = _float32(self.min_area), _float32(self.max_area)
+        return (min_area is None or hi >= min_area) and (max_area is None or lo <= max_area)
+
+    def area_fraction(self, lo: Optional[float], hi: Optional[float]) -> float:
+        """
+        면적 범위가 [lo, hi]인 파티션에서 조건을 만족할 행의 비율 추정치. (면적이 고르게 분포한다고 가정)
+        면적 조건이나 통계가 없으면 1.0.
+        """
+        if (self.min_area is None and self.max_area is None) or lo is None or hi is None:
+            return 1.0
+        if not self.area_overlaps(lo, hi):
+            return 0.0
+        if hi <= lo:
+            return 1.0
+        start = max(lo, _float32(self.min_area) if self.min_area is not None else lo)
+        end = min(hi, _float32(self.max_area) if self.max_area is not None else hi)
+        return (end - start) / (hi - lo)
+
+    def names(self, index: NameIndex) -> Optional[Set[str]]:
+        """아파트명 조건에 맞는 이름 집합. 이름 조건이 없으면 None."""
+        return index.match(self.apt_name) if self.apt_name else None
+
+    def sql(self, names: Optional[Set[str]]) -> Tuple[str, List]:
+        """trades 테이블용 WHERE 조건(앞에 AND를 붙인 형태)과 바인딩 값을 반환합니다."""
+        clauses, params = [], []
+        if self.min_area is not None:
+            clauses.append("area >= ?")
+            params.append(_float32(self.min_area))
+        if self.max_area is not None:
+            clauses.append("area <= ?")
+            params.append(_float32(self.max_area))
+        if names is not None:
+            clauses.append(f"apt IN ({', '.join('?' * len(names))})")
+            params += sorted(names)
+        return "".join(f" AND {c}" for c in clauses), params
+
+    def apply(self, df: pd.DataFrame, index: Optional[NameIndex] = None) -> pd.DataFrame:
+        """메모리의 데이터프레임에 조건을 적용합니다. attrs는 유지됩니다."""
+        if df.empty or not self:
+            return df
+        mask = np.ones(len(df), dtype=bool)
+        if self.min_area is not None:
+            mask &= (df[AREA_COLUMN] >= _float32(self.min_area)).to_numpy(dtype=bool, na_value=False)
+        if self.max_area is not None:
+            mask &= (df[AREA_COLUMN] <= _float32(self.max_area)).to_numpy(dtype=bool, na_value=False)
+        if self.apt_name:
+            mask &= name_mask(df[NAME_COLUMN], self.apt_name, index)
+        if mask.all():
+            return df
+        out = df[mask]
+        out.attrs = dict(df.attrs)
+        return out
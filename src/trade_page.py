@@ -0,0 +1,103 @@
+# trade_page.py - /trade-data 페이지 조회(커서), 정렬, 필드 선택 모듈
+# 목록 화면은 100행씩, 지도는 필요한 필드만 받도록 /trade-data 응답의 크기를 제한합니다.
+#   - 정렬: sort=컬럼[,컬럼...] ('-'를 붙이면 내림차순). 안정 정렬이므로 같은 값의 행은 원래 순서(거래일 순)를
+#     유지하고, 정렬된 결과는 조회 결과 저장소(result_store)에 그대로 보관됩니다.
+#   - 페이지: 첫 요청(limit)에서 결과를 보관하고, 다음 페이지 커서에 (결과 ID, 위치, limit, 정렬)을 담습니다.
+#     이후 요청은 업스트림/캐시 조회 없이 보관된 결과에서 해당 행만 잘라 응답하므로,
+#     중간에 데이터가 갱신되어도 페이지가 밀리거나 겹치지 않습니다.
+#   - 필드 선택: fields=컬럼[,컬럼...]. 파생 문자열 필드(deal_amount 등)는 요청한 경우에만 계산합니다.
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from dataclasses import asdict, dataclass
+from typing import List, Optional, Tuple
+
+import pandas as pd
+
+from .trade_schema import COLUMNS, DERIVED_COLUMNS, add_derived_columns
+
+SortKeys = List[Tuple[str, bool]]  # (컬럼, 오름차순 여부)
+
+
+@dataclass(frozen=True)
+class Cursor:
+    """다음 페이지 위치. 클라이언트에는 불투명한 문자열(`encode()`)로 전달합니다."""
+
+    result_id: str
+    offset: int
+    limit: int
+    sort: Optional[str] = None
+
+    def encode(self) -> str:
+        raw = json.dumps(asdict(self), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> "Cursor":
+        """커서 문자열을 해석합니다. 형식이 잘못되면 ValueError."""
+        try:
+            raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+            cursor = cls(**json.loads(raw))
+        except (binascii.Error, UnicodeDecodeError, json.JSONDecodeError, TypeError) as e:
+            raise ValueError(f"잘못된 커서입니다: {e}") from None
+        if not (isinstance(cursor.offset, int) and isinstance(cursor.limit, int)
+                and cursor.offset >= 0 and cursor.limit >= 1):
+            raise ValueError("잘못된 커서입니다.")
+        return cursor
+
+
+def parse_sort(sort: Optional[str]) -> SortKeys:
+    """sort 파라미터를 (컬럼, 오름차순 여부) 목록으로 해석합니다. 표준 컬럼이 아니면 ValueError."""
+    keys: SortKeys = []
+    for part in (sort or "").split(","):
+        part = part.strip()
+        if not part:
+            continue
+        column, ascending = (part[1:], False) if part.startswith("-") else (part, True)
+        if column not in COLUMNS:
+            raise ValueError(f"정렬할 수 없는 필드입니다: {column} (가능: {', '.join(COLUMNS)})")
+        keys.append((column, ascending))
+    return keys
+
+
+def parse_fields(fields: Optional[str]) -> Optional[List[str]]:
+    """fields 파라미터를 컬럼 목록으로 해석합니다. 지정하지 않으면 None. 없는 필드면 ValueError."""
+    if fields is None:
+        return None
+    selected = list(dict.fromkeys(f.strip() for f in fields.split(",") if f.strip()))
+    unknown = [f for f in selected if f not in COLUMNS and f not in DERIVED_COLUMNS]
+    if unknown or not selected:
+        raise ValueError(f"알 수 없는 필드입니다: {', '.join(unknown) or '(없음)'} "
+                         f"(가능: {', '.join(COLUMNS + DERIVED_COLUMNS)})")
+    return selected
+
+
+def _sort_key(values: pd.Series) -> pd.Series:
+    # category는 카테고리 등록 순서(코드)가 아니라 문자열 순서로 정렬합니다.
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        return values.cat.reorder_categories(sorted(values.cat.categories), ordered=True)
+    return values
+
+
+def sort_trades(df: pd.DataFrame, keys: SortKeys) -> pd.DataFrame:
+    """안정 정렬로 거래를 정렬합니다. 결측값은 항상 마지막이며, attrs는 유지됩니다."""
+    if not keys or df.empty:
+        return df
+    out = df.sort_values([c for c, _ in keys], ascending=[a for _, a in keys], kind="stable",
+                         na_position="last", key=_sort_key, ignore_index=True)
+    out.attrs = dict(df.attrs)
+    return out
+
+
+def project(df: pd.DataFrame, fields: Optional[List[str]], derived: bool) -> pd.DataFrame:
+    """
+    응답할 컬럼만 남깁니다. fields가 없으면 표준 컬럼 전체(derived=True이면 파생 필드 포함).
+    파생 필드는 fields에 포함된 경우에만 계산합니다.
+    """
+    if fields is None:
+        return add_derived_columns(df) if derived else df
+    if any(f in DERIVED_COLUMNS for f in fields):
+        df = add_derived_columns(df)
+    return df[fields] if not df.empty else df
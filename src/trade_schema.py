@@ -0,0 +1,67 @@
+# trade_schema.py - 실거래 데이터프레임 표준 스키마 모듈
+# 조회/캐시 계층이 주고받는 실거래 데이터프레임의 컬럼과 타입을 한곳에서 정의합니다.
+#   - 아파트명, 도로명: category (반복되는 문자열을 정수 코드로 저장)
+#   - 거래금액: Int32, 전용면적: float32, 층·건축년도: Int16
+#   - 그래프용 문자열 필드(deal_amount, deal_year, deal_month)는 저장하지 않고,
+#     API 응답 직전에 add_derived_columns()로 필요한 경우에만 계산합니다.
+from __future__ import annotations
+
+from typing import Dict, List
+
+import pandas as pd
+from pandas.api.types import union_categoricals
+
+# 표준 컬럼 순서와 타입
+DTYPES: Dict[str, str] = {
+    "아파트": "category",
+    "거래금액(만원)": "Int32",
+    "전용면적(m²)": "float32",
+    "층": "Int16",
+    "건축년도": "Int16",
+    "거래일": "datetime64[ns]",
+    "도로명": "category",
+}
+COLUMNS: List[str] = list(DTYPES)
+CATEGORICAL_COLUMNS = [c for c, t in DTYPES.items() if t == "category"]
+
+# 프론트엔드 그래프가 사용하는 파생 문자열 컬럼
+DERIVED_COLUMNS = ["deal_amount", "deal_year", "deal_month"]
+
+
+def to_compact(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    데이터프레임을 표준 컬럼/타입으로 변환합니다. 파생 컬럼 등 표준 외 컬럼은 제거됩니다.
+    """
+    if df.empty:
+        return df
+    return df[COLUMNS].astype(DTYPES)
+
+
+def concat_trades(frames: List[pd.DataFrame]) -> pd.DataFrame:
+    """
+    여러 월 데이터프레임을 이어 붙입니다.
+    카테고리 집합이 서로 다른 category 컬럼은 pd.concat만으로는 object 타입이 되므로,
+    union_categoricals로 카테고리를 합쳐 category 타입을 유지합니다.
+    """
+    out = pd.concat(frames, ignore_index=True)
+    for col in CATEGORICAL_COLUMNS:
+        if col in out.columns and not isinstance(out[col].dtype, pd.CategoricalDtype):
+            out[col] = union_categoricals([f[col] for f in frames], ignore_order=True)
+    return out
+
+
+def add_derived_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    그래프용 문자열 컬럼(deal_amount, deal_year, deal_month)을 추가한 사본을 반환합니다.
+    API 응답처럼 기존 필드 구성이 필요한 곳에서만 호출합니다.
+    """
+    if df.empty:
+        return df
+    out = df.copy()
+    # 결측값은 "<NA>"·"2020.0" 같은 문자열이 아니라 null로 남도록, 결측을 뺀 값만 문자열로 바꿉니다.
+    amount = out["거래금액(만원)"]
+    out["deal_amount"] = amount.dropna().map("{:,}".format).reindex(amount.index)
+    out["deal_year"] = out["거래일"].dt.year.astype("Int16").astype("string")
+    out["deal_month"] = out["거래일"].dt.month.astype("Int16").astype("string")
+    return out
+
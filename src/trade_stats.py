@@ -0,0 +1,150 @@
+# trade_stats.py - 실거래 집계 통계 모듈
+# 대시보드가 월별 평균, 거래 건수, 면적당 가격 그래프를 그리려고 원본 거래 전체를 내려받지 않도록,
+# 서버에서 그룹별 통계를 계산하여 수 KB의 표로 돌려줍니다.
+#   - 그룹: 월(month), 아파트(apartment), 면적 구간(area), 층 구간(floor)
+#   - 지표: 거래 건수, 거래금액·㎡당 가격·평당 가격의 평균/중앙값/백분위수
+# 그룹마다 파이썬 반복을 돌지 않고, 그룹 번호와 값 순서로 한 번 정렬한 뒤
+# 그룹 경계 위치에서 백분위수를 보간하므로 100만 행도 수백 ms 안에 집계합니다.
+from __future__ import annotations
+
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .trade_filter import AREA_COLUMN, NAME_COLUMN
+
+PRICE_COLUMN = "거래금액(만원)"
+DATE_COLUMN = "거래일"
+FLOOR_COLUMN = "층"
+
+PYEONG_M2 = 400 / 121  # 1평 = 3.3058㎡
+
+GROUP_MONTH = "month"
+GROUP_APARTMENT = "apartment"
+GROUP_AREA = "area"
+GROUP_FLOOR = "floor"
+GROUP_BY = (GROUP_MONTH, GROUP_APARTMENT, GROUP_AREA, GROUP_FLOOR)
+
+# 면적 구간(전용면적 ㎡, 오른쪽 경계 포함): 60 이하 / 60 초과 85 이하(국민주택규모) / ... / 135 초과
+AREA_EDGES = (60.0, 85.0, 102.0, 135.0)
+AREA_LABELS = ("~60", "60~85", "85~102", "102~135", "135~")
+# 층 구간(오른쪽 경계 포함): 지하 / 1~5 / 6~10 / 11~15 / 16~20 / 21~30 / 31~
+FLOOR_EDGES = (0, 5, 10, 15, 20, 30)
+FLOOR_LABELS = ("지하", "1~5", "6~10", "11~15", "16~20", "21~30", "31~")
+
+DEFAULT_PERCENTILES = (10.0, 25.0, 75.0, 90.0)
+
+
+def _bins(values: np.ndarray, edges: Sequence[float]) -> np.ndarray:
+    """오른쪽 경계를 포함하는 구간 번호를 반환합니다. 결측값은 -1."""
+    codes = np.searchsorted(np.asarray(edges, dtype=np.float64), values, side="left")
+    codes[np.isnan(values)] = -1
+    return codes
+
+
+def _group_codes(df: pd.DataFrame, group_by: str) -> Tuple[np.ndarray, List[str]]:
+    """행마다 그룹 번호(제외할 행은 -1)와 그룹 이름 목록을 반환합니다."""
+    if group_by == GROUP_MONTH:
+        # 1970-01부터 센 월 번호로 바꾸고, 거래가 있는 월만 그룹 번호를 매깁니다. (정렬·문자열 변환 없음)
+        months = df[DATE_COLUMN].to_numpy(dtype="datetime64[ns]").astype("datetime64[M]")
+        valid = ~np.isnat(months)
+        codes = np.full(len(df), -1, dtype=np.int64)
+        if not valid.any():
+            return codes, []
+        offsets = months[valid].astype(np.int64)
+        first = offsets.min()
+        present = np.flatnonzero(np.bincount(offsets - first))
+        lookup = np.zeros(present[-1] + 1, dtype=np.int64)
+        lookup[present] = np.arange(len(present))
+        codes[valid] = lookup[offsets - first]
+        labels = (present + first).astype("datetime64[M]")
+        return codes, [str(m).replace("-", "") for m in labels]
+    if group_by == GROUP_APARTMENT:
+        names = df[NAME_COLUMN]
+        if not isinstance(names.dtype, pd.CategoricalDtype):
+            names = names.astype("category")
+        # 이름 순서로 그룹을 정렬합니다. (카테고리 코드는 등록 순서)
+        names = names.cat.reorder_categories(sorted(names.cat.categories))
+        return names.cat.codes.to_numpy(dtype=np.int64), list(names.cat.categories)
+    if group_by == GROUP_AREA:
+        area = df[AREA_COLUMN].to_numpy(dtype=np.float64, na_value=np.nan)
+        return _bins(area, AREA_EDGES), list(AREA_LABELS)
+    if group_by == GROUP_FLOOR:
+        floor = df[FLOOR_COLUMN].to_numpy(dtype=np.float64, na_value=np.nan)
+        return _bins(floor, FLOOR_EDGES), list(FLOOR_LABELS)
+    raise ValueError(f"group_by는 {', '.join(GROUP_BY)} 중 하나여야 합니다.")
+
+
+def _group_describe(codes: np.ndarray, values: np.ndarray, n_groups: int,
+                    quantiles: Sequence[float]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    그룹별 (건수, 평균, 분위수 행렬[len(quantiles), n_groups])을 계산합니다. 결측값은 제외합니다.
+    분위수는 numpy/pandas 기본값과 같은 선형 보간이며, 값이 없는 그룹은 NaN입니다.
+    """
+    valid = (codes >= 0) & ~np.isnan(values)
+    codes, values = codes[valid], values[valid]
+    counts = np.bincount(codes, minlength=n_groups)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        means = np.bincount(codes, weights=values, minlength=n_groups) / counts
+    # 값으로 정렬한 뒤 그룹 번호로 안정 정렬하면, 그룹마다 정렬된 값이 연속 구간 [start, start + count)에 놓입니다.
+    # (np.lexsort보다 두 번의 argsort가 2배가량 빠름)
+    by_value = np.argsort(values)
+    ordered = values[by_value[np.argsort(codes[by_value], kind="stable")]]
+    starts = np.cumsum(counts) - counts
+    result = np.full((len(quantiles), n_groups), np.nan)
+    has = counts > 0
+    if ordered.size:
+        for i, q in enumerate(quantiles):
+            pos = starts[has] + q * (counts[has] - 1)
+            lo = np.floor(pos).astype(np.int64)
+            hi = np.minimum(lo + 1, starts[has] + counts[has] - 1)
+            result[i, has] = ordered[lo] + (ordered[hi] - ordered[lo]) * (pos - lo)
+    return counts, means, result
+
+
+def trade_stats(df: pd.DataFrame, group_by: str = GROUP_MONTH,
+                percentiles: Sequence[float] = DEFAULT_PERCENTILES) -> pd.DataFrame:
+    """
+    거래 데이터프레임의 그룹별 통계표를 반환합니다. 거래가 없는 그룹은 제외합니다.
+
+    Args:
+        df (pd.DataFrame): 표준 스키마의 거래 데이터.
+        group_by (str): month(YYYYMM) | apartment | area(전용면적 구간) | floor(층 구간).
+        percentiles (Sequence[float]): 함께 계산할 백분위수(0~100). 중앙값(50)은 항상 포함됩니다.
+
+    Returns:
+        pd.DataFrame: group, count와, price / price_per_m2 / price_per_pyeong 각각의
+        _mean, _median, _p{백분위수} 컬럼. 금액 단위는 만원입니다.
+
+    Raises:
+        ValueError: group_by나 percentiles가 잘못된 경우.
+    """
+    percentiles = sorted({float(p) for p in percentiles} - {50.0})
+    if any(not 0 <= p <= 100 for p in percentiles):
+        raise ValueError("percentiles는 0~100 사이여야 합니다.")
+    codes, labels = _group_codes(df, group_by)
+    quantiles = [0.5] + [p / 100 for p in percentiles]
+    suffixes = ["median"] + [f"p{p:g}" for p in percentiles]
+
+    price = df[PRICE_COLUMN].to_numpy(dtype=np.float64, na_value=np.nan)
+    area = df[AREA_COLUMN].to_numpy(dtype=np.float64, na_value=np.nan)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        per_m2 = np.where(area > 0, price / area, np.nan)
+
+    counts, price_mean, price_q = _group_describe(codes, price, len(labels), quantiles)
+    _, m2_mean, m2_q = _group_describe(codes, per_m2, len(labels), quantiles)
+
+    columns: Dict[str, np.ndarray] = {"group": np.asarray(labels, dtype=object), "count": counts}
+    # 평당 가격은 ㎡당 가격의 상수배이므로, 평균과 (선형 보간) 분위수도 그대로 상수배입니다.
+    for name, mean, q, scale in (("price", price_mean, price_q, 1.0),
+                                 ("price_per_m2", m2_mean, m2_q, 1.0),
+                                 ("price_per_pyeong", m2_mean, m2_q, PYEONG_M2)):
+        columns[f"{name}_mean"] = mean * scale
+        for suffix, values in zip(suffixes, q):
+            columns[f"{name}_{suffix}"] = values * scale
+    out = pd.DataFrame(columns)
+    out = out[out["count"] > 0].reset_index(drop=True)
+    value_columns = out.columns[2:]
+    out[value_columns] = out[value_columns].round(1)
+    return out
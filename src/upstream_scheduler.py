@@ -0,0 +1,293 @@
+# upstream_scheduler.py - 업스트림(RTMS API) 요청 스케줄러 모듈
+# 프로세스의 모든 RTMS 요청이 하나의 스케줄러를 거치도록 하여
+#   ① 토큰 버킷으로 초당 요청 수를 제한하고,
+#   ② 인증키별 일일 호출 쿼터를 디스크에 기록하며,
+#   ③ 대화형(사용자) 요청이 백그라운드 작업보다 먼저 처리되도록 우선순위를 부여합니다.
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import hashlib
+import json
+import threading
+import time
+from datetime import datetime, timedelta
+from enum import IntEnum
+from pathlib import Path
+from typing import Any, Dict
+from zoneinfo import ZoneInfo
+
+try:
+    import fcntl
+except ImportError:  # Windows: 파일 잠금 없이 기록 (여러 프로세스가 같은 상태 파일을 쓰지 않는 경우에만 안전)
+    fcntl = None
+
+from .config import (
+    RTMS_BACKGROUND_QUOTA_SHARE,
+    RTMS_BURST,
+    RTMS_DAILY_QUOTA,
+    RTMS_QUOTA_STATE_PATH,
+    RTMS_RATE_PER_SEC,
+    SERVICE_KEY,
+)
+
+# 공공데이터포털의 일일 트래픽은 한국 시간 자정에 초기화됩니다.
+_KST = ZoneInfo("Asia/Seoul")
+
+
+class Priority(IntEnum):
+    """요청 우선순위. 값이 작을수록 먼저 처리됩니다."""
+
+    INTERACTIVE = 0  # 사용자가 기다리고 있는 요청
+    BACKGROUND = 1   # 프리페치, 백필 등 배치 작업
+
+
+class QuotaExceededError(RuntimeError):
+    """일일 호출 쿼터(또는 백그라운드 작업에 허용된 몫)를 모두 사용한 경우 발생합니다."""
+
+
+# --- 1. 일일 쿼터 카운터 ---
+class DailyQuota:
+    """
+    인증키별 일일 호출 수를 JSON 파일에 기록하는 카운터.
+    인증키 원문 대신 해시값을 키로 사용합니다.
+
+    같은 인증키를 쓰는 여러 프로세스(uvicorn 워커, 백필 CLI, 프리페치 데몬)가 상태 파일을 공유하므로,
+    기록할 때는 파일 잠금을 잡고 파일의 사용량을 다시 읽어 이 프로세스가 아직 기록하지 않은 호출 수만 더합니다.
+    (덮어쓰면 마지막에 기록한 프로세스의 사용량만 남음) 기록한 뒤의 `used`는 모든 프로세스의 합계입니다.
+
+    Args:
+        path (str | Path): 상태 파일 경로.
+        limit (int): 하루 최대 호출 수.
+        key_id (str): 인증키 식별자(해시).
+    """
+
+    _FLUSH_INTERVAL = 1.0  # 디스크 기록 최소 간격(초)
+
+    def __init__(self, path: str | Path, limit: int, key_id: str):
+        self.path = Path(path)
+        self.limit = limit
+        self.key_id = key_id
+        self.day = self._today()
+        self.used = 0
+        self._pending = 0  # 아직 파일에 더하지 않은 이 프로세스의 호출 수
+        self._last_flush = 0.0
+        self._lock = threading.Lock()        # 메모리의 사용량 (짧게만 잡음)
+        self._flush_lock = threading.Lock()  # 프로세스 안에서 기록을 하나씩 (디스크 입출력 동안 잡음)
+        self._load()
+
+    @staticmethod
+    def _today() -> str:
+        return datetime.now(_KST).strftime("%Y-%m-%d")
+
+    def _read_state(self) -> Dict[str, Any]:
+        try:
+            return json.loads(self.path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def _stored_used(self, state: Dict[str, Any], day: str) -> int:
+        entry = state.get(self.key_id, {})
+        return int(entry.get("used", 0)) if entry.get("date") == day else 0
+
+    def _load(self) -> None:
+        self.used = self._stored_used(self._read_state(), self.day)
+
+    @contextlib.contextmanager
+    def _locked(self):
+        """상태 파일 옆의 잠금 파일로 프로세스 간 배타 잠금을 잡습니다. (상태 파일은 교체되므로 직접 잠그지 않음)"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if fcntl is None:
+            yield
+            return
+        with open(self.path.with_suffix(".lock"), "a") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def roll_over(self) -> None:
+        """날짜가 바뀌었으면 사용량을 0으로 초기화합니다. (디스크에는 다음 `flush()`에서 기록)"""
+        today = self._today()
+        with self._lock:
+            if today != self.day:
+                self.day, self.used, self._pending = today, 0, 0
+                self._last_flush = 0.0
+
+    def consume(self) -> None:
+        """호출 한 건을 기록합니다. 디스크 입출력은 하지 않으므로, 호출자가 이어서 `flush()`를 호출합니다."""
+        with self._lock:
+            self.used += 1
+            self._pending += 1
+
+    def flush_due(self) -> bool:
+        """마지막 기록 후 최소 간격이 지났는지 반환합니다."""
+        return time.monotonic() - self._last_flush >= self._FLUSH_INTERVAL
+
+    def flush(self, force: bool = False) -> None:
+        """
+        이 프로세스의 사용량을 디스크의 합계에 더하고, 다른 프로세스의 사용량을 반영한 합계로 `used`를 갱신합니다.
+        과도한 쓰기를 막기 위해 최소 간격을 둡니다. 파일 잠금을 기다릴 수 있으므로 이벤트 루프에서 직접 호출하지 않습니다.
+        """
+        with self._flush_lock:
+            if not force and not self.flush_due():
+                return
+            self._last_flush = time.monotonic()
+            with self._lock:
+                day, pending = self.day, self._pending
+            with self._locked():
+                state = self._read_state()
+                stored = self._stored_used(state, day)
+                if pending or state.get(self.key_id, {}).get("date") != day:
+                    state[self.key_id] = {"date": day, "used": stored + pending}
+                    tmp = self.path.with_suffix(".tmp")
+                    tmp.write_text(json.dumps(state), encoding="utf-8")
+                    tmp.replace(self.path)  # 원자적 교체로 기록 도중 종료되어도 파일이 깨지지 않도록 함
+            with self._lock:
+                if self.day == day:  # 기록하는 동안 날짜가 바뀌었으면 새 날의 사용량은 그대로 둠
+                    self._pending -= pending
+                    self.used = stored + pending + self._pending
+
+    @property
+    def remaining(self) -> int:
+        return max(0, self.limit - self.used)
+
+
+# --- 2. 스케줄러 ---
+class UpstreamScheduler:
+    """
+    토큰 버킷 + 일일 쿼터 + 우선순위를 결합한 업스트림 요청 스케줄러.
+
+    동기 코드에서는 `acquire()`를, 비동기 코드에서는 `await acquire_async()`를
+    업스트림 요청 직전에 호출합니다. 대화형 요청이 대기 중이면 백그라운드 요청은 토큰을 양보합니다.
+
+    Args:
+        rate (float): 초당 토큰 충전 속도(초당 최대 요청 수).
+        burst (int): 버킷 최대 용량(순간 허용 요청 수).
+        quota (DailyQuota): 일일 쿼터 카운터.
+        background_share (float): 일일 쿼터 중 백그라운드 작업이 사용할 수 있는 비율.
+    """
+
+    def __init__(self, rate: float, burst: int, quota: DailyQuota, background_share: float = 0.9):
+        self.rate = rate
+        self.burst = burst
+        self.quota = quota
+        self.background_share = background_share
+        self._tokens = float(burst)
+        self._last_refill = time.monotonic()
+        self._waiting = {Priority.INTERACTIVE: 0, Priority.BACKGROUND: 0}
+        self._cond = threading.Condition()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._last_refill) * self.rate)
+        self._last_refill = now
+
+    def _check_quota(self, priority: Priority) -> None:
+        self.quota.roll_over()
+        limit = self.quota.limit
+        if priority == Priority.BACKGROUND:
+            limit = int(limit * self.background_share)
+        if self.quota.used >= limit:
+            raise QuotaExceededError(
+                f"RTMS 일일 쿼터 소진 ({self.quota.used}/{limit}, priority={priority.name})"
+            )
+
+    def _try_take(self, priority: Priority) -> float:
+        """
+        토큰을 하나 가져오면 0을, 아니면 다시 시도하기까지 기다릴 시간(초)을 반환합니다.
+        호출자는 self._cond를 잡고 있어야 합니다.
+        """
+        self._check_quota(priority)
+        self._refill()
+        if priority == Priority.BACKGROUND and self._waiting[Priority.INTERACTIVE] > 0:
+            return 1.0 / self.rate  # 대화형 요청에 양보
+        if self._tokens >= 1:
+            self._tokens -= 1
+            self.quota.consume()
+            return 0.0
+        return (1 - self._tokens) / self.rate
+
+    def acquire(self, priority: Priority = Priority.INTERACTIVE) -> None:
+        """
+        토큰을 얻을 때까지 현재 스레드를 대기시킵니다.
+
+        Raises:
+            QuotaExceededError: 일일 쿼터를 모두 사용한 경우.
+        """
+        with self._cond:
+            self._waiting[priority] += 1
+            try:
+                while True:
+                    wait = self._try_take(priority)
+                    if wait == 0:
+                        break
+                    self._cond.wait(wait)
+            finally:
+                self._waiting[priority] -= 1
+                self._cond.notify_all()
+        self.quota.flush()  # 디스크 기록은 스케줄러 잠금 밖에서 (다른 스레드의 토큰 획득을 막지 않도록)
+
+    async def acquire_async(self, priority: Priority = Priority.INTERACTIVE) -> None:
+        """
+        `acquire`의 비동기 버전. 대기하는 동안 이벤트 루프를 막지 않습니다.
+        쿼터 파일 기록(파일 잠금 대기 포함)은 기록할 때가 된 경우에만 스레드에서 실행합니다.
+        """
+        with self._cond:
+            self._waiting[priority] += 1
+        try:
+            while True:
+                with self._cond:
+                    wait = self._try_take(priority)
+                if wait == 0:
+                    break
+                await asyncio.sleep(wait)
+        finally:
+            with self._cond:
+                self._waiting[priority] -= 1
+                self._cond.notify_all()
+        if self.quota.flush_due():
+            await asyncio.to_thread(self.quota.flush)
+
+    def budget(self) -> Dict[str, Any]:
+        """현재 토큰, 일일 쿼터 사용량, 대기 중인 요청 수를 반환합니다. (모니터링/알림용)"""
+        with self._cond:
+            self.quota.roll_over()
+            self._refill()
+            reset_at = (datetime.now(_KST) + timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
+            return {
+                "rate_per_sec": self.rate,
+                "burst": self.burst,
+                "tokens": round(self._tokens, 2),
+                "daily_quota": self.quota.limit,
+                "used_today": self.quota.used,
+                "remaining_today": self.quota.remaining,
+                "remaining_ratio": round(self.quota.remaining / self.quota.limit, 4) if self.quota.limit else 0.0,
+                "background_limit": int(self.quota.limit * self.background_share),
+                "waiting": {p.name.lower(): n for p, n in self._waiting.items()},
+                "resets_at": reset_at.isoformat(),
+            }
+
+    def flush(self) -> None:
+        """쿼터 사용량을 즉시 디스크에 기록합니다. (종료 시 호출)"""
+        self.quota.flush(force=True)
+
+
+_scheduler: UpstreamScheduler | None = None
+_scheduler_lock = threading.Lock()
+
+
+def get_scheduler() -> UpstreamScheduler:
+    """
+    프로세스 전역에서 공유하는 RTMS 스케줄러를 반환합니다.
+    여러 스레드가 동시에 처음 호출해도 인스턴스가 하나만 만들어지도록 잠금을 사용합니다.
+    """
+    global _scheduler
+    if _scheduler is None:
+        with _scheduler_lock:
+            if _scheduler is None:
+                key_id = hashlib.sha256(SERVICE_KEY.encode("utf-8")).hexdigest()[:16]
+                quota = DailyQuota(RTMS_QUOTA_STATE_PATH, RTMS_DAILY_QUOTA, key_id)
+                _scheduler = UpstreamScheduler(RTMS_RATE_PER_SEC, RTMS_BURST, quota, RTMS_BACKGROUND_QUOTA_SHARE)
+    return _scheduler
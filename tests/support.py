@@ -0,0 +1,39 @@
+# support.py - 테스트 공통 환경
+# src.config는 import 시점에 환경 변수를 읽으므로, 테스트 모듈은 src보다 먼저 이 모듈을 import합니다.
+# 프로세스마다 목 서버(benchmarks.mock_rtms_server)를 하나 띄워 RTMS_ENDPOINT로 지정하고,
+# 거래 캐시와 쿼터 상태 파일은 임시 디렉토리에 둡니다.
+import atexit
+import os
+import shutil
+import tempfile
+
+from benchmarks.mock_rtms_server import start_mock_server
+
+MOCK_TOTAL_COUNT = 300  # 목 서버의 월별 거래 건수
+PAGE_ROWS = 100         # 한 달 = 3페이지
+
+mock_server = start_mock_server(total_count=MOCK_TOTAL_COUNT)
+atexit.register(mock_server.server_close)  # atexit은 역순으로 실행되므로 shutdown 다음에 닫힘
+atexit.register(mock_server.shutdown)
+
+_tmp = tempfile.mkdtemp(prefix="rtms-test-")
+atexit.register(shutil.rmtree, _tmp, True)
+
+os.environ.update({
+    "RTMS_ENDPOINT": mock_server.url,
+    "RTMS_PAGE_ROWS": str(PAGE_ROWS),
+    "TRADE_CACHE_PATH": os.path.join(_tmp, "trade_cache.sqlite3"),
+    "RTMS_QUOTA_STATE_PATH": os.path.join(_tmp, "rtms_quota.json"),
+    "RTMS_RATE_PER_SEC": "1000",
+    "RTMS_BURST": "1000",
+    "RTMS_DAILY_QUOTA": "1000000",
+    "RTMS_RETRY_BASE_DELAY": "0.01",
+    "RTMS_RETRY_MAX_DELAY": "0.05",
+})
+for _key in ("RTMS_KEY", "OPENAI_API_KEY", "VWORLD_API_KEY"):
+    os.environ.setdefault(_key, "test")
+
+
+def temp_path(name: str) -> str:
+    """테스트마다 쓸 임시 파일 경로를 반환합니다. (프로세스 종료 시 삭제)"""
+    return os.path.join(tempfile.mkdtemp(dir=_tmp), name)
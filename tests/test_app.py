@@ -0,0 +1,245 @@
+# test_app.py - FastAPI 엔드포인트 테스트 (목 서버 사용)
+# 실행: python -m unittest discover -s tests (또는 pytest tests)
+# 앱 전체 의존성(streamlit, prophet, langchain 등)이 설치되지 않은 환경에서는 건너뜁니다.
+import io
+import time
+import unittest
+from unittest import mock
+
+import pandas as pd
+
+import support  # noqa: F401  (src보다 먼저 환경 변수를 설정)
+
+try:
+    from fastapi.testclient import TestClient
+
+    from src.app import app
+except ImportError as e:
+    raise unittest.SkipTest(f"앱을 불러올 수 없습니다: {e}")
+
+from src.bulk_response import HAVE_PYARROW, frame_from_arrow, frame_to_arrow
+from src.result_store import ResultStore
+from src.trade_page import Cursor
+
+PARAMS = {"lawd_cd": "11680", "start_ym": "202301", "end_ym": "202301"}  # 300건
+
+
+class CursorPagingTest(unittest.TestCase):
+    """첫 페이지의 정렬이 이후 페이지와 커서에 그대로 이어지는지 확인합니다."""
+
+    SORT = "-거래금액(만원)"
+
+    @classmethod
+    def setUpClass(cls):
+        cls.client = TestClient(app)
+        cls.expected = cls.client.get("/trade-data", params={**PARAMS, "sort": cls.SORT}).json()
+
+    def _pages(self, repeat_sort: bool):
+        first = self.client.get("/trade-data", params={**PARAMS, "sort": self.SORT, "limit": 100})
+        self.assertEqual(first.status_code, 200)
+        responses = [first]
+        while "x-next-cursor" in responses[-1].headers:
+            cursor = responses[-1].headers["x-next-cursor"]
+            self.assertEqual(Cursor.decode(cursor).sort, self.SORT)
+            params = {**PARAMS, "cursor": cursor, **({"sort": self.SORT} if repeat_sort else {})}
+            responses.append(self.client.get("/trade-data", params=params))
+            self.assertEqual(responses[-1].status_code, 200, responses[-1].text)
+        return responses
+
+    def _check(self, responses):
+        self.assertEqual(len(responses), 3)
+        self.assertEqual([r.headers["x-total-count"] for r in responses], ["300"] * 3)
+        self.assertEqual([row for r in responses for row in r.json()], self.expected)
+
+    def test_sort_omitted_on_later_pages(self):
+        self._check(self._pages(repeat_sort=False))
+
+    def test_sort_repeated_on_later_pages(self):
+        self._check(self._pages(repeat_sort=True))
+
+    def test_different_sort_with_cursor(self):
+        first = self.client.get("/trade-data", params={**PARAMS, "sort": self.SORT, "limit": 100})
+        params = {**PARAMS, "cursor": first.headers["x-next-cursor"], "sort": "층"}
+        self.assertEqual(self.client.get("/trade-data", params=params).status_code, 400)
+
+
+class ContentNegotiationTest(unittest.TestCase):
+    """/trade-data가 Accept 헤더나 format 파라미터에 맞는 형식으로 같은 결과를 응답하는지 확인합니다."""
+
+    ARROW = "application/vnd.apache.arrow.stream"
+
+    @classmethod
+    def setUpClass(cls):
+        cls.client = TestClient(app)
+        cls.rows = cls.client.get("/trade-data", params=PARAMS).json()
+
+    def _get(self, accept=None, **params):
+        headers = {"Accept": accept} if accept else {}
+        return self.client.get("/trade-data", params={**PARAMS, **params}, headers=headers)
+
+    def test_default_json(self):
+        response = self._get()
+        self.assertEqual(response.headers["content-type"], "application/json")
+        self.assertIn("Accept", [v.strip() for v in response.headers["vary"].split(",")])
+        self.assertIn("deal_year", response.json()[0])
+
+    def test_csv(self):
+        response = self._get("text/csv")
+        self.assertTrue(response.headers["content-type"].startswith("text/csv"))
+        df = pd.read_csv(io.StringIO(response.text))
+        self.assertEqual(len(df), len(self.rows))
+        self.assertNotIn("deal_year", df.columns)  # 표준 스키마 컬럼만
+        self.assertEqual(df["거래금액(만원)"].tolist(), [r["거래금액(만원)"] for r in self.rows])
+
+    @unittest.skipUnless(HAVE_PYARROW, "pyarrow가 설치되지 않음")
+    def test_arrow(self):
+        for response in (self._get(self.ARROW), self._get(format="arrow"), self._get("text/csv", format="arrow")):
+            self.assertEqual(response.headers["content-type"], self.ARROW)
+            df = frame_from_arrow(response.content)
+            self.assertIsInstance(df["아파트"].dtype, pd.CategoricalDtype)
+            self.assertEqual(df["아파트"].astype(str).tolist(), [r["아파트"] for r in self.rows])
+
+    @unittest.skipUnless(HAVE_PYARROW, "pyarrow가 설치되지 않음")
+    def test_parquet_page(self):
+        response = self._get("application/vnd.apache.parquet", limit=100)
+        self.assertEqual(response.headers["x-total-count"], "300")
+        df = pd.read_parquet(io.BytesIO(response.content))
+        self.assertEqual(df["거래금액(만원)"].tolist(), [r["거래금액(만원)"] for r in self.rows[:100]])
+
+    def test_q_values(self):
+        response = self._get("application/json;q=0.5, text/csv")
+        self.assertTrue(response.headers["content-type"].startswith("text/csv"))
+
+    def test_unsupported(self):
+        response = self._get("application/xml")
+        self.assertEqual(response.status_code, 406)
+        self.assertIn("application/json", response.json()["detail"]["supported"])
+        self.assertEqual(self._get(format="xml").status_code, 400)
+
+
+class ResultIdTest(unittest.TestCase):
+    """/trade-data가 보관한 결과를 POST 엔드포인트가 result_id로 그대로 쓰는지 확인합니다."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.client = TestClient(app)
+        cls.response = cls.client.get("/trade-data", params=PARAMS)
+        cls.result_id = cls.response.headers["x-result-id"]
+
+    def test_post_with_result_id(self):
+        seen = []
+
+        def geocode(df):
+            seen.append(df)
+            return df
+
+        with mock.patch("src.app.get_geocoded_data", geocode):
+            response = self.client.post("/geocode-trade-history", json={"result_id": self.result_id})
+        self.assertEqual(response.status_code, 200, response.text)
+        self.assertEqual(response.json(), self.response.json())  # 응답과 같은 파생 필드 포함
+        self.assertEqual(len(seen[0]), 300)
+
+    def test_unknown_result_id(self):
+        for path, extra in [("/geocode-trade-history", {}), ("/forecast", {}), ("/chat", {"question": "평균 가격은?"})]:
+            response = self.client.post(path, json={"result_id": "없는결과", **extra})
+            self.assertEqual(response.status_code, 404, path)
+
+    def test_expired_cursor(self):
+        with mock.patch("src.app.get_result_store", return_value=ResultStore(ttl=0.1)):
+            first = self.client.get("/trade-data", params={**PARAMS, "limit": 100})
+            time.sleep(0.2)
+            response = self.client.get("/trade-data", params={**PARAMS, "cursor": first.headers["x-next-cursor"]})
+        self.assertEqual(response.status_code, 410)
+
+
+class RequestBodyTest(unittest.TestCase):
+    """POST 엔드포인트가 행 배열, 컬럼 배열, Arrow IPC 본문에서 같은 거래 데이터를 받는지 확인합니다."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.client = TestClient(app)
+        cls.rows = cls.client.get("/trade-data", params=PARAMS).json()
+
+    def setUp(self):
+        self.seen = []
+        patcher = mock.patch("src.app.get_geocoded_data", lambda df: self.seen.append(df) or df)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _post(self, **kwargs):
+        response = self.client.post("/geocode-trade-history", **kwargs)
+        self.assertEqual(response.status_code, 200, response.text)
+        return self.seen[-1]
+
+    def test_rows_and_columns(self):
+        by_rows = self._post(json={"trade_data": self.rows})
+        columns = {key: [row[key] for row in self.rows] for key in self.rows[0]}
+        by_columns = self._post(json={"trade_data": columns})
+        self.assertEqual(len(by_rows), 300)
+        pd.testing.assert_frame_equal(by_rows, by_columns)
+
+    @unittest.skipUnless(HAVE_PYARROW, "pyarrow가 설치되지 않음")
+    def test_arrow(self):
+        arrow = self.client.get("/trade-data", params=PARAMS, headers={"Accept": "application/vnd.apache.arrow.stream"})
+        df = self._post(content=arrow.content, headers={"Content-Type": "application/vnd.apache.arrow.stream"})
+        pd.testing.assert_frame_equal(df, frame_from_arrow(arrow.content))
+
+    @unittest.skipUnless(HAVE_PYARROW, "pyarrow가 설치되지 않음")
+    def test_arrow_with_query_fields(self):
+        arrow = bytes(frame_to_arrow(pd.DataFrame(self.rows)))
+        with mock.patch("src.app.get_forecast_data", return_value=(None, None)) as forecast:
+            response = self.client.post("/forecast", params={"periods": 3}, content=arrow,
+                                        headers={"Content-Type": "application/vnd.apache.arrow.stream"})
+        self.assertEqual(response.status_code, 400)  # 가짜 예측 결과가 없음
+        self.assertEqual(forecast.call_args.args[1], 3)
+        self.assertEqual(len(forecast.call_args.args[0]), 300)
+
+    def test_errors(self):
+        cases = [({"content": b"{", "headers": {"Content-Type": "application/json"}}, 422),
+                 ({"json": {"trade_data": [1, 2]}}, 422),
+                 ({"content": b"a,b", "headers": {"Content-Type": "text/csv"}}, 415),
+                 ({"json": {"trade_data": []}}, 400)]
+        for kwargs, status in cases:
+            self.assertEqual(self.client.post("/geocode-trade-history", **kwargs).status_code, status, kwargs)
+
+
+class TradeStatsEndpointTest(unittest.TestCase):
+    """/trade-stats가 /trade-data와 같은 조건의 거래를 집계하는지 확인합니다."""
+
+    STATS_PARAMS = {**PARAMS, "end_ym": "202303"}  # 3개월 × 300건
+
+    @classmethod
+    def setUpClass(cls):
+        cls.client = TestClient(app)
+        rows = pd.DataFrame(cls.client.get("/trade-data", params=cls.STATS_PARAMS).json())
+        cls.trades = rows.assign(month=pd.to_datetime(rows["거래일"]).dt.strftime("%Y%m"))
+
+    def _stats(self, **params):
+        return self.client.get("/trade-stats", params={**self.STATS_PARAMS, **params})
+
+    def test_month(self):
+        body = self._stats().json()
+        self.assertEqual((body["group_by"], body["rows"]), ("month", 900))
+        by_month = self.trades.groupby("month")["거래금액(만원)"]
+        self.assertEqual([g["group"] for g in body["groups"]], ["202301", "202302", "202303"])
+        self.assertEqual([g["count"] for g in body["groups"]], by_month.count().tolist())
+        self.assertEqual([g["price_median"] for g in body["groups"]], by_month.median().round(1).tolist())
+        self.assertEqual([g["price_p90"] for g in body["groups"]], by_month.quantile(0.9).round(1).tolist())
+
+    def test_filters_and_percentiles(self):
+        body = self._stats(group_by="apartment", min_area=85, percentiles="5,95").json()
+        expected = self.trades[self.trades["전용면적(m²)"] >= 85].groupby("아파트")["거래금액(만원)"]
+        self.assertEqual(body["rows"], int(expected.count().sum()))
+        self.assertEqual({g["group"]: g["count"] for g in body["groups"]}, expected.count().to_dict())
+        self.assertIn("price_p95", body["groups"][0])
+        self.assertNotIn("price_p90", body["groups"][0])
+
+    def test_errors(self):
+        self.assertEqual(self._stats(group_by="road").status_code, 400)
+        self.assertEqual(self._stats(percentiles="10,abc").status_code, 400)
+        self.assertEqual(self._stats(percentiles="101").status_code, 400)
+        self.assertEqual(self._stats(apt_name="없는아파트").status_code, 404)
+
+
+if __name__ == "__main__":
+    unittest.main()
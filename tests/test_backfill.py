@@ -0,0 +1,37 @@
+# test_backfill.py - 백필 대상 지역 해석 테스트
+# 실행: python -m unittest discover -s tests (또는 pytest tests)
+import contextlib
+import io
+import unittest
+
+import support  # noqa: F401  (src보다 먼저 환경 변수를 설정)
+
+with contextlib.redirect_stdout(io.StringIO()):  # 법정동 코드 로더의 DEBUG 출력 숨김
+    from src.backfill import resolve_regions
+    from src.district_code_loader import district_codes, load_lawd_table
+
+    load_lawd_table()
+
+
+class ResolveRegionsTest(unittest.TestCase):
+
+    def test_sido_includes_city_gu_codes(self):
+        codes = resolve_regions(["경기도"])
+        self.assertTrue({"41111", "41113", "41115", "41117"} <= set(codes))  # 수원시의 구
+
+    def test_codes_and_sido_deduplicated_in_order(self):
+        codes = resolve_regions(["41135", "경기도"])
+        self.assertEqual(codes[0], "41135")
+        self.assertEqual(len(codes), len(set(codes)))
+        self.assertEqual(set(codes), set(district_codes("경기도")))
+
+    def test_all(self):
+        self.assertEqual(resolve_regions(["all"]), district_codes())
+
+    def test_unknown_region(self):
+        with self.assertRaises(ValueError):
+            resolve_regions(["없는도"])
+
+
+if __name__ == "__main__":
+    unittest.main()
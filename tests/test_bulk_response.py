@@ -0,0 +1,82 @@
+# test_bulk_response.py - 응답 형식 협상(Accept)과 Arrow/Parquet/CSV 직렬화 테스트
+# 실행: python -m unittest discover -s tests (또는 pytest tests)
+import io
+import unittest
+from unittest import mock
+
+import pandas as pd
+
+import support  # noqa: F401  (src보다 먼저 환경 변수를 설정)
+
+from src import bulk_response
+from src.bulk_response import (FORMAT_ARROW, FORMAT_CSV, FORMAT_JSON, FORMAT_PARQUET, HAVE_PYARROW,
+                               frame_from_arrow, frame_to_arrow, frame_to_parquet, iter_csv, negotiate)
+from src.trade_schema import to_compact
+
+
+def _trades(rows: int = 10) -> pd.DataFrame:
+    return to_compact(pd.DataFrame({
+        "아파트": [f"아파트{i % 3}" for i in range(rows)],
+        "거래금액(만원)": [100000 + i for i in range(rows)],
+        "전용면적(m²)": [59.9 + i for i in range(rows)],
+        "층": [i % 20 for i in range(rows)],
+        "건축년도": [2000] * rows,
+        "거래일": pd.date_range("2020-01-01", periods=rows, freq="D"),
+        "도로명": ["테스트로"] * rows,
+    }))
+
+
+class NegotiateTest(unittest.TestCase):
+
+    def test_default_json(self):
+        for accept in (None, "", "*/*", "application/*", "application/json"):
+            self.assertEqual(negotiate(accept), FORMAT_JSON, accept)
+
+    def test_media_types(self):
+        self.assertEqual(negotiate("text/csv"), FORMAT_CSV)
+        self.assertEqual(negotiate("text/*"), FORMAT_CSV)
+        self.assertEqual(negotiate("Text/CSV; charset=utf-8"), FORMAT_CSV)
+        if HAVE_PYARROW:
+            self.assertEqual(negotiate("application/vnd.apache.arrow.stream"), FORMAT_ARROW)
+            self.assertEqual(negotiate("application/vnd.apache.parquet"), FORMAT_PARQUET)
+            self.assertEqual(negotiate("application/x-parquet"), FORMAT_PARQUET)
+
+    def test_quality_values(self):
+        self.assertEqual(negotiate("application/json;q=0.5, text/csv"), FORMAT_CSV)
+        self.assertEqual(negotiate("text/csv;q=0.2, application/json;q=0.9"), FORMAT_JSON)
+        self.assertEqual(negotiate("text/csv;q=0, application/json;q=0.1"), FORMAT_JSON)
+        self.assertEqual(negotiate("text/csv;q=abc, application/json;q=0.1"), FORMAT_JSON)  # 잘못된 q는 0
+        self.assertEqual(negotiate("text/csv, application/json"), FORMAT_CSV)  # 같은 q는 헤더 순서
+
+    def test_unsupported(self):
+        self.assertIsNone(negotiate("application/xml"))
+        self.assertIsNone(negotiate("text/csv;q=0"))
+
+    def test_without_pyarrow(self):
+        with mock.patch.object(bulk_response, "HAVE_PYARROW", False):
+            self.assertIsNone(negotiate("application/vnd.apache.arrow.stream"))
+            self.assertEqual(negotiate("application/vnd.apache.parquet, application/json;q=0.5"), FORMAT_JSON)
+
+
+class SerializationTest(unittest.TestCase):
+
+    @unittest.skipUnless(HAVE_PYARROW, "pyarrow가 설치되지 않음")
+    def test_arrow_round_trip(self):
+        df = _trades()
+        pd.testing.assert_frame_equal(frame_from_arrow(frame_to_arrow(df)), df)
+
+    @unittest.skipUnless(HAVE_PYARROW, "pyarrow가 설치되지 않음")
+    def test_parquet_round_trip(self):
+        df = _trades()
+        pd.testing.assert_frame_equal(pd.read_parquet(io.BytesIO(bytes(frame_to_parquet(df)))), df)
+
+    def test_csv_chunks(self):
+        df = _trades(25)
+        chunks = list(iter_csv(df, chunk_rows=10))
+        self.assertEqual(len(chunks), 4)  # 헤더 + 10 + 10 + 5행
+        self.assertEqual(b"".join(chunks).decode("utf-8"), df.to_csv(index=False))
+        self.assertEqual(b"".join(iter_csv(df.iloc[:0])).decode("utf-8"), df.iloc[:0].to_csv(index=False))
+
+
+if __name__ == "__main__":
+    unittest.main()
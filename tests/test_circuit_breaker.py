@@ -0,0 +1,71 @@
+# test_circuit_breaker.py - 서킷 브레이커 반개방(HALF_OPEN) 시험 요청 자리 반환 테스트
+# 실행: python -m unittest discover -s tests (또는 pytest tests)
+import asyncio
+import time
+import unittest
+
+from src.circuit_breaker import CircuitBreaker, CircuitOpenError, CircuitState
+
+
+def _half_open_breaker(**kwargs) -> CircuitBreaker:
+    """실패 두 번으로 회로를 연 뒤, 대기 시간 0으로 바로 시험 요청을 허용하는 브레이커."""
+    breaker = CircuitBreaker("test", failure_rate=0.5, window=2, min_calls=2, open_seconds=0.0, **kwargs)
+    for _ in range(2):
+        breaker.before_call()
+        breaker.on_failure(ConnectionError())
+    assert breaker.state == CircuitState.OPEN
+    return breaker
+
+
+class HalfOpenProbeTest(unittest.TestCase):
+    def test_cancelled_async_probe_releases_slot(self):
+        breaker = _half_open_breaker()
+
+        async def scenario():
+            started = asyncio.Event()
+
+            async def slow():
+                started.set()
+                await asyncio.sleep(10)
+
+            probe = asyncio.ensure_future(breaker.call_async(slow))
+            await started.wait()
+            self.assertEqual(breaker.state, CircuitState.HALF_OPEN)
+            probe.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await probe
+
+            async def ok():
+                return "ok"
+
+            # 취소된 시험 요청이 자리를 돌려주었으므로 다음 요청이 시험 요청이 되고, 성공하면 회로가 닫힙니다.
+            return await breaker.call_async(ok)
+
+        self.assertEqual(asyncio.run(scenario()), "ok")
+        self.assertEqual(breaker.state, CircuitState.CLOSED)
+
+    def test_interrupted_sync_probe_releases_slot(self):
+        breaker = _half_open_breaker()
+
+        def interrupted():
+            raise KeyboardInterrupt
+
+        with self.assertRaises(KeyboardInterrupt):
+            breaker.call(interrupted)
+        self.assertEqual(breaker.state, CircuitState.HALF_OPEN)
+        self.assertEqual(breaker.call(lambda: 1), 1)
+        self.assertEqual(breaker.state, CircuitState.CLOSED)
+
+    def test_leaked_probe_is_reclaimed_after_timeout(self):
+        breaker = _half_open_breaker(half_open_timeout=0.05)
+        breaker.before_call()  # 결과를 기록하지 않는 시험 요청
+        with self.assertRaises(CircuitOpenError):
+            breaker.before_call()
+        time.sleep(0.06)
+        breaker.before_call()  # 시간이 지나면 자리를 회수하여 새 시험 요청 허용
+        breaker.on_success()
+        self.assertEqual(breaker.state, CircuitState.CLOSED)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,40 @@
+# test_district_code_loader.py - 시/도 → 시/군/구 법정동 코드 확장 테스트
+# 실행: python -m unittest discover -s tests (또는 pytest tests)
+import contextlib
+import io
+import unittest
+
+with contextlib.redirect_stdout(io.StringIO()):  # 로더의 DEBUG 출력 숨김
+    from src.district_code_loader import build_lawd_dict, district_codes, load_lawd_table
+
+    load_lawd_table()
+
+SUWON_GU = {"41111", "41113", "41115", "41117"}  # 장안구, 권선구, 팔달구, 영통구
+
+
+class DistrictCodesTest(unittest.TestCase):
+
+    def test_sido_includes_every_gu_of_a_city(self):
+        codes = district_codes("경기도")
+        self.assertTrue(SUWON_GU <= set(codes))
+        self.assertTrue({"41131", "41133", "41135"} <= set(codes))  # 성남시
+        self.assertGreater(len(codes), len(build_lawd_dict()["경기도"]))
+
+    def test_sido_level_codes_excluded(self):
+        self.assertNotIn("41000", district_codes("경기도"))
+        self.assertFalse(any(code.endswith("000") for code in district_codes()))
+
+    def test_nationwide_covers_every_sido(self):
+        codes = set(district_codes())
+        self.assertTrue(SUWON_GU <= codes)
+        self.assertIn("36110", codes)  # 세종특별자치시 (시/도와 시/군/구 이름이 같음)
+        for sido in build_lawd_dict():
+            self.assertTrue(set(district_codes(sido)) <= codes, sido)
+
+    def test_unknown_sido(self):
+        with self.assertRaises(KeyError):
+            district_codes("없는도")
+
+
+if __name__ == "__main__":
+    unittest.main()
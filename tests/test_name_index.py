@@ -0,0 +1,85 @@
+# test_name_index.py - 아파트명 n-gram 역색인과 이름 필터 테스트
+# 실행: python -m unittest discover -s tests (또는 pytest tests)
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from src.name_index import NameIndex, name_mask
+from src.trade_filter import TradeFilter
+
+NAMES = ["래미안대치팰리스", "래미안", "대치래미안", "은마", "e편한세상", "E편한세상 대치", "XI타워", "자이",
+         "개포자이", "개포래미안포레스트", "A", "ab"]
+
+
+def _brute_search(names, query):
+    return {n for n in names if query.casefold() in n.casefold()}
+
+
+def _brute_prefix(names, query):
+    return {n for n in names if n.casefold().startswith(query.casefold())}
+
+
+class NameIndexTest(unittest.TestCase):
+
+    def setUp(self):
+        self.index = NameIndex(NAMES)
+
+    def test_search_matches_substring_scan(self):
+        queries = {n[i:j] for n in NAMES for i in range(len(n)) for j in range(i + 1, min(len(n), i + 4) + 1)}
+        queries |= {"없는이름", "래미안x", "미안대", "ㄹ", "E편한", "xi"}
+        for query in sorted(queries):
+            self.assertEqual(self.index.search(query), _brute_search(NAMES, query), query)
+
+    def test_prefix_matches_startswith(self):
+        for query in ["래미안", "래", "개포", "e편", "E편한세상 ", "x", "없는", ""]:
+            self.assertEqual(self.index.prefix(query), _brute_prefix(NAMES, query), query)
+
+    def test_match(self):
+        self.assertEqual(self.index.match("^래미안"), {"래미안대치팰리스", "래미안"})
+        self.assertEqual(self.index.match("래미안"), {"래미안대치팰리스", "래미안", "대치래미안", "개포래미안포레스트"})
+
+    def test_add(self):
+        index = NameIndex()
+        self.assertEqual(index.add(["은마", "은마", None, "", "은마아파트"]), 2)
+        self.assertEqual(index.add(["은마", "EUNMA", "eunma"]), 2)  # 대소문자만 다른 이름은 따로 보관
+        self.assertEqual(len(index), 4)
+        self.assertIn("eunma", index)
+        self.assertEqual(index.search("Eun"), {"EUNMA", "eunma"})
+        self.assertEqual(index.missing(["은마", "새이름"]), {"새이름"})
+
+
+class NameMaskTest(unittest.TestCase):
+
+    def setUp(self):
+        self.names = pd.Series(["래미안", "은마", None, "대치래미안", "은마", "자이"], dtype="category")
+        self.expected = [True, False, False, True, False, False]
+
+    def test_category_column(self):
+        self.assertEqual(name_mask(self.names, "래미안").tolist(), self.expected)
+
+    def test_object_column(self):
+        self.assertEqual(name_mask(self.names.astype(object), "래미안").tolist(), self.expected)
+
+    def test_index_missing_some_categories(self):
+        index = NameIndex(["래미안", "은마"])  # "대치래미안"은 색인에 아직 없음
+        self.assertEqual(name_mask(self.names, "래미안", index).tolist(), self.expected)
+
+    def test_unused_name_in_index(self):
+        index = NameIndex(["래미안", "은마", "대치래미안", "자이", "삭제된래미안"])
+        self.assertEqual(name_mask(self.names, "래미안", index).tolist(), self.expected)
+
+    def test_trade_filter_matches_str_contains(self):
+        rng = np.random.default_rng(0)
+        df = pd.DataFrame({"아파트": pd.Categorical(rng.choice(NAMES, 500)),
+                           "전용면적(m²)": rng.uniform(20, 200, 500).astype("float32")})
+        for query in ["래미안", "^개포", "대치", "e편한", "^A", "없는이름"]:
+            got = TradeFilter(apt_name=query).apply(df, NameIndex(NAMES))
+            names = df["아파트"].astype(str).str.casefold()
+            expected = df[names.str.startswith(query[1:].casefold()) if query.startswith("^")
+                          else names.str.contains(query.casefold(), regex=False)]
+            self.assertEqual(got.index.tolist(), expected.index.tolist(), query)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,29 @@
+# test_prefetch_daemon.py - 최신 월 프리페치 대상 테스트
+# 실행: python -m unittest discover -s tests (또는 pytest tests)
+import contextlib
+import io
+import unittest
+from datetime import datetime
+
+import support  # noqa: F401  (src보다 먼저 환경 변수를 설정)
+
+with contextlib.redirect_stdout(io.StringIO()):  # 법정동 코드 로더의 DEBUG 출력 숨김
+    from src.district_code_loader import load_lawd_table
+    from src.prefetch_daemon import all_lawd_cds, latest_months
+
+    load_lawd_table()
+
+
+class PrefetchTargetsTest(unittest.TestCase):
+
+    def test_all_lawd_cds_includes_city_gu_codes(self):
+        codes = all_lawd_cds()
+        self.assertTrue({"41111", "41113", "41115", "41117"} <= set(codes))  # 수원시의 구
+        self.assertEqual(codes, sorted(set(codes)))
+
+    def test_latest_months(self):
+        self.assertEqual(latest_months(2, datetime(2024, 1, 15)), ["202401", "202312"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+# test_request_body.py - 거래 데이터 POST 요청 본문(행 배열, 컬럼 배열, Arrow IPC) 파싱 테스트
+# 실행: python -m unittest discover -s tests (또는 pytest tests)
+import json
+import unittest
+from typing import Optional
+from unittest import mock
+
+import pandas as pd
+from fastapi import HTTPException
+from fastapi.exceptions import RequestValidationError
+from pydantic import BaseModel
+
+import support  # noqa: F401  (src보다 먼저 환경 변수를 설정)
+
+from src import request_body
+from src.bulk_response import HAVE_PYARROW, frame_to_arrow
+from src.request_body import ARROW_MEDIA_TYPE, parse_trade_body
+
+ROWS = [
+    {"아파트": "가", "거래금액(만원)": 100000, "거래일": "2020-01-10"},
+    {"아파트": "나", "거래금액(만원)": 90000, "거래일": "2020-01-20"},
+]
+COLUMNS = {"아파트": ["가", "나"], "거래금액(만원)": [100000, 90000], "거래일": ["2020-01-10", "2020-01-20"]}
+
+
+class _Request(BaseModel):
+    result_id: Optional[str] = None
+    periods: Optional[int] = 12
+
+
+def _parse(payload, content_type="application/json", query=None):
+    body = payload if isinstance(payload, bytes) else json.dumps(payload).encode("utf-8")
+    return parse_trade_body(body, content_type, query or {}, _Request)
+
+
+class JsonBodyTest(unittest.TestCase):
+
+    def test_rows_and_columns_give_same_frame(self):
+        model, rows = _parse({"trade_data": ROWS, "periods": 6})
+        self.assertEqual(model, _Request(periods=6))
+        _, columns = _parse({"trade_data": COLUMNS, "periods": 6})
+        pd.testing.assert_frame_equal(rows, columns)
+        pd.testing.assert_frame_equal(rows, pd.DataFrame(ROWS))
+
+    def test_without_trade_data(self):
+        model, df = _parse({"result_id": "abc"})
+        self.assertEqual((model.result_id, df), ("abc", None))
+        model, df = _parse(b"")
+        self.assertEqual((model, df), (_Request(), None))
+
+    def test_json_media_types(self):
+        for content_type in ("application/json; charset=utf-8", "application/merge-patch+json", ""):
+            _, df = _parse({"trade_data": ROWS}, content_type)
+            self.assertEqual(len(df), 2, content_type)
+
+    def test_invalid_bodies(self):
+        for payload in (b"{", [1, 2], {"trade_data": [1, 2]}, {"trade_data": {"아파트": "가"}},
+                        {"trade_data": {"아파트": ["가"], "층": [1, 2]}}, {"trade_data": "가"},
+                        {"trade_data": ROWS, "periods": "열두"}):
+            with self.subTest(payload=payload), self.assertRaises(RequestValidationError):
+                _parse(payload)
+
+    def test_field_error_location(self):
+        with self.assertRaises(RequestValidationError) as ctx:
+            _parse({"periods": "열두"})
+        self.assertEqual(ctx.exception.errors()[0]["loc"], ("body", "periods"))
+
+    def test_unsupported_media_type(self):
+        with self.assertRaises(HTTPException) as ctx:
+            _parse(b"a,b\n1,2\n", "text/csv")
+        self.assertEqual(ctx.exception.status_code, 415)
+
+
+class ArrowBodyTest(unittest.TestCase):
+
+    @unittest.skipUnless(HAVE_PYARROW, "pyarrow가 설치되지 않음")
+    def test_arrow_body_with_query_fields(self):
+        df = pd.DataFrame(COLUMNS).astype({"아파트": "category", "거래금액(만원)": "Int32"})
+        model, got = _parse(bytes(frame_to_arrow(df)), ARROW_MEDIA_TYPE, {"periods": "6"})
+        self.assertEqual(model, _Request(periods=6))
+        pd.testing.assert_frame_equal(got, df)
+
+    @unittest.skipUnless(HAVE_PYARROW, "pyarrow가 설치되지 않음")
+    def test_invalid_arrow_body(self):
+        with self.assertRaises(HTTPException) as ctx:
+            _parse(b"not an arrow stream", ARROW_MEDIA_TYPE)
+        self.assertEqual(ctx.exception.status_code, 400)
+
+    def test_without_pyarrow(self):
+        with mock.patch.object(request_body, "HAVE_PYARROW", False), self.assertRaises(HTTPException) as ctx:
+            _parse(b"", ARROW_MEDIA_TYPE)
+        self.assertEqual(ctx.exception.status_code, 415)
+
+
+if __name__ == "__main__":
+    unittest.main()
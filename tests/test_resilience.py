@@ -0,0 +1,174 @@
+# test_resilience.py - 재시도(지터 백오프)와 헤지 요청 테스트
+# 실행: python -m unittest discover -s tests (또는 pytest tests)
+import asyncio
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+import httpx
+import requests
+
+from src.resilience import (LatencyTracker, RetryPolicy, hedged_call, hedged_call_async, is_retryable,
+                            retry_call, retry_call_async)
+from src.rtms_parser import ParseError
+
+FAST_RETRY = RetryPolicy(attempts=3, base_delay=0.01, max_delay=0.01)
+
+
+def _http_error(status: int) -> requests.exceptions.HTTPError:
+    response = requests.Response()
+    response.status_code = status
+    return requests.exceptions.HTTPError(f"{status}", response=response)
+
+
+def _flaky(errors):
+    """errors를 차례로 던진 뒤 "ok"를 반환하는 함수와 호출 기록을 반환합니다."""
+    calls = []
+
+    def fn():
+        calls.append(1)
+        if len(calls) <= len(errors):
+            raise errors[len(calls) - 1]
+        return "ok"
+    return fn, calls
+
+
+def _tracker(delay: float) -> LatencyTracker:
+    """표본 하나로 바로 헤지 기준 시간(delay)이 정해지는 추적기."""
+    tracker = LatencyTracker(min_delay=delay, min_samples=1)
+    tracker.record(0.0)
+    return tracker
+
+
+class IsRetryableTest(unittest.TestCase):
+
+    def test_transient_errors(self):
+        for exc in (requests.exceptions.ConnectionError(), requests.exceptions.Timeout(),
+                    httpx.ConnectError("연결 실패"), ParseError("잘린 응답"), _http_error(503), _http_error(429)):
+            self.assertTrue(is_retryable(exc), exc)
+
+    def test_permanent_errors(self):
+        for exc in (_http_error(404), _http_error(400), ValueError("API 오류")):
+            self.assertFalse(is_retryable(exc), exc)
+
+
+class RetryCallTest(unittest.TestCase):
+
+    def test_recovers_from_transient_errors(self):
+        fn, calls = _flaky([_http_error(503), requests.exceptions.ConnectionError()])
+        with mock.patch("builtins.print"):
+            self.assertEqual(retry_call(fn, FAST_RETRY), "ok")
+        self.assertEqual(len(calls), 3)
+
+    def test_gives_up_after_attempts(self):
+        fn, calls = _flaky([_http_error(503)] * 3)
+        with mock.patch("builtins.print"), self.assertRaises(requests.exceptions.HTTPError):
+            retry_call(fn, FAST_RETRY)
+        self.assertEqual(len(calls), 3)
+
+    def test_permanent_error_not_retried(self):
+        fn, calls = _flaky([_http_error(404)])
+        with self.assertRaises(requests.exceptions.HTTPError):
+            retry_call(fn, FAST_RETRY)
+        self.assertEqual(len(calls), 1)
+
+    def test_backoff_bounds(self):
+        policy = RetryPolicy(attempts=5, base_delay=0.5, max_delay=2.0)
+        for attempt, cap in enumerate([0.5, 1.0, 2.0, 2.0]):
+            delays = [policy.backoff(attempt) for _ in range(200)]
+            self.assertTrue(all(0 <= d <= cap for d in delays), attempt)
+
+    def test_async(self):
+        errors = [httpx.ConnectError("연결 실패"), _http_error(502)]
+        calls = []
+
+        async def fn():
+            calls.append(1)
+            if len(calls) <= len(errors):
+                raise errors[len(calls) - 1]
+            return "ok"
+
+        with mock.patch("builtins.print"):
+            self.assertEqual(asyncio.run(retry_call_async(fn, FAST_RETRY)), "ok")
+        self.assertEqual(len(calls), 3)
+
+
+class LatencyTrackerTest(unittest.TestCase):
+
+    def test_no_hedge_until_enough_samples(self):
+        tracker = LatencyTracker(min_samples=20)
+        for _ in range(19):
+            tracker.record(0.1)
+        self.assertIsNone(tracker.hedge_delay())
+        tracker.record(0.1)
+        self.assertEqual(tracker.hedge_delay(), 1.0)  # 하한(min_delay)
+
+    def test_percentile(self):
+        tracker = LatencyTracker(percentile=95, min_delay=0.0, min_samples=1)
+        for i in range(100):
+            tracker.record(i / 100)
+        self.assertAlmostEqual(tracker.hedge_delay(), 0.95)
+
+
+class HedgedCallTest(unittest.TestCase):
+
+    def setUp(self):
+        self.executor = ThreadPoolExecutor(4)
+        self.addCleanup(self.executor.shutdown)
+
+    def test_slow_call_hedged(self):
+        calls = []
+
+        def fn():
+            calls.append(1)
+            if len(calls) == 1:
+                time.sleep(1.0)
+                return "slow"
+            return "fast"
+
+        started = time.monotonic()
+        with mock.patch("builtins.print"):
+            self.assertEqual(hedged_call(fn, self.executor, _tracker(0.1)), "fast")
+        self.assertLess(time.monotonic() - started, 0.5)
+        self.assertEqual(len(calls), 2)
+
+    def test_fast_call_not_hedged(self):
+        calls = []
+        self.assertEqual(hedged_call(lambda: calls.append(1) or "ok", self.executor, _tracker(0.5)), "ok")
+        self.assertEqual(len(calls), 1)
+
+    def test_first_error_when_both_fail(self):
+        def fn():
+            time.sleep(0.2)
+            raise ConnectionError("실패")
+
+        with mock.patch("builtins.print"), self.assertRaises(ConnectionError):
+            hedged_call(fn, self.executor, _tracker(0.05))
+
+    def test_async_slow_call_hedged_and_cancelled(self):
+        calls, cancelled = [], []
+
+        async def fn():
+            calls.append(1)
+            if len(calls) == 1:
+                try:
+                    await asyncio.sleep(1.0)
+                except asyncio.CancelledError:
+                    cancelled.append(1)
+                    raise
+                return "slow"
+            return "fast"
+
+        async def scenario():
+            result = await hedged_call_async(fn, _tracker(0.1))
+            await asyncio.sleep(0)  # 취소가 전달될 차례를 줌
+            return result
+
+        with mock.patch("builtins.print"):
+            self.assertEqual(asyncio.run(scenario()), "fast")
+        self.assertEqual((len(calls), len(cancelled)), (2, 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
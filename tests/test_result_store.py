@@ -0,0 +1,79 @@
+# test_result_store.py - 조회 결과 저장소(TTL, 메모리 한도 LRU) 테스트
+# 실행: python -m unittest discover -s tests (또는 pytest tests)
+import time
+import unittest
+
+import pandas as pd
+
+import support  # noqa: F401  (src보다 먼저 환경 변수를 설정)
+
+from src.result_store import ResultStore
+
+
+def _frame(rows: int = 100) -> pd.DataFrame:
+    return pd.DataFrame({"거래금액(만원)": range(rows), "층": [1] * rows})
+
+
+def _nbytes(df: pd.DataFrame) -> int:
+    return int(df.memory_usage(index=True, deep=True).sum())
+
+
+class ResultStoreTest(unittest.TestCase):
+
+    def test_get_returns_copy(self):
+        store = ResultStore()
+        df = _frame()
+        result_id = store.put(df)
+        got = store.get(result_id)
+        pd.testing.assert_frame_equal(got, df)
+        got.loc[0, "층"] = 99
+        self.assertEqual(store.get(result_id).loc[0, "층"], 1)
+
+    def test_unknown_id(self):
+        store = ResultStore()
+        self.assertIsNone(store.get("없는결과"))
+        self.assertIsNone(store.page("없는결과", 0, 10))
+
+    def test_page(self):
+        store = ResultStore()
+        result_id = store.put(_frame())
+        page, total = store.page(result_id, 90, 120)
+        self.assertEqual(total, 100)
+        self.assertEqual(page["거래금액(만원)"].tolist(), list(range(90, 100)))
+
+    def test_expires_after_ttl(self):
+        store = ResultStore(ttl=0.2)
+        result_id = store.put(_frame())
+        time.sleep(0.3)
+        self.assertIsNone(store.get(result_id))
+        self.assertEqual(store.stats()["entries"], 0)
+
+    def test_use_extends_ttl(self):
+        store = ResultStore(ttl=0.3)
+        used, unused = store.put(_frame()), store.put(_frame())
+        for _ in range(3):
+            time.sleep(0.15)
+            self.assertIsNotNone(store.page(used, 0, 1))
+        self.assertIsNone(store.get(unused))
+        self.assertIsNotNone(store.get(used))
+
+    def test_least_recently_used_evicted_over_limit(self):
+        size = _nbytes(_frame())
+        store = ResultStore(max_bytes=size * 2)
+        first, second = store.put(_frame()), store.put(_frame())
+        store.get(first)  # second가 가장 오래 사용하지 않은 결과가 됨
+        third = store.put(_frame())
+        self.assertIsNone(store.get(second))
+        self.assertIsNotNone(store.get(first))
+        self.assertIsNotNone(store.get(third))
+        stats = store.stats()
+        self.assertEqual((stats["entries"], stats["bytes"], stats["evicted"]), (2, size * 2, 1))
+
+    def test_result_larger_than_limit_not_stored(self):
+        store = ResultStore(max_bytes=_nbytes(_frame()) - 1)
+        self.assertIsNone(store.put(_frame()))
+        self.assertEqual(store.stats()["entries"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,383 @@
+# test_rtms_client.py - RTMS 조회 엔진 테스트 (목 서버 사용)
+# 실행: python -m unittest discover -s tests (또는 pytest tests)
+import asyncio
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+import pandas as pd
+
+import support
+
+from benchmarks.mock_rtms_server import build_items
+from src import rtms_client
+from src.circuit_breaker import CircuitBreaker
+from src.http_pool import aclose_async_client
+from src.resilience import LatencyTracker, is_retryable
+from src.trade_cache import TradeCache, get_trade_cache
+from src.trade_filter import TradeFilter
+from src.upstream_scheduler import Priority, QuotaExceededError
+
+LAWD_CD = "11680"
+
+
+def _mock_option(test: unittest.TestCase, **options) -> None:
+    """목 서버 설정을 테스트 동안만 바꿉니다."""
+    for name, value in options.items():
+        test.addCleanup(setattr, support.mock_server, name, getattr(support.mock_server, name))
+        setattr(support.mock_server, name, value)
+
+
+def _run(coro):
+    """코루틴을 새 이벤트 루프에서 실행하고, 그 루프에서 만든 업스트림 연결 풀을 닫습니다."""
+    async def main():
+        try:
+            return await coro
+        finally:
+            await aclose_async_client()
+    return asyncio.run(main())
+
+
+def _requests_during(func, *args, **kwargs):
+    """func를 실행하고 (결과, 그동안 목 서버가 받은 요청 수)를 반환합니다."""
+    before = support.mock_server.request_count
+    result = func(*args, **kwargs)
+    return result, support.mock_server.request_count - before
+
+
+class PaginationTest(unittest.TestCase):
+    """첫 페이지의 totalCount로 남은 페이지를 계산해 한 달치를 모두 가져오는지 확인합니다."""
+
+    def _check_month(self, df: pd.DataFrame, deal_ymd: str, count: int):
+        items = build_items(LAWD_CD, deal_ymd, count)
+        self.assertEqual(len(df), count)
+        self.assertEqual(sorted(zip(df["아파트"].astype(str), df["거래금액(만원)"])),
+                         sorted((i["aptNm"], int(i["dealAmount"].replace(",", ""))) for i in items))
+        self.assertTrue(df["거래일"].is_monotonic_increasing)
+
+    def test_every_page_fetched_once(self):
+        df, requests = _requests_during(rtms_client.fetch_rtms, LAWD_CD, "201601")
+        self._check_month(df, "201601", support.MOCK_TOTAL_COUNT)
+        self.assertEqual(requests, 3)
+
+    def test_partial_last_page(self):
+        df, requests = _requests_during(rtms_client.fetch_rtms, LAWD_CD, "201601", rows=120)
+        self._check_month(df, "201601", support.MOCK_TOTAL_COUNT)
+        self.assertEqual(requests, 3)  # 120 + 120 + 60
+
+    def test_single_page(self):
+        df, requests = _requests_during(rtms_client.fetch_rtms, LAWD_CD, "201601", rows=1000)
+        self._check_month(df, "201601", support.MOCK_TOTAL_COUNT)
+        self.assertEqual(requests, 1)
+
+    def test_empty_month(self):
+        _mock_option(self, total_count=0)
+        df, requests = _requests_during(rtms_client.fetch_rtms, LAWD_CD, "190001")
+        self.assertTrue(df.empty)
+        self.assertEqual(requests, 1)
+
+    def test_remaining_pages_fetched_in_parallel(self):
+        _mock_option(self, latency=0.3)
+        started = time.monotonic()
+        df, requests = _requests_during(rtms_client.fetch_rtms, LAWD_CD, "201601", rows=60)
+        elapsed = time.monotonic() - started
+        self._check_month(df, "201601", support.MOCK_TOTAL_COUNT)
+        self.assertEqual(requests, 5)
+        self.assertLess(elapsed, 1.2)  # 첫 페이지 + 나머지 4페이지 동시 요청 ≈ 0.6초 (순차라면 1.5초)
+
+
+class RangePlannerTest(unittest.TestCase):
+    """범위 조회가 캐시에 있는 달은 한 번에 읽고, 없는 달만 업스트림에 요청하는지 확인합니다."""
+
+    LAWD_CD = "11110"  # 다른 테스트가 캐시에 저장하지 않는 지역
+
+    def test_plan_splits_cached_and_missing_months(self):
+        rtms_client.fetch_rtms_range(self.LAWD_CD, "201901", "201901")
+        with mock.patch.object(TradeCache, "get", side_effect=AssertionError("달마다 따로 읽음")):
+            parts, gaps = rtms_client._plan_range(self.LAWD_CD, ["201812", "201901", "201902"], True)
+        self.assertEqual(list(parts), ["201901"])
+        self.assertEqual(len(parts["201901"]), support.MOCK_TOTAL_COUNT)
+        self.assertEqual(gaps, ["201812", "201902"])
+
+        parts, gaps = rtms_client._plan_range(self.LAWD_CD, ["201901"], False)
+        self.assertEqual((parts, gaps), ({}, ["201901"]))
+
+    def test_widened_range_fetches_only_new_months(self):
+        _, requests = _requests_during(rtms_client.fetch_rtms_range, self.LAWD_CD, "201904", "201905")
+        self.assertEqual(requests, 6)
+        df, requests = _requests_during(rtms_client.fetch_rtms_range, self.LAWD_CD, "201903", "201906")
+        self.assertEqual(requests, 6)  # 201903, 201906만 조회
+        uncached = rtms_client.fetch_rtms_range(self.LAWD_CD, "201903", "201906", use_cache=False)
+        pd.testing.assert_frame_equal(df.astype({"아파트": str, "도로명": str}),
+                                      uncached.astype({"아파트": str, "도로명": str}))
+
+        _, requests = _requests_during(rtms_client.fetch_rtms_range, self.LAWD_CD, "201903", "201906")
+        self.assertEqual(requests, 0)
+
+    def test_widened_range_async(self):
+        _run(rtms_client.fetch_rtms_range_async(self.LAWD_CD, "201907", "201907"))
+        df, requests = _requests_during(
+            lambda: _run(rtms_client.fetch_rtms_range_async(self.LAWD_CD, "201907", "201908")))
+        self.assertEqual(requests, 3)
+        self.assertEqual(len(df), 2 * support.MOCK_TOTAL_COUNT)
+
+    def test_empty_month_cached(self):
+        _mock_option(self, total_count=0)
+        rtms_client.fetch_rtms_range(self.LAWD_CD, "191001", "191001")
+        df, requests = _requests_during(rtms_client.fetch_rtms_range, self.LAWD_CD, "191001", "191001")
+        self.assertTrue(df.empty)
+        self.assertEqual(requests, 0)
+
+    def test_expired_recent_month_refetched(self):
+        month = time.strftime("%Y%m")
+        rtms_client.fetch_rtms_range(self.LAWD_CD, month, month)
+        with mock.patch.object(get_trade_cache(), "recent_ttl", 0), mock.patch("builtins.print"):
+            parts, gaps = rtms_client._plan_range(self.LAWD_CD, [month], True)
+        self.assertEqual((parts, gaps), ({}, [month]))
+
+
+class NameFilterTest(unittest.TestCase):
+    """아파트명 조건이 API로 조회한 달(메모리 필터)과 캐시에 있는 달(색인 + SQL 조건)에서 같은 결과를 내는지 확인합니다."""
+
+    LAWD_CD = "11170"  # 다른 테스트가 캐시에 저장하지 않는 지역
+    QUERIES = {"202001": "목업아파트12", "202002": "^목업아파트3", "202003": "아파트7", "202004": "없는아파트"}
+
+    def test_fetched_and_cached_months_agree(self):
+        for ym, query in self.QUERIES.items():
+            names = rtms_client.fetch_rtms(self.LAWD_CD, ym)["아파트"].astype(str)
+            expected = sorted(names[names.str.startswith(query[1:]) if query.startswith("^")
+                                    else names.str.contains(query)])
+            for source in ("api", "cache"):  # 첫 조회는 API, 두 번째는 캐시에서 읽음
+                with self.subTest(query=query, source=source):
+                    df, requests = _requests_during(rtms_client.fetch_rtms_range, self.LAWD_CD, ym, ym,
+                                                    where=TradeFilter(apt_name=query))
+                    self.assertEqual(requests, 3 if source == "api" else 0)
+                    self.assertEqual(sorted(df["아파트"].astype(str)) if not df.empty else [], expected)
+
+
+class RevalidationTest(unittest.TestCase):
+    """재검증(refresh_month)이 원본 응답 해시로 변경 여부를 판단하고, 바뀐 행만 캐시에 반영하는지 확인합니다."""
+
+    LAWD_CD = "11140"  # 다른 테스트가 캐시에 저장하지 않는 지역
+
+    def test_unchanged_month_only_touched(self):
+        rtms_client.load_month(self.LAWD_CD, "202001")
+        before = get_trade_cache().partition_info(self.LAWD_CD, "202001")
+        with mock.patch.object(TradeCache, "apply_diff", side_effect=AssertionError("파싱·비교함")):
+            result, requests = _requests_during(rtms_client.refresh_month, self.LAWD_CD, "202001")
+        self.assertEqual(result, rtms_client.Revalidation(False, 0, 0))
+        self.assertEqual(requests, 3)
+        after = get_trade_cache().partition_info(self.LAWD_CD, "202001")
+        self.assertEqual(after.content_hash, before.content_hash)
+        self.assertGreaterEqual(after.fetched_at, before.fetched_at)
+
+    def test_changed_month_diffed(self):
+        rtms_client.load_month(self.LAWD_CD, "202002")
+        items = support.mock_server.items_for(self.LAWD_CD, "202002")  # 목 서버가 이후 응답에 쓰는 목록
+        cancelled = items.pop(0)  # 계약 취소
+        items.append({**cancelled, "aptNm": "지연신고아파트"})  # 지연 신고
+
+        result = rtms_client.refresh_month(self.LAWD_CD, "202002")
+        self.assertEqual(result, rtms_client.Revalidation(True, 1, 1))
+        cached = get_trade_cache().get(self.LAWD_CD, "202002")
+        self.assertEqual(len(cached), support.MOCK_TOTAL_COUNT)
+        self.assertIn("지연신고아파트", set(cached["아파트"].astype(str)))
+        fetched = rtms_client.fetch_rtms(self.LAWD_CD, "202002")
+        self.assertEqual(get_trade_cache().partition_info(self.LAWD_CD, "202002").content_hash,
+                         fetched.attrs[rtms_client.CONTENT_HASH_ATTR])
+
+
+class _ScriptedRng:
+    """목 서버의 오류·지연 주입 여부를 정해진 순서로 결정합니다. 값이 떨어지면 주입하지 않습니다(0.99)."""
+
+    def __init__(self, values):
+        self.values = list(values)
+
+    def random(self) -> float:
+        return self.values.pop(0) if self.values else 0.99
+
+
+class RetryHedgeTest(unittest.TestCase):
+    """목 서버의 503 오류와 느린 응답으로 재시도, 헤지 요청, 실패한 달 보고를 확인합니다."""
+
+    def setUp(self):
+        # 다른 테스트의 결과와 섞이지 않도록 새 서킷 브레이커와 응답 시간 추적기를 씁니다.
+        patchers = [
+            mock.patch.object(rtms_client, "_breaker", CircuitBreaker("test", is_failure=is_retryable)),
+            mock.patch.object(rtms_client, "_page_latency", LatencyTracker()),
+            mock.patch("builtins.print"),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _inject(self, values, **options):
+        _mock_option(self, rng=_ScriptedRng(values), **options)
+
+    def test_transient_errors_retried(self):
+        self._inject([0.0, 0.0], error_rate=0.5)  # 처음 두 요청만 503
+        df, requests = _requests_during(rtms_client.fetch_rtms, LAWD_CD, "201801", rows=1000)
+        self.assertEqual(len(df), support.MOCK_TOTAL_COUNT)
+        self.assertEqual(requests, 3)
+
+    def test_persistent_errors_reported_as_failed_month(self):
+        _mock_option(self, error_rate=1.0)
+        df, requests = _requests_during(rtms_client.fetch_rtms_range, LAWD_CD, "201802", "201802", use_cache=False)
+        self.assertTrue(df.empty)
+        self.assertEqual(df.attrs[rtms_client.FAILED_MONTHS_ATTR], ["201802"])
+        self.assertEqual(requests, rtms_client.RTMS_RETRY_ATTEMPTS)
+
+    def test_partial_result(self):
+        fetch_month = rtms_client._fetch_month
+
+        def fail_one_month(lawd_cd, deal_ymd, *args, **kwargs):
+            if deal_ymd == "201804":
+                raise ConnectionError("업스트림 오류")
+            return fetch_month(lawd_cd, deal_ymd, *args, **kwargs)
+
+        with mock.patch.object(rtms_client, "_fetch_month", fail_one_month):
+            df = rtms_client.fetch_rtms_range(LAWD_CD, "201803", "201805", use_cache=False)
+        self.assertEqual(len(df), 2 * support.MOCK_TOTAL_COUNT)
+        self.assertEqual(df.attrs[rtms_client.FAILED_MONTHS_ATTR], ["201804"])
+        self.assertEqual(df.attrs[rtms_client.STALE_MONTHS_ATTR], [])
+
+    def _hedge_after(self, delay: float):
+        tracker = LatencyTracker(min_delay=delay, min_samples=1)
+        tracker.record(0.0)
+        patcher = mock.patch.object(rtms_client, "_page_latency", tracker)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _wait_for_requests(self, count: int):
+        """늦게 끝나는 요청이 다음 테스트의 요청 수에 섞이지 않도록, 목 서버가 count건을 처리할 때까지 기다립니다."""
+        deadline = time.monotonic() + 3
+        while support.mock_server.request_count < count and time.monotonic() < deadline:
+            time.sleep(0.05)
+        self.assertEqual(support.mock_server.request_count, count)
+
+    def test_slow_page_hedged(self):
+        self._hedge_after(0.1)
+        self._inject([0.0], slow_rate=0.5, slow_latency=1.0)  # 첫 요청만 1초 지연
+        before, started = support.mock_server.request_count, time.monotonic()
+        df = rtms_client.fetch_rtms(LAWD_CD, "201806", rows=1000)
+        self.assertLess(time.monotonic() - started, 0.8)
+        self.assertEqual(len(df), support.MOCK_TOTAL_COUNT)
+        self._wait_for_requests(before + 2)  # 헤지 요청 + 늦게 끝나는 원래 요청
+
+    def test_slow_page_hedged_async(self):
+        self._hedge_after(0.1)
+        self._inject([0.0], slow_rate=0.5, slow_latency=1.0)
+        before, started = support.mock_server.request_count, time.monotonic()
+        df = _run(rtms_client.fetch_rtms_range_async(LAWD_CD, "201807", "201807", use_cache=False))
+        self.assertLess(time.monotonic() - started, 0.8)
+        self.assertEqual(len(df), support.MOCK_TOTAL_COUNT)
+        self.assertEqual(df.attrs[rtms_client.FAILED_MONTHS_ATTR], [])
+        self._wait_for_requests(before + 4)  # 3페이지 + 1페이지 헤지 요청
+
+
+def _off_loop(calls: list, func):
+    """func를 감싸, 호출될 때 현재 스레드에서 이벤트 루프가 돌고 있었는지를 calls에 기록합니다."""
+    def wrapper(*args, **kwargs):
+        try:
+            asyncio.get_running_loop()
+            calls.append(False)
+        except RuntimeError:
+            calls.append(True)
+        return func(*args, **kwargs)
+    return wrapper
+
+
+class AsyncEngineOffLoopTest(unittest.IsolatedAsyncioTestCase):
+    """비동기 조회 경로의 CPU 작업(XML 파싱, 데이터프레임 생성·필터)이 이벤트 루프 밖에서 실행되는지 확인합니다."""
+
+    async def asyncTearDown(self):
+        await aclose_async_client()
+
+    async def test_parse_frame_and_filter_run_in_threads(self):
+        calls = {"read": [], "frame": [], "filter": []}
+        with mock.patch.object(rtms_client, "_read_page", _off_loop(calls["read"], rtms_client._read_page)), \
+                mock.patch.object(rtms_client, "_pages_to_frame",
+                                  _off_loop(calls["frame"], rtms_client._pages_to_frame)), \
+                mock.patch.object(rtms_client, "_filter_fetched",
+                                  _off_loop(calls["filter"], rtms_client._filter_fetched)):
+            df = await rtms_client.fetch_rtms_range_async(LAWD_CD, "201001", "201003", use_cache=False,
+                                                          where=TradeFilter(min_area=60))
+        self.assertFalse(df.empty)
+        self.assertEqual(len(calls["read"]), 9)  # 3개월 × 3페이지
+        self.assertEqual(len(calls["frame"]), 3)
+        self.assertEqual(len(calls["filter"]), 3)
+        for name, off_loop in calls.items():
+            self.assertTrue(all(off_loop), name)
+
+
+class MonthFlightTest(unittest.IsolatedAsyncioTestCase):
+    """같은 달을 동시에 조회하면 업스트림에는 한 번만 요청하는지 목 서버 요청 수로 확인합니다."""
+
+    def setUp(self):
+        _mock_option(self, latency=0.05)
+
+    async def asyncTearDown(self):
+        await aclose_async_client()
+
+    def test_threads(self):
+        with ThreadPoolExecutor(4) as pool:
+            frames, requests = _requests_during(
+                lambda: list(pool.map(lambda _: rtms_client.fetch_rtms(LAWD_CD, "201701"), range(4))))
+        self.assertEqual(requests, 3)  # 한 달 = 3페이지
+        self.assertTrue(all(df is frames[0] for df in frames))
+
+    async def test_tasks(self):
+        before = support.mock_server.request_count
+        frames = await asyncio.gather(*(
+            rtms_client.fetch_rtms_range_async(LAWD_CD, "201701", "201701", use_cache=False) for _ in range(4)))
+        self.assertEqual(support.mock_server.request_count - before, 3)
+        self.assertTrue(all(len(df) == support.MOCK_TOTAL_COUNT for df in frames))
+
+
+class MonthFlightPriorityTest(unittest.TestCase):
+    """같은 달의 동시 조회 병합(single-flight)이 우선순위별로 이루어지는지 확인합니다."""
+
+    def setUp(self):
+        self.calls = []
+        self.started = threading.Event()
+        patcher = mock.patch.object(rtms_client, "_fetch_month", self._slow_fetch)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _slow_fetch(self, lawd_cd, deal_ymd, rows=100, page=1, priority=Priority.INTERACTIVE):
+        self.calls.append(priority)
+        self.started.set()
+        time.sleep(0.2)
+        if priority == Priority.BACKGROUND:
+            raise QuotaExceededError("백그라운드 쿼터 몫 소진")
+        return pd.DataFrame({"아파트": ["테스트아파트"]})
+
+    def _in_thread(self, priority):
+        results = []
+        thread = threading.Thread(target=lambda: results.append(
+            rtms_client.fetch_rtms(LAWD_CD, "201501", priority=priority)))
+        thread.start()
+        self.started.wait(5)
+        return thread, results
+
+    def test_same_priority_calls_are_merged(self):
+        thread, results = self._in_thread(Priority.INTERACTIVE)
+        df = rtms_client.fetch_rtms(LAWD_CD, "201501", priority=Priority.INTERACTIVE)
+        thread.join()
+        self.assertEqual(self.calls, [Priority.INTERACTIVE])
+        self.assertEqual(len(df), 1)
+        self.assertIs(results[0], df)
+
+    def test_interactive_does_not_wait_on_background_leader(self):
+        thread, results = self._in_thread(Priority.BACKGROUND)
+        df = rtms_client.fetch_rtms(LAWD_CD, "201501", priority=Priority.INTERACTIVE)
+        thread.join()
+        self.assertEqual(sorted(self.calls), [Priority.INTERACTIVE, Priority.BACKGROUND])
+        self.assertEqual(len(df), 1)  # 백그라운드 리더의 쿼터 거절을 공유하지 않음
+        self.assertTrue(results[0].empty)
+
+
+if __name__ == "__main__":
+    unittest.main()
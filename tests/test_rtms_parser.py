@@ -0,0 +1,49 @@
+# test_rtms_parser.py - RTMS 응답 파서의 거래일 변환 테스트
+# 실행: python -m unittest discover -s tests (또는 pytest tests)
+import unittest
+
+import pandas as pd
+
+from src.rtms_parser import columns_to_frame, parse_page
+
+
+def _page(*dates) -> bytes:
+    items = "".join(
+        f"<item><aptNm>테스트아파트</aptNm><dealAmount>100,000</dealAmount><excluUseAr>84.9</excluUseAr>"
+        f"<floor>10</floor><buildYear>2010</buildYear><dealYear>{y}</dealYear><dealMonth>{m}</dealMonth>"
+        f"<dealDay>{d}</dealDay><roadNm>테스트로</roadNm></item>"
+        for y, m, d in dates
+    )
+    return ("<response><header><resultCode>000</resultCode><resultMsg>OK</resultMsg></header>"
+            f"<body><items>{items}</items><totalCount>{len(dates)}</totalCount></body></response>").encode("utf-8")
+
+
+def _deal_dates(*dates) -> list:
+    return columns_to_frame(parse_page(_page(*dates)).columns)["거래일"].tolist()
+
+
+class DealDateTest(unittest.TestCase):
+
+    def test_valid_dates(self):
+        self.assertEqual(_deal_dates((2023, 1, 31), (2024, 2, 29), (2023, 12, 1)),
+                         [pd.Timestamp("2023-01-31"), pd.Timestamp("2024-02-29"), pd.Timestamp("2023-12-01")])
+
+    def test_bad_day_is_nat(self):
+        # 2023-02-30은 2023-03-02로 넘어가지 않고 NaT, 윤년이 아닌 해의 2월 29일도 NaT
+        got = _deal_dates((2023, 2, 30), (2023, 2, 29), (2023, 4, 31), (2023, 5, 0), (2023, 3, 15))
+        self.assertTrue(all(pd.isna(v) for v in got[:4]))
+        self.assertEqual(got[4], pd.Timestamp("2023-03-15"))
+
+    def test_bad_month_is_nat(self):
+        got = _deal_dates((2023, 13, 1), (2023, 0, 10), (2023, 6, 10))
+        self.assertTrue(pd.isna(got[0]) and pd.isna(got[1]))
+        self.assertEqual(got[2], pd.Timestamp("2023-06-10"))
+
+    def test_missing_part_is_nat(self):
+        got = _deal_dates((2023, 6, ""), (2023, 6, 10))
+        self.assertTrue(pd.isna(got[0]))
+        self.assertEqual(got[1], pd.Timestamp("2023-06-10"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,120 @@
+# test_singleflight.py - 동일 요청 병합(single-flight) 테스트
+# 실행: python -m unittest discover -s tests (또는 pytest tests)
+import asyncio
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from src.singleflight import AsyncSingleFlight, SingleFlight
+
+
+class SingleFlightTest(unittest.TestCase):
+
+    def setUp(self):
+        self.flight = SingleFlight()
+        self.calls = 0
+        self.release = threading.Event()
+
+    def _work(self, value):
+        self.calls += 1
+        self.release.wait(5)
+        return {"value": value}
+
+    def _concurrent(self, keys):
+        """keys마다 do()를 동시에 호출하고, 모두 대기에 들어간 뒤 리더를 풀어 줍니다."""
+        with ThreadPoolExecutor(len(keys)) as pool:
+            futures = [pool.submit(self.flight.do, key, self._work, key) for key in keys]
+            time.sleep(0.1)
+            self.release.set()
+            return [f.result() for f in futures]
+
+    def test_concurrent_calls_merged(self):
+        results = self._concurrent(["a"] * 5)
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(sorted(shared for _, shared in results), [False, True, True, True, True])
+        self.assertTrue(all(result is results[0][0] for result, _ in results))
+
+    def test_different_keys_not_merged(self):
+        results = self._concurrent(["a", "b"])
+        self.assertEqual(self.calls, 2)
+        self.assertEqual([result["value"] for result, _ in results], ["a", "b"])
+
+    def test_sequential_calls_not_merged(self):
+        self.release.set()
+        self.flight.do("a", self._work, "a")
+        _, shared = self.flight.do("a", self._work, "a")
+        self.assertFalse(shared)
+        self.assertEqual(self.calls, 2)
+
+    def test_error_shared_and_key_released(self):
+        started = threading.Event()
+
+        def fail():
+            started.set()
+            self.release.wait(5)
+            raise ValueError("업스트림 오류")
+
+        with ThreadPoolExecutor(2) as pool:
+            leader = pool.submit(self.flight.do, "a", fail)
+            started.wait(5)
+            follower = pool.submit(self.flight.do, "a", fail)
+            time.sleep(0.1)
+            self.release.set()
+            for future in (leader, follower):
+                with self.assertRaises(ValueError):
+                    future.result()
+        self.assertEqual(self.flight.do("a", lambda: "ok"), ("ok", False))
+
+
+class AsyncSingleFlightTest(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.flight = AsyncSingleFlight()
+        self.calls = 0
+        self.release = asyncio.Event()
+
+    async def _work(self, value):
+        self.calls += 1
+        await self.release.wait()
+        return {"value": value}
+
+    async def test_concurrent_calls_merged(self):
+        tasks = [asyncio.ensure_future(self.flight.do("a", self._work, "a")) for _ in range(5)]
+        await asyncio.sleep(0)
+        self.release.set()
+        results = await asyncio.gather(*tasks)
+        self.assertEqual(self.calls, 1)
+        self.assertEqual([shared for _, shared in results], [False, True, True, True, True])
+        self.assertTrue(all(result is results[0][0] for result, _ in results))
+
+    async def test_cancelled_waiter_does_not_cancel_others(self):
+        leader = asyncio.ensure_future(self.flight.do("a", self._work, "a"))
+        follower = asyncio.ensure_future(self.flight.do("a", self._work, "a"))
+        await asyncio.sleep(0)
+        leader.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await leader
+        self.release.set()
+        self.assertEqual(await follower, ({"value": "a"}, True))
+        self.assertEqual(self.calls, 1)
+
+    async def test_error_shared_and_key_released(self):
+        async def fail():
+            await self.release.wait()
+            raise ValueError("업스트림 오류")
+
+        tasks = [asyncio.ensure_future(self.flight.do("a", fail)) for _ in range(2)]
+        await asyncio.sleep(0)
+        self.release.set()
+        for result in await asyncio.gather(*tasks, return_exceptions=True):
+            self.assertIsInstance(result, ValueError)
+
+        async def ok():
+            return "ok"
+
+        self.assertEqual(await self.flight.do("a", ok), ("ok", False))
+
+
+if __name__ == "__main__":
+    unittest.main()
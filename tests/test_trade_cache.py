@@ -0,0 +1,136 @@
+# test_trade_cache.py - 거래 캐시의 정렬 순서, 재검증 행 비교(apply_diff), 아파트명 색인 테스트
+# 실행: python -m unittest discover -s tests (또는 pytest tests)
+import os
+import tempfile
+import unittest
+
+import support  # noqa: F401  (src보다 먼저 환경 변수를 설정)
+
+import pandas as pd
+
+from src.rtms_client import _sort_by_date
+from src.trade_cache import TradeCache
+from src.trade_filter import TradeFilter
+from src.trade_schema import to_compact
+
+LAWD_CD = "11680"
+
+
+def _trades(names, day: str) -> pd.DataFrame:
+    return to_compact(pd.DataFrame({
+        "아파트": names,
+        "거래금액(만원)": [100000] * len(names),
+        "전용면적(m²)": [84.9] * len(names),
+        "층": [10] * len(names),
+        "건축년도": [2010] * len(names),
+        "거래일": pd.to_datetime([day] * len(names)),
+        "도로명": ["테스트로"] * len(names),
+    }))
+
+
+class DateOrderTest(unittest.TestCase):
+    """캐시에서 읽은 파티션이 조회 직후(_sort_by_date)와 같은 순서인지 확인합니다. 거래일이 없는 행은 맨 뒤."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.cache = TradeCache(os.path.join(self._tmp.name, "cache.sqlite3"))
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_missing_date_sorted_last(self):
+        df = _trades(["가", "나", "다", "라"], "2020-01-10")
+        df["거래일"] = pd.to_datetime(["2020-01-20", None, "2020-01-05", "2020-01-05"])
+        expected = _sort_by_date(df)["아파트"].astype(str).tolist()
+        self.assertEqual(expected, ["다", "라", "가", "나"])
+
+        self.cache.put(LAWD_CD, "202001", _sort_by_date(df))
+        self.cache.put(LAWD_CD, "202002", _trades(["마"], "2020-02-01"))
+        self.assertEqual(self.cache.get(LAWD_CD, "202001")["아파트"].astype(str).tolist(), expected)
+        got = self.cache.get_many(LAWD_CD, ["202001", "202002"])
+        self.assertEqual(got["202001"]["아파트"].astype(str).tolist(), expected)
+        self.assertEqual(got["202002"]["아파트"].astype(str).tolist(), ["마"])
+
+
+class ApplyDiffTest(unittest.TestCase):
+    """재검증한 달의 새 조회 결과와 캐시의 행을 다중집합으로 비교해, 바뀐 행만 반영하는지 확인합니다."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.cache = TradeCache(os.path.join(self._tmp.name, "cache.sqlite3"))
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _names(self):
+        return sorted(self.cache.get(LAWD_CD, "202001")["아파트"].astype(str))
+
+    def test_added_and_removed_rows(self):
+        self.cache.put(LAWD_CD, "202001", _trades(["가", "나", "나", "다"], "2020-01-10"), "old")
+        added_removed = self.cache.apply_diff(LAWD_CD, "202001", _trades(["나", "다", "라", "라"], "2020-01-10"), "new")
+        self.assertEqual(added_removed, (2, 2))  # 라 2건 추가, 가·나 1건씩 삭제
+        self.assertEqual(self._names(), ["나", "다", "라", "라"])
+        info = self.cache.partition_info(LAWD_CD, "202001")
+        self.assertEqual((info.row_count, info.content_hash), (4, "new"))
+
+    def test_changed_value_replaces_row(self):
+        self.cache.put(LAWD_CD, "202001", _trades(["가", "나"], "2020-01-10"))
+        df = _trades(["가", "나"], "2020-01-10")
+        df.loc[1, "거래금액(만원)"] = 90000  # 지연 신고로 금액이 정정된 거래
+        self.assertEqual(self.cache.apply_diff(LAWD_CD, "202001", df), (1, 1))
+        got = self.cache.get(LAWD_CD, "202001")
+        self.assertEqual(sorted(got["거래금액(만원)"].tolist()), [90000, 100000])
+
+    def test_unchanged_rows_with_missing_values(self):
+        df = _trades(["가", "나"], "2020-01-10")
+        df.loc[1, ["거래금액(만원)", "층"]] = pd.NA
+        df.loc[1, "거래일"] = pd.NaT
+        self.cache.put(LAWD_CD, "202001", df)
+        self.assertEqual(self.cache.apply_diff(LAWD_CD, "202001", df), (0, 0))
+        self.assertEqual(self._names(), ["가", "나"])
+
+    def test_all_rows_removed(self):
+        self.cache.put(LAWD_CD, "202001", _trades(["가", "나"], "2020-01-10"))
+        self.assertEqual(self.cache.apply_diff(LAWD_CD, "202001", pd.DataFrame()), (0, 2))
+        self.assertTrue(self.cache.get(LAWD_CD, "202001").empty)
+
+    def test_added_name_searchable(self):
+        self.cache.put(LAWD_CD, "202001", _trades(["가"], "2020-01-10"))
+        self.cache.name_index(LAWD_CD)
+        self.cache.apply_diff(LAWD_CD, "202001", _trades(["가", "신규아파트"], "2020-01-10"))
+        got = self.cache.get_many(LAWD_CD, ["202001"], TradeFilter(apt_name="신규"))
+        self.assertEqual(got["202001"]["아파트"].astype(str).tolist(), ["신규아파트"])
+
+
+class NameIndexAcrossInstancesTest(unittest.TestCase):
+    """같은 캐시 파일을 쓰는 두 인스턴스(= 두 프로세스)로, 한쪽이 저장한 아파트를 다른 쪽에서 검색합니다."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        path = os.path.join(self._tmp.name, "cache.sqlite3")
+        self.writer = TradeCache(path)
+        self.reader = TradeCache(path)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_new_partition_from_other_instance(self):
+        self.writer.put(LAWD_CD, "202001", _trades(["기존아파트"], "2020-01-10"))
+        before = self.reader.get_many(LAWD_CD, ["202001", "202002"], TradeFilter(apt_name="기존"))
+        self.assertEqual(len(before["202001"]), 1)  # 읽는 쪽 색인이 이 시점에 만들어짐
+
+        self.writer.put(LAWD_CD, "202002", _trades(["새아파트", "새아파트"], "2020-02-10"))
+        got = self.reader.get_many(LAWD_CD, ["202002"], TradeFilter(apt_name="새아파트"))
+        self.assertEqual(len(got["202002"]), 2)
+
+    def test_rewritten_partition_from_other_instance(self):
+        self.writer.put(LAWD_CD, "202001", _trades(["기존아파트"], "2020-01-10"))
+        self.reader.name_index(LAWD_CD)
+
+        self.writer.put(LAWD_CD, "202001", _trades(["기존아파트", "재조회아파트"], "2020-01-10"))
+        got = self.reader.get_many(LAWD_CD, ["202001"], TradeFilter(apt_name="재조회"))
+        self.assertEqual(got["202001"]["아파트"].astype(str).tolist(), ["재조회아파트"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,52 @@
+# test_trade_schema.py - 표준 스키마 변환과 그래프용 파생 컬럼 테스트
+# 실행: python -m unittest discover -s tests (또는 pytest tests)
+import json
+import unittest
+
+import pandas as pd
+
+import support  # noqa: F401  (src보다 먼저 환경 변수를 설정)
+
+from src.bulk_response import HAVE_PYARROW, frame_from_arrow, frame_to_arrow
+from src.json_response import frame_to_json
+from src.trade_schema import add_derived_columns, to_compact
+
+
+def _trades() -> pd.DataFrame:
+    """두 번째 행은 거래금액과 거래일이 결측인 거래입니다."""
+    return to_compact(pd.DataFrame({
+        "아파트": ["테스트아파트", "결측아파트"],
+        "거래금액(만원)": [123456, None],
+        "전용면적(m²)": [84.9, 59.9],
+        "층": [10, 3],
+        "건축년도": [2010, 2001],
+        "거래일": pd.to_datetime(["2020-01-10", None]),
+        "도로명": ["테스트로", "테스트로"],
+    }))
+
+
+class DerivedColumnsTest(unittest.TestCase):
+
+    def test_values(self):
+        row = add_derived_columns(_trades()).iloc[0]
+        self.assertEqual((row["deal_amount"], row["deal_year"], row["deal_month"]), ("123,456", "2020", "1"))
+
+    def test_missing_values_are_null(self):
+        df = add_derived_columns(_trades())
+        for col in ["deal_amount", "deal_year", "deal_month"]:
+            self.assertTrue(pd.isna(df[col].iloc[1]), col)
+        self.assertEqual(df["deal_amount"].iloc[0], "123,456")  # 결측 행이 있어도 "123,456.0"이 되지 않음
+
+        row = json.loads(frame_to_json(df))[1]
+        self.assertEqual([row["deal_amount"], row["deal_year"], row["deal_month"]], [None, None, None])
+        self.assertNotIn("<NA>", df.to_csv(index=False))
+
+    @unittest.skipUnless(HAVE_PYARROW, "pyarrow가 설치되지 않음")
+    def test_arrow_nulls(self):  # fields=deal_year 등으로 파생 필드를 요청한 경우
+        df = frame_from_arrow(frame_to_arrow(add_derived_columns(_trades())))
+        for col in ["deal_amount", "deal_year", "deal_month"]:
+            self.assertTrue(pd.isna(df[col].iloc[1]), col)
+
+
+if __name__ == "__main__":
+    unittest.main()
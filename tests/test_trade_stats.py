@@ -0,0 +1,99 @@
+# test_trade_stats.py - 그룹별 집계 통계 테스트 (pandas groupby 결과와 비교)
+# 실행: python -m unittest discover -s tests (또는 pytest tests)
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from src.trade_schema import to_compact
+from src.trade_stats import AREA_EDGES, AREA_LABELS, FLOOR_EDGES, FLOOR_LABELS, PYEONG_M2, trade_stats
+
+PERCENTILES = (10.0, 25.0, 75.0, 90.0)
+
+
+def _trades(rows: int = 2000, seed: int = 0) -> pd.DataFrame:
+    """결측값(거래금액, 면적, 층, 거래일)이 섞인 무작위 거래 데이터."""
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({
+        "아파트": rng.choice([f"아파트{i}" for i in range(30)], rows),
+        "거래금액(만원)": rng.integers(10000, 300000, rows),
+        "전용면적(m²)": rng.choice([59.9, 60.0, 84.9, 85.0, 101.9, 134.9, 135.0, 160.0], rows),
+        "층": rng.integers(-1, 45, rows),
+        "건축년도": 2000,
+        "거래일": pd.Timestamp("2022-11-01") + pd.to_timedelta(rng.integers(0, 120, rows), unit="D"),
+        "도로명": "테스트로",
+    })
+    df = to_compact(df)
+    for col, frac in (("거래금액(만원)", 0.02), ("전용면적(m²)", 0.02), ("층", 0.02), ("거래일", 0.02)):
+        df.loc[rng.random(rows) < frac, col] = pd.NaT if col == "거래일" else pd.NA
+    return df
+
+
+def _expected(df: pd.DataFrame, keys: pd.Series) -> pd.DataFrame:
+    """pandas groupby로 계산한 기대 통계표."""
+    price = df["거래금액(만원)"].astype("float64")
+    area = df["전용면적(m²)"].astype("float64")
+    frame = pd.DataFrame({"group": keys, "price": price, "price_per_m2": (price / area).where(area > 0)})
+    frame["price_per_pyeong"] = frame["price_per_m2"] * PYEONG_M2
+    grouped = frame.dropna(subset=["group"]).groupby("group", sort=True, observed=True)
+    out = pd.DataFrame({"count": grouped["price"].count()})
+    for name in ("price", "price_per_m2", "price_per_pyeong"):
+        out[f"{name}_mean"] = grouped[name].mean()
+        out[f"{name}_median"] = grouped[name].median()
+        for p in PERCENTILES:
+            out[f"{name}_p{p:g}"] = grouped[name].quantile(p / 100)
+    out = out[out["count"] > 0].round(1).reset_index()
+    out["group"] = out["group"].astype(str)
+    return out
+
+
+class TradeStatsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.df = _trades()
+
+    def _check(self, group_by: str, keys: pd.Series):
+        got = trade_stats(self.df, group_by, PERCENTILES)
+        expected = _expected(self.df, keys)
+        self.assertEqual(list(got.columns), list(expected.columns))
+        pd.testing.assert_frame_equal(got.astype({"group": str, "count": "int64"}),
+                                      expected.astype({"count": "int64"}), check_dtype=False)
+
+    def test_month(self):
+        keys = self.df["거래일"].dt.strftime("%Y%m")
+        self._check("month", keys)
+        self.assertEqual(trade_stats(self.df)["group"].tolist(), ["202211", "202212", "202301", "202302"])
+
+    def test_apartment(self):
+        self._check("apartment", self.df["아파트"].astype(object))
+
+    def test_area(self):
+        keys = pd.cut(self.df["전용면적(m²)"].astype("float64"), [-np.inf, *AREA_EDGES, np.inf],
+                      right=True, labels=AREA_LABELS)
+        self._check("area", keys)
+
+    def test_floor(self):
+        keys = pd.cut(self.df["층"].astype("float64"), [-np.inf, *FLOOR_EDGES, np.inf], right=True, labels=FLOOR_LABELS)
+        self._check("floor", keys)
+
+    def test_area_bin_edges_inclusive(self):
+        got = trade_stats(self.df[self.df["전용면적(m²)"].isin([60.0, 85.0])], "area")
+        self.assertEqual(got["group"].tolist(), ["~60", "60~85"])
+
+    def test_single_trade_and_empty_groups(self):
+        df = self.df.iloc[:1]
+        got = trade_stats(df, "apartment")
+        self.assertEqual(got["group"].tolist(), [df["아파트"].iloc[0]])  # 거래가 없는 카테고리는 제외
+        self.assertEqual(got.loc[0, "price_p10"], got.loc[0, "price_p90"])
+
+    def test_percentiles(self):
+        got = trade_stats(self.df, percentiles=[90, 50, 5])
+        self.assertEqual([c for c in got.columns if c[:7] == "price_p" and c[7].isdigit()], ["price_p5", "price_p90"])
+        with self.assertRaises(ValueError):
+            trade_stats(self.df, percentiles=[101])
+        with self.assertRaises(ValueError):
+            trade_stats(self.df, group_by="road")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,123 @@
+# test_upstream_scheduler.py - 여러 프로세스가 공유하는 일일 쿼터 상태 파일 테스트
+# 실행: python -m unittest discover -s tests (또는 pytest tests)
+import asyncio
+import json
+import os
+import tempfile
+import threading
+import unittest
+
+import support  # noqa: F401  (src보다 먼저 환경 변수를 설정)
+
+from src import upstream_scheduler
+from src.upstream_scheduler import DailyQuota, Priority, UpstreamScheduler
+
+
+class SharedDailyQuotaTest(unittest.TestCase):
+    """같은 상태 파일을 쓰는 두 카운터(= 두 프로세스)의 사용량이 합산되는지 확인합니다."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self._tmp.name, "quota.json")
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _stored(self, key_id: str = "key") -> dict:
+        with open(self.path, encoding="utf-8") as f:
+            return json.load(f)[key_id]
+
+    def test_flushes_add_instead_of_overwrite(self):
+        a = DailyQuota(self.path, 100, "key")
+        b = DailyQuota(self.path, 100, "key")
+        for _ in range(3):
+            a.consume()
+        for _ in range(5):
+            b.consume()
+        a.flush(force=True)
+        b.flush(force=True)
+        a.flush(force=True)  # 기록할 호출이 없어도 다른 프로세스의 사용량을 읽어 옴
+        self.assertEqual(self._stored()["used"], 8)
+        self.assertEqual((a.used, b.used), (8, 8))
+        self.assertEqual(DailyQuota(self.path, 100, "key").used, 8)
+
+    def test_roll_over_keeps_other_processes_usage_of_new_day(self):
+        a = DailyQuota(self.path, 100, "key")
+        b = DailyQuota(self.path, 100, "key")
+        a.consume()
+        a.flush(force=True)
+        b.day = "2000-01-01"  # b는 어제 시작한 프로세스
+        b.roll_over()
+        b.consume()
+        b.flush(force=True)
+        self.assertEqual(self._stored()["used"], 2)
+        self.assertEqual(self._stored()["date"], a.day)
+
+    def test_separate_keys(self):
+        a = DailyQuota(self.path, 100, "key")
+        other = DailyQuota(self.path, 100, "other")
+        a.consume()
+        other.consume()
+        other.consume()
+        a.flush(force=True)
+        other.flush(force=True)
+        self.assertEqual(self._stored("key")["used"], 1)
+        self.assertEqual(self._stored("other")["used"], 2)
+
+
+
+class AcquireAsyncTest(unittest.IsolatedAsyncioTestCase):
+    """비동기 토큰 획득이 쿼터 파일 기록(파일 잠금 대기 포함)으로 이벤트 루프를 막지 않는지 확인합니다."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self._tmp.name, "quota.json")
+        self.scheduler = UpstreamScheduler(1000, 1000, DailyQuota(self.path, 100, "key"))
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    async def test_flush_runs_outside_event_loop(self):
+        threads = []
+        flush = self.scheduler.quota.flush
+
+        def recording_flush(*args, **kwargs):
+            threads.append(threading.current_thread())
+            return flush(*args, **kwargs)
+
+        self.scheduler.quota.flush = recording_flush
+        await self.scheduler.acquire_async(Priority.INTERACTIVE)
+        self.assertEqual(len(threads), 1)
+        self.assertIsNot(threads[0], threading.current_thread())
+        with open(self.path, encoding="utf-8") as f:
+            self.assertEqual(json.load(f)["key"]["used"], 1)
+
+    @unittest.skipIf(upstream_scheduler.fcntl is None, "fcntl 없음")
+    async def test_loop_keeps_running_while_another_process_holds_the_lock(self):
+        fcntl = upstream_scheduler.fcntl
+        lock = open(self.path.replace(".json", ".lock"), "a")
+        self.addCleanup(lock.close)
+        fcntl.flock(lock, fcntl.LOCK_EX)  # 다른 프로세스(백필 등)가 기록 중
+        threading.Timer(0.5, fcntl.flock, (lock, fcntl.LOCK_UN)).start()
+
+        task = asyncio.ensure_future(self.scheduler.acquire_async(Priority.INTERACTIVE))
+        loop = asyncio.get_running_loop()
+        last, max_gap = loop.time(), 0.0
+        for _ in range(20):
+            await asyncio.sleep(0.01)
+            max_gap, last = max(max_gap, loop.time() - last), loop.time()
+        self.assertLess(max_gap, 0.2)  # 잠금을 기다리는 동안에도 이벤트 루프가 계속 돎
+        self.assertFalse(task.done())
+        await asyncio.wait_for(task, 5)
+        self.assertEqual(self.scheduler.quota.used, 1)
+
+    def test_sync_acquire_records_usage(self):
+        for _ in range(3):
+            self.scheduler.acquire(Priority.BACKGROUND)
+        self.scheduler.flush()
+        with open(self.path, encoding="utf-8") as f:
+            self.assertEqual(json.load(f)["key"]["used"], 3)
+
+
+if __name__ == "__main__":
+    unittest.main()